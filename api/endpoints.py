@@ -1,15 +1,55 @@
-from fastapi import APIRouter, Response, BackgroundTasks, HTTPException
-from pydantic import BaseModel, Field
-from typing import Optional
+from fastapi import APIRouter, Response, BackgroundTasks, HTTPException, Header, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, model_validator
+from typing import Literal, Optional
 
+import asyncio
+import json
 import logging
+import os
 
 import bw2data as bd
+import pandas as pd
 from brightwebapp.brightway import load_and_set_useeio_project, load_and_set_ecoinvent_project
-from brightwebapp.traversal import perform_graph_traversal
+from brightwebapp.traversal import perform_graph_traversal, format_traversal_result, TraversalCache, TraversalResult, LCAPool, _arrow_table_to_ipc_stream
+from brightwebapp.batch import TraversalWorkerPool
+from brightwebapp.jobs import TraversalJobQueue
+from brightwebapp.streaming import iter_graph_traversal_events
+from brightwebapp.timing import StageTimer
+from brightwebapp.modifications import compute_sensitivities
+from brightwebapp.sessions import EditSessionStore
 
 router = APIRouter()
 
+# results of repeated traversal requests are served from this cache.
+# set the environment variable BRIGHTWEBAPP_TRAVERSAL_CACHE_DIR to persist results across restarts.
+traversal_cache = TraversalCache(
+    maxsize=int(os.environ.get("BRIGHTWEBAPP_TRAVERSAL_CACHE_MAXSIZE", 128)),
+    cache_dir=os.environ.get("BRIGHTWEBAPP_TRAVERSAL_CACHE_DIR"),
+)
+# factorized LCA objects are reused across requests (one per project and set of databases).
+# technosphere matrices with up to BRIGHTWEBAPP_DENSE_MAX_PRODUCTS products (e.g. USEEIO) are inverted instead.
+lca_pool = LCAPool(
+    maxsize=int(os.environ.get("BRIGHTWEBAPP_LCA_POOL_MAXSIZE", 4)),
+    dense_max_products=int(os.environ.get("BRIGHTWEBAPP_DENSE_MAX_PRODUCTS", 2000)),
+)
+# batch traversals are run in worker processes, which are started with the first batch request.
+traversal_worker_pool = TraversalWorkerPool(
+    max_workers=int(os.environ["BRIGHTWEBAPP_BATCH_MAX_WORKERS"]) if "BRIGHTWEBAPP_BATCH_MAX_WORKERS" in os.environ else None,
+)
+# asynchronous traversal jobs are run in worker threads; finished jobs are kept for BRIGHTWEBAPP_JOBS_TTL seconds.
+traversal_job_queue = TraversalJobQueue(
+    max_workers=int(os.environ.get("BRIGHTWEBAPP_JOBS_MAX_WORKERS", 1)),
+    ttl=float(os.environ.get("BRIGHTWEBAPP_JOBS_TTL", 3600)),
+)
+# edit sessions expire BRIGHTWEBAPP_SESSIONS_TTL seconds after their last request.
+edit_session_store = EditSessionStore(
+    maxsize=int(os.environ.get("BRIGHTWEBAPP_SESSIONS_MAXSIZE", 100)),
+    maxbytes=int(os.environ["BRIGHTWEBAPP_SESSIONS_MAXBYTES"]) if "BRIGHTWEBAPP_SESSIONS_MAXBYTES" in os.environ else None,
+    ttl=float(os.environ.get("BRIGHTWEBAPP_SESSIONS_TTL", 3600)),
+    max_revisions=int(os.environ.get("BRIGHTWEBAPP_SESSIONS_MAX_REVISIONS", 100)),
+)
+
 class SetupResponse(BaseModel):
     """Response model for the setup endpoint."""
     status: str
@@ -184,14 +224,20 @@ class GraphTraversalRequest(BaseModel):
     ----------
     demand: list[DemandItem]
         A list of demand items, each specifying a unique code and the amount to be assessed.
-    method: tuple
+    method: Optional[tuple]
         A tuple specifying the impact assessment method, e.g., ('IMPACT World+ Midpoint', 'Climate change', 'GWP100').
+    methods: Optional[list[tuple]]
+        A list of impact assessment methods. The supply chain is traversed once
+        and characterized with every method. Exactly one of `method` and `methods` must be provided.
     cutoff: float
         The cutoff threshold for the graph traversal, default is 0.001.
     biosphere_cutoff: float
         The biosphere cutoff threshold for the graph traversal, default is 0.001.
     max_calc: int
         The maximum number of calculations to perform during the traversal, default is 100.
+    time_budget_ms: Optional[float]
+        The wall-clock time budget of the traversal in milliseconds. If the budget is
+        exceeded, the traversal stops early and the result is truncated. Default is no budget.
     
     Example
     -------
@@ -208,15 +254,24 @@ class GraphTraversalRequest(BaseModel):
         "method": ["IMPACT World+ Midpoint", "Climate change", "GWP100"],
         "cutoff": 0.001,
         "biosphere_cutoff": 0.001,
-        "max_calc": 100
+        "max_calc": 100,
+        "time_budget_ms": 500
     }
     ```
     """
     demand: list[DemandItem]
-    method: tuple # Example: ('IMPACT World+ Midpoint', 'Climate change', 'GWP100')
+    method: Optional[tuple] = None # Example: ('IMPACT World+ Midpoint', 'Climate change', 'GWP100')
+    methods: Optional[list[tuple]] = None
     cutoff: float = 0.001
     biosphere_cutoff: float = 0.001
     max_calc: int = 100
+    time_budget_ms: Optional[float] = Field(None, gt=0)
+
+    @model_validator(mode='after')
+    def check_method_or_methods(self):
+        if (self.method is None) == (self.methods is None):
+            raise ValueError("Exactly one of 'method' and 'methods' must be provided.")
+        return self
 
 
 @router.get(
@@ -324,12 +379,90 @@ async def get_node(
             detail=f"Node not found for criteria: {search_filters}",
         )
 
+# media types of the graph traversal result, with the corresponding `return_format` and file extension.
+TRAVERSAL_MEDIA_TYPES = {
+    "text/csv": ("csv_stream", "csv"),
+    "application/vnd.apache.arrow.stream": ("arrow", "arrow"),
+    "application/vnd.apache.parquet": ("parquet", "parquet"),
+}
+
+
+def negotiate_traversal_media_type(accept: Optional[str]) -> Optional[str]:
+    """
+    Returns the media type of the graph traversal result which best matches an `Accept` header.
+
+    Media types are ranked by their quality value (`q`). Wildcards (`*/*`, `text/*`)
+    and a missing `Accept` header select CSV. Among equally ranked media types,
+    the first one listed in `TRAVERSAL_MEDIA_TYPES` is preferred.
+
+    Parameters
+    ----------
+    accept: str, optional
+        The value of the `Accept` header, e.g. `application/vnd.apache.parquet, text/csv;q=0.5`.
+
+    Returns
+    -------
+    str or None
+        A key of `TRAVERSAL_MEDIA_TYPES`, or `None` if no supported media type is acceptable.
+    """
+    if not accept:
+        return "text/csv"
+    best_media_type, best_quality = None, 0.0
+    for media_range in accept.split(","):
+        media_type, *parameters = [part.strip() for part in media_range.split(";")]
+        quality = 1.0
+        for parameter in parameters:
+            name, _, value = parameter.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type in ("*/*", "text/*"):
+            media_type = "text/csv"
+        if media_type in TRAVERSAL_MEDIA_TYPES and quality > best_quality:
+            best_media_type, best_quality = media_type, quality
+    return best_media_type
+
+
+def traversal_truncation_headers(result: TraversalResult | dict) -> dict:
+    """
+    Returns the response headers which report whether a graph traversal result is truncated.
+
+    - `X-Traversal-Truncated`: `true` or `false`
+    - `X-Traversal-Truncation-Reason`: `time_budget` or `max_calc` (only if truncated)
+    - `X-Traversal-Coverage`: share of the total score covered by the nodes of the result
+
+    Parameters
+    ----------
+    result: TraversalResult or dict
+        A graph traversal result, or a dictionary of results (one per method),
+        in which case the first method is reported.
+
+    Returns
+    -------
+    dict
+        The response headers.
+    """
+    if isinstance(result, dict):
+        result = next(iter(result.values()))
+    headers = {"X-Traversal-Truncated": "true" if result.truncated else "false"}
+    if result.truncated:
+        headers["X-Traversal-Truncation-Reason"] = result.truncated
+    headers["X-Traversal-Coverage"] = f"{result.coverage:.6g}"
+    return headers
+
+
 @router.post(
     "/traversal/perform",
-    response_class=Response,
+    response_class=StreamingResponse,
     responses={
         200: {
-            "description": "On success, a streaming response containing the graph traversal data as a CSV file.",
+            "description": (
+                "On success, a streaming response containing the graph traversal data as a CSV file. "
+                "The headers `X-Traversal-Truncated`, `X-Traversal-Truncation-Reason` and `X-Traversal-Coverage` "
+                "report whether the traversal was stopped early and the share of the total score it covers."
+            ),
             "content": {
                 "text/csv": {
                     "schema": {
@@ -337,7 +470,19 @@ async def get_node(
                         "format": "binary",
                     },
                     "example": "UID,Scope,Name,SupplyAmount,...\n0,1,Activity A,1.0,...\n1,3,Activity B,0.5,..."
-                }
+                },
+                "application/vnd.apache.arrow.stream": {
+                    "schema": {
+                        "type": "string",
+                        "format": "binary",
+                    },
+                },
+                "application/vnd.apache.parquet": {
+                    "schema": {
+                        "type": "string",
+                        "format": "binary",
+                    },
+                },
             }
         },
         400: {
@@ -350,6 +495,16 @@ async def get_node(
                 }
             }
         },
+        406: {
+            "description": "Raised if the `Accept` header does not allow any of the supported media types, or if Arrow output is not available on the server.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Not acceptable. Supported media types: text/csv, application/vnd.apache.arrow.stream, application/vnd.apache.parquet"
+                    }
+                }
+            }
+        },
         500: {
             "description": "Raised for other unexpected exceptions, such as a missing demand code.",
              "content": {
@@ -362,43 +517,1081 @@ async def get_node(
         }
     }
 )
-async def run_graph_traversal(request: GraphTraversalRequest):
+def run_graph_traversal(
+    request: GraphTraversalRequest,
+    accept: Optional[str] = Header(None),
+):
     """
     Performs a graph traversal and returns the result as a CSV file.
 
     This endpoint serves as the primary calculation interface. It accepts a
     detailed JSON object specifying the demand, method, and calculation
     parameters. Upon success, it directly returns a CSV file for download.
+    The CSV file is streamed in blocks of rows as it is written.
+
+    If a list of `methods` is provided instead of a single `method`, the
+    supply chain is traversed once and the CSV file contains one
+    `BurdenIntensity`, `Burden(Cumulative)` and `Burden(Direct)` column per
+    method. These requests are not cached.
+
+    The format of the result is negotiated through the `Accept` header:
+
+    | `Accept` | Format |
+    |----------|--------|
+    | `text/csv` (default) | CSV |
+    | `application/vnd.apache.arrow.stream` | Arrow IPC stream |
+    | `application/vnd.apache.parquet` | Parquet |
+
+    In the Arrow and Parquet formats, `Branch` is a native `list<int32>` column.
+
+    The `Server-Timing` response header reports the wall time of every stage
+    of the calculation (e.g. `lci`, `lcia`, `traversal`, `names`, `branches`,
+    `serialization`), see `brightwebapp.timing.StageTimer`.
+
+    With `time_budget_ms`, the traversal stops when the budget is exceeded
+    and the partial result is returned. The response headers report whether
+    the result is truncated (`X-Traversal-Truncated`, and
+    `X-Traversal-Truncation-Reason`: `time_budget` or `max_calc`) and the
+    share of the total score covered by the nodes of the result
+    (`X-Traversal-Coverage`). Results truncated by `time_budget_ms` are not
+    cached, but a repeated request continues the truncated traversal.
+
+    Results are cached (see `GET /traversal/cache`): repeated requests with the
+    same demand, method and traversal parameters are served without
+    recomputing the LCA and the graph traversal, as long as the
+    databases of the project are not modified. On a cache miss, the LCA
+    reuses the factorized technosphere matrix of previous requests.
+    A request with a lower `cutoff` (or a higher `max_calc`) than a previous
+    request for the same demand and method continues the previous graph
+    traversal instead of starting over.
 
     See Also
     --------
     [`brightwebapp.traversal.perform_graph_traversal`](https://brightwebapp.readthedocs.io/en/latest/api/traversal/#brightwebapp.traversal.perform_graph_traversal)
     """
+    media_type = negotiate_traversal_media_type(accept)
+    if media_type is None:
+        raise HTTPException(
+            status_code=406,
+            detail=f"Not acceptable. Supported media types: {', '.join(TRAVERSAL_MEDIA_TYPES)}",
+        )
+    return_format, extension = TRAVERSAL_MEDIA_TYPES[media_type]
+    headers = {
+        "Content-Disposition": f"attachment; filename=graph_traversal.{extension}",
+        "Vary": "Accept",
+    }
+
+    timer = StageTimer(
+        callback=lambda span: logging.debug(f"traversal stage {span.name}: {span.duration_ms:.1f} ms {span.counts}")
+    )
     try:
         demand_dict = {
             bd.get_node(code=item.code): item.amount for item in request.demand
         }
 
-        csv_data = perform_graph_traversal(
+        traversal_result = perform_graph_traversal(
             cutoff=request.cutoff,
             biosphere_cutoff=request.biosphere_cutoff,
             max_calc=request.max_calc,
-            return_format='csv',
+            return_format='traversal_result',
+            demand=demand_dict,
+            method=request.method if request.methods is None else request.methods,
+            cache=traversal_cache,
+            lca_pool=lca_pool,
+            time_budget_ms=request.time_budget_ms,
+            timer=timer,
+        )
+        headers.update(traversal_truncation_headers(traversal_result))
+        result = format_traversal_result(traversal_result, return_format, timer=timer)
+        headers["Server-Timing"] = timer.server_timing()
+
+        if return_format == 'csv_stream':
+            return StreamingResponse(content=result, media_type=media_type, headers=headers)
+        if return_format == 'arrow':
+            result = _arrow_table_to_ipc_stream(result)
+        return Response(content=result, media_type=media_type, headers=headers)
+
+    except ImportError as e:
+        raise HTTPException(status_code=406, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        # Add this to see the exact error before it's hidden by HTTPException
+        print(f"ERROR: An exception occurred: {e}")
+        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
+
+
+@router.post(
+    "/traversal/sensitivity",
+    responses={
+        200: {
+            "description": (
+                "The total score and the nodes of the graph traversal with the derivatives and elasticities "
+                "of the total score, ranked by decreasing absolute `Elasticity(SupplyAmount)`."
+            ),
+            "content": {
+                "application/json": {
+                    "example": {
+                        "total_score": 1374.66,
+                        "nodes": [
+                            {
+                                "UID": 1,
+                                "Scope": 3,
+                                "Name": "Activity B",
+                                "SupplyAmount": 15.5,
+                                "BurdenIntensity": 26.6,
+                                "Burden(Cumulative)": 1374.66,
+                                "Burden(Direct)": 412.3,
+                                "Depth": 2,
+                                "Sensitivity(SupplyAmount)": 88.69,
+                                "Sensitivity(BurdenIntensity)": 15.5,
+                                "Elasticity(SupplyAmount)": 1.0,
+                                "Elasticity(BurdenIntensity)": 0.3
+                            }
+                        ]
+                    }
+                }
+            }
+        },
+        400: {
+            "description": "Raised if a list of `methods` is provided, or if no graph edges are found.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Sensitivities are computed for a single method. Provide 'method' instead of 'methods'."
+                    }
+                }
+            }
+        },
+        500: {
+            "description": "Raised for other unexpected exceptions, such as a missing demand code.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "An unexpected error occurred: Node not found for code 'some_invalid_code'"
+                    }
+                }
+            }
+        }
+    }
+)
+def run_graph_traversal_sensitivity(
+    request: GraphTraversalRequest,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of nodes returned, after ranking."),
+):
+    """
+    Performs a graph traversal and returns the sensitivity of the total score
+    to the supply amount and the burden intensity of every node.
+
+    For every node, `Sensitivity(SupplyAmount)` and `Sensitivity(BurdenIntensity)`
+    are the derivatives of the total score with respect to the supply amount and the
+    burden intensity of the node, as they would be edited in the table of the web application
+    (changing the supply amount of a node scales all nodes downstream of it).
+    The elasticities are the relative changes of the total score per relative change
+    of the supply amount or burden intensity. Nodes are ranked by decreasing absolute
+    `Elasticity(SupplyAmount)`, so that the nodes worth editing come first.
+    All derivatives are computed in one pass over the nodes of the graph traversal.
+
+    The graph traversal is served from the traversal result cache, as with `POST /traversal/perform`.
+
+    See Also
+    --------
+    [`brightwebapp.modifications.compute_sensitivities`](https://brightwebapp.readthedocs.io/en/latest/api/modifications/#brightwebapp.modifications.compute_sensitivities)
+    """
+    if request.methods is not None:
+        raise HTTPException(
+            status_code=400,
+            detail="Sensitivities are computed for a single method. Provide 'method' instead of 'methods'.",
+        )
+    try:
+        demand_dict = {
+            bd.get_node(code=item.code): item.amount for item in request.demand
+        }
+        traversal_result = perform_graph_traversal(
+            cutoff=request.cutoff,
+            biosphere_cutoff=request.biosphere_cutoff,
+            max_calc=request.max_calc,
+            return_format='traversal_result',
             demand=demand_dict,
             method=request.method,
+            cache=traversal_cache,
+            lca_pool=lca_pool,
+            time_budget_ms=request.time_budget_ms,
+        )
+        df = compute_sensitivities(
+            df=format_traversal_result(traversal_result, 'dataframe'),
+            score=traversal_result.total_score,
         )
+        if limit is not None:
+            df = df.head(limit)
+        return {
+            "total_score": traversal_result.total_score,
+            "nodes": json.loads(df.drop(columns=['Branch']).to_json(orient='records')),
+        }
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logging.exception("Unexpected error while computing sensitivities")
+        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
+
+
+class GraphTraversalBatchRequest(BaseModel):
+    """
+    Represents a request for performing many graph traversals.
+
+    Attributes
+    ----------
+    items: list[GraphTraversalRequest]
+        A list of graph traversal requests, see `GraphTraversalRequest`.
+
+    Example
+    -------
+    ```json
+    {
+        "items": [
+            {
+                "demand": [{"code": "some_valid_code_in_your_db", "amount": 1.0}],
+                "method": ["IMPACT World+ Midpoint", "Climate change", "GWP100"]
+            },
+            {
+                "demand": [{"code": "another_valid_code_in_your_db", "amount": 1.0}],
+                "method": ["IMPACT World+ Midpoint", "Climate change", "GWP100"],
+                "cutoff": 0.01
+            }
+        ]
+    }
+    ```
+    """
+    items: list[GraphTraversalRequest] = Field(..., min_length=1)
+
+
+@router.post(
+    "/traversal/batch",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": (
+                "On success, a streaming response with one JSON object per line (NDJSON) for every item of the batch, "
+                "in order of completion. `index` is the position of the item in the request."
+            ),
+            "content": {
+                "application/x-ndjson": {
+                    "example": (
+                        '{"index": 1, "status": "ok", "truncated": "", "coverage": 0.98, "csv": "UID,Scope,Name,SupplyAmount,...\\n0,1,Activity A,1.0,..."}\n'
+                        '{"index": 0, "status": "error", "detail": "UnknownObject: Node not found"}\n'
+                    )
+                }
+            }
+        },
+    }
+)
+async def run_graph_traversal_batch(request: GraphTraversalBatchRequest):
+    """
+    Performs many graph traversals in parallel and streams the results as they complete.
+
+    The items of the batch are distributed to a pool of worker processes
+    (see `BRIGHTWEBAPP_BATCH_MAX_WORKERS`). Every worker keeps the current
+    project and its factorized LCA objects between items and requests.
+    The event loop is not blocked while the items are computed.
+
+    Results are returned as newline-delimited JSON. An item that fails
+    (for instance because of an unknown demand code) is returned with
+    `"status": "error"` and does not abort the other items.
+
+    See Also
+    --------
+    [`brightwebapp.batch.TraversalWorkerPool`](https://brightwebapp.readthedocs.io/en/latest/api/batch/#brightwebapp.batch.TraversalWorkerPool)
+    """
+    futures = [
+        asyncio.wrap_future(
+            traversal_worker_pool.submit(
+                index,
+                {
+                    'demand': {demand_item.code: demand_item.amount for demand_item in item.demand},
+                    'method': item.method if item.methods is None else item.methods,
+                    'cutoff': item.cutoff,
+                    'biosphere_cutoff': item.biosphere_cutoff,
+                    'max_calc': item.max_calc,
+                    'time_budget_ms': item.time_budget_ms,
+                },
+            )
+        )
+        for index, item in enumerate(request.items)
+    ]
+
+    async def result(index: int, future: asyncio.Future) -> dict:
+        try:
+            return await future
+        except Exception as e:
+            # e.g. a worker process terminated abruptly
+            return {'index': index, 'status': 'error', 'detail': f"{type(e).__name__}: {e}"}
+
+    async def results():
+        for next_result in asyncio.as_completed([result(index, future) for index, future in enumerate(futures)]):
+            yield json.dumps(await next_result) + "\n"
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/traversal/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": (
+                "A stream of server-sent events: `progress` events, `nodes` events with the newly found nodes, "
+                "and a final `summary` (or `error`) event."
+            ),
+            "content": {
+                "text/event-stream": {
+                    "example": (
+                        'event: progress\n'
+                        'data: {"calculations": 1, "max_calc": 100, "nodes": 2, "coverage": 0.3, "elapsed_ms": 1.6}\n\n'
+                        'event: nodes\n'
+                        'data: {"nodes": [{"uid": 1, "parent_uid": 0, "depth": 2, "supply_amount": 15.5, '
+                        '"burden_direct": 412.3, "burden_cumulative": 1374.66, "name": "steel production"}]}\n\n'
+                        'event: summary\n'
+                        'data: {"nodes": 7, "edges": 6, "calculations": 6, "coverage": 0.99, '
+                        '"total_score": 1374.66, "elapsed_ms": 3.6, "truncated": ""}\n\n'
+                    )
+                }
+            }
+        },
+        400: {
+            "description": "Raised if the demand code does not match any node.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Node not found for code 'some_invalid_code'."}
+                }
+            }
+        },
+    }
+)
+def stream_graph_traversal(
+    code: str = Query(..., description="Code of the demanded activity."),
+    amount: float = Query(1.0, description="Demanded amount."),
+    method: list[str] = Query(..., description="Impact assessment method, one query parameter per element of the method tuple."),
+    cutoff: float = 0.001,
+    biosphere_cutoff: float = 0.001,
+    max_calc: int = 100,
+    time_budget_ms: Optional[float] = Query(None, gt=0),
+    interval_ms: float = Query(250, ge=0, description="Minimum time between two progress events in milliseconds."),
+):
+    """
+    Performs a graph traversal and streams its progress as server-sent events.
+
+    While the traversal runs, `progress` events report the number of
+    calculations and nodes, the share of the total score covered by the nodes
+    found so far (`coverage`) and the elapsed time. `nodes` events contain the
+    newly found nodes (with the `uid` of their parent), so that the supply
+    chain can be rendered incrementally. The last event is a `summary` event
+    (or an `error` event). Closing the connection cancels the traversal.
+
+    For example:
+
+    `/traversal/stream?code=bike&method=IPCC&cutoff=0.0001`
+
+    See Also
+    --------
+    [`brightwebapp.streaming.iter_graph_traversal_events`](https://brightwebapp.readthedocs.io/en/latest/api/streaming/#brightwebapp.streaming.iter_graph_traversal_events)
+    """
+    try:
+        demand_dict = {bd.get_node(code=code): amount}
+    except bd.errors.UnknownObject:
+        raise HTTPException(status_code=400, detail=f"Node not found for code '{code}'.")
+
+    def server_sent_events():
+        for event in iter_graph_traversal_events(
+            demand=demand_dict,
+            method=tuple(method),
+            cutoff=cutoff,
+            biosphere_cutoff=biosphere_cutoff,
+            max_calc=max_calc,
+            time_budget_ms=time_budget_ms,
+            lca_pool=lca_pool,
+            interval_ms=interval_ms,
+        ):
+            event_type = event.pop("event")
+            yield f"event: {event_type}\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        server_sent_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+class TraversalJobResponse(BaseModel):
+    """
+    Response model for the traversal job endpoints.
+
+    Attributes
+    ----------
+    id: str
+        The unique identifier of the job.
+    status: str
+        `queued`, `running`, `done` or `failed`.
+    created_at: float
+        Time at which the job was submitted (seconds since the epoch).
+    started_at: Optional[float]
+        Time at which the graph traversal started.
+    finished_at: Optional[float]
+        Time at which the job finished.
+    progress: dict
+        Latest progress of the graph traversal: `calculations`, `max_calc`, `nodes`, `coverage` and `elapsed_ms`.
+    error: Optional[str]
+        The error message if the job failed.
+    result_url: Optional[str]
+        The URL of the result, once the job is done.
+    """
+    id: str
+    status: str
+    created_at: float
+    started_at: Optional[float]
+    finished_at: Optional[float]
+    progress: dict
+    error: Optional[str]
+    result_url: Optional[str]
+
+
+def traversal_job_response(job) -> dict:
+    """
+    Returns the status of a traversal job, see `TraversalJobResponse`.
+    """
+    return {
+        **job.to_dict(),
+        "result_url": f"/traversal/jobs/{job.id}/result" if job.status == "done" else None,
+    }
+
+
+@router.post(
+    "/traversal/jobs",
+    status_code=202,
+    response_model=TraversalJobResponse,
+    responses={
+        202: {
+            "description": "The graph traversal has been queued. Poll `GET /traversal/jobs/{job_id}` for its status.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "id": "3f2c9d0e4b7a4c1e9a8f6d5b2c1e0f9a",
+                        "status": "queued",
+                        "created_at": 1760000000.0,
+                        "started_at": None,
+                        "finished_at": None,
+                        "progress": {},
+                        "error": None,
+                        "result_url": None
+                    }
+                }
+            }
+        },
+        400: {
+            "description": "Raised if a demand code does not match any node.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Node not found for code 'some_invalid_code'."}
+                }
+            }
+        },
+    }
+)
+async def submit_graph_traversal_job(request: GraphTraversalRequest, response: Response):
+    """
+    Queues a graph traversal and returns a job ID immediately.
+
+    This endpoint accepts the same request body as `POST /traversal/perform`,
+    but does not wait for the graph traversal to finish, so that long
+    traversals do not run into proxy timeouts. The traversal is performed by a
+    pool of worker threads (see `BRIGHTWEBAPP_JOBS_MAX_WORKERS`), using the
+    same result cache and factorized LCA objects as `POST /traversal/perform`.
+
+    Poll `GET /traversal/jobs/{job_id}` for the status and progress of the job,
+    and download the result from `GET /traversal/jobs/{job_id}/result` once
+    the status is `done`. Finished jobs are discarded after
+    `BRIGHTWEBAPP_JOBS_TTL` seconds.
+
+    See Also
+    --------
+    [`brightwebapp.jobs.TraversalJobQueue`](https://brightwebapp.readthedocs.io/en/latest/api/jobs/#brightwebapp.jobs.TraversalJobQueue)
+    """
+    demand_dict = {}
+    for item in request.demand:
+        try:
+            demand_dict[bd.get_node(code=item.code)] = item.amount
+        except bd.errors.UnknownObject:
+            raise HTTPException(status_code=400, detail=f"Node not found for code '{item.code}'.")
+
+    job = traversal_job_queue.submit(
+        cutoff=request.cutoff,
+        biosphere_cutoff=request.biosphere_cutoff,
+        max_calc=request.max_calc,
+        demand=demand_dict,
+        method=request.method if request.methods is None else request.methods,
+        cache=traversal_cache,
+        lca_pool=lca_pool,
+        time_budget_ms=request.time_budget_ms,
+    )
+    response.headers["Location"] = f"/traversal/jobs/{job.id}"
+    return traversal_job_response(job)
+
+
+@router.get(
+    "/traversal/jobs/{job_id}",
+    response_model=TraversalJobResponse,
+    responses={
+        200: {
+            "description": "The status and progress of the job.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "id": "3f2c9d0e4b7a4c1e9a8f6d5b2c1e0f9a",
+                        "status": "running",
+                        "created_at": 1760000000.0,
+                        "started_at": 1760000000.1,
+                        "finished_at": None,
+                        "progress": {"calculations": 12, "max_calc": 100, "nodes": 25, "coverage": 0.93, "elapsed_ms": 41.2},
+                        "error": None,
+                        "result_url": None
+                    }
+                }
+            }
+        },
+        404: {
+            "description": "Raised if the job does not exist or has expired.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Job '3f2c9d0e4b7a4c1e9a8f6d5b2c1e0f9a' not found or expired."}
+                }
+            }
+        },
+    }
+)
+async def get_graph_traversal_job(job_id: str):
+    """
+    Returns the status, progress and (once done) the result URL of a traversal job.
 
-        return Response(
-            content=csv_data,
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": "attachment; filename=graph_traversal.csv"
+    See Also
+    --------
+    [`brightwebapp.jobs.TraversalJob`](https://brightwebapp.readthedocs.io/en/latest/api/jobs/#brightwebapp.jobs.TraversalJob)
+    """
+    job = traversal_job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found or expired.")
+    return traversal_job_response(job)
+
+
+@router.get(
+    "/traversal/jobs/{job_id}/result",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "The result of the job, in the format negotiated through the `Accept` header (see `POST /traversal/perform`).",
+            "content": {
+                media_type: {"schema": {"type": "string", "format": "binary"}}
+                for media_type in TRAVERSAL_MEDIA_TYPES
+            }
+        },
+        404: {
+            "description": "Raised if the job does not exist or has expired.",
+        },
+        406: {
+            "description": "Raised if the `Accept` header does not allow any of the supported media types.",
+        },
+        409: {
+            "description": "Raised if the job has not finished yet or has failed.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Job '3f2c9d0e4b7a4c1e9a8f6d5b2c1e0f9a' is running."}
+                }
             }
+        },
+    }
+)
+def get_graph_traversal_job_result(job_id: str, accept: Optional[str] = Header(None)):
+    """
+    Returns the result of a finished traversal job.
+
+    The format of the result is negotiated through the `Accept` header, as for
+    `POST /traversal/perform` (CSV, Arrow IPC stream or Parquet). The
+    `X-Traversal-*` headers report whether the result is truncated.
+    """
+    job = traversal_job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found or expired.")
+    if job.status == "failed":
+        raise HTTPException(status_code=409, detail=f"Job '{job_id}' failed: {job.error}")
+    if job.status != "done":
+        raise HTTPException(status_code=409, detail=f"Job '{job_id}' is {job.status}.")
+
+    media_type = negotiate_traversal_media_type(accept)
+    if media_type is None:
+        raise HTTPException(
+            status_code=406,
+            detail=f"Not acceptable. Supported media types: {', '.join(TRAVERSAL_MEDIA_TYPES)}",
         )
+    return_format, extension = TRAVERSAL_MEDIA_TYPES[media_type]
+    headers = {
+        "Content-Disposition": f"attachment; filename=graph_traversal.{extension}",
+        "Vary": "Accept",
+        **traversal_truncation_headers(job.result),
+    }
+    timer = StageTimer()
+    try:
+        result = format_traversal_result(job.result, return_format, timer=timer)
+    except ImportError as e:
+        raise HTTPException(status_code=406, detail=str(e))
+    headers["Server-Timing"] = timer.server_timing()
+    if return_format == 'csv_stream':
+        return StreamingResponse(content=result, media_type=media_type, headers=headers)
+    if return_format == 'arrow':
+        result = _arrow_table_to_ipc_stream(result)
+    return Response(content=result, media_type=media_type, headers=headers)
 
+
+class TraversalCacheStatsResponse(BaseModel):
+    """Response model for the traversal cache statistics endpoint."""
+    hits: int
+    disk_hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+    nbytes: int
+    maxbytes: Optional[int]
+    cache_dir: Optional[str]
+    refinements: int
+    frontiers: int
+
+
+@router.get(
+    "/traversal/cache",
+    response_model=TraversalCacheStatsResponse,
+    responses={
+        200: {
+            "description": "Hit, miss and eviction counters and the size of the traversal result cache.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "hits": 12,
+                        "disk_hits": 1,
+                        "misses": 3,
+                        "evictions": 0,
+                        "size": 3,
+                        "maxsize": 128,
+                        "nbytes": 15936,
+                        "maxbytes": 536870912,
+                        "cache_dir": None,
+                        "refinements": 1,
+                        "frontiers": 2
+                    }
+                }
+            }
+        }
+    }
+)
+def get_traversal_cache_stats():
+    """
+    Returns the statistics of the traversal result cache used by `POST /traversal/perform`.
+
+    `refinements` counts the results computed by continuing a cached graph
+    traversal with a higher cutoff, instead of starting over.
+
+    See Also
+    --------
+    [`brightwebapp.traversal.TraversalCache`](https://brightwebapp.readthedocs.io/en/latest/api/traversal/#brightwebapp.traversal.TraversalCache)
+    """
+    return traversal_cache.stats()
+
+
+@router.post(
+    "/sessions",
+    status_code=201,
+    responses={
+        201: {
+            "description": (
+                "The session has been created. Returns the ID of the session, the total score "
+                "and the nodes of the graph traversal table. The headers `X-Traversal-Truncated`, "
+                "`X-Traversal-Truncation-Reason` and `X-Traversal-Coverage` report whether the traversal "
+                "was stopped by `max_calc` and the share of the total score it covers."
+            ),
+            "content": {
+                "application/json": {
+                    "example": {
+                        "id": "9b1e7c3a5d2f4e8a9c0b1d2e3f4a5b6c",
+                        "created_at": 1760000000.0,
+                        "accessed_at": 1760000000.0,
+                        "rows": 7,
+                        "score": 1374.66,
+                        "revision": 0,
+                        "metadata": {"demand": {"bike": 1.0}, "method": ["IPCC"], "cutoff": 0.001, "biosphere_cutoff": 0.001, "max_calc": 100},
+                        "nodes": [
+                            {
+                                "UID": 0,
+                                "Scope": 1,
+                                "Name": "bike production",
+                                "SupplyAmount": 1.0,
+                                "BurdenIntensity": 0.0,
+                                "Burden(Cumulative)": 1374.66,
+                                "Burden(Direct)": 0.0,
+                                "Depth": 1,
+                                "Branch": None
+                            }
+                        ]
+                    }
+                }
+            }
+        },
+        400: {
+            "description": (
+                "Raised if a list of `methods` or a `time_budget_ms` is provided, "
+                "if the session exceeds the memory of the session store, or if no graph edges are found."
+            ),
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Sessions are created for a single method. Provide 'method' instead of 'methods'."
+                    }
+                }
+            }
+        },
+        500: {
+            "description": "Raised for other unexpected exceptions, such as a missing demand code.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "An unexpected error occurred: Node not found for code 'some_invalid_code'"
+                    }
+                }
+            }
+        }
+    }
+)
+def create_edit_session(request: GraphTraversalRequest, response: Response):
+    """
+    Performs a graph traversal and creates an edit session bound to its table.
+
+    The graph traversal is served from the traversal result cache, as with
+    `POST /traversal/perform`. The session holds the table on the server, so
+    that edits of single cells can be sent with `PATCH /sessions/{session_id}/edits`
+    instead of downloading, editing and recomputing the whole table on the client.
+    Sessions expire `BRIGHTWEBAPP_SESSIONS_TTL` seconds after their last request,
+    and the least recently used sessions are evicted when the sessions together
+    exceed `BRIGHTWEBAPP_SESSIONS_MAXBYTES` bytes or `BRIGHTWEBAPP_SESSIONS_MAXSIZE` sessions.
+    Every request to `PATCH /sessions/{session_id}/edits` creates a new revision of the table,
+    which can be undone with `PUT /sessions/{session_id}/revision`.
+
+    Sessions are bound to complete graph traversals, which are cached: `time_budget_ms` is not accepted.
+    As for `POST /traversal/perform`, the `X-Traversal-*` headers report whether the traversal
+    was stopped by `max_calc`.
+
+    See Also
+    --------
+    [`brightwebapp.sessions.EditSessionStore`](https://brightwebapp.readthedocs.io/en/latest/api/sessions/#brightwebapp.sessions.EditSessionStore)
+    """
+    if request.methods is not None:
+        raise HTTPException(
+            status_code=400,
+            detail="Sessions are created for a single method. Provide 'method' instead of 'methods'.",
+        )
+    if request.time_budget_ms is not None:
+        raise HTTPException(
+            status_code=400,
+            detail="Sessions are created for complete graph traversals. Remove 'time_budget_ms'.",
+        )
+    try:
+        demand_dict = {
+            bd.get_node(code=item.code): item.amount for item in request.demand
+        }
+        traversal_result = perform_graph_traversal(
+            cutoff=request.cutoff,
+            biosphere_cutoff=request.biosphere_cutoff,
+            max_calc=request.max_calc,
+            return_format='traversal_result',
+            demand=demand_dict,
+            method=request.method,
+            cache=traversal_cache,
+            lca_pool=lca_pool,
+        )
+        df = format_traversal_result(traversal_result, 'dataframe')
+        session = edit_session_store.create(
+            df=df,
+            score=traversal_result.total_score,
+            metadata={
+                "demand": {item.code: item.amount for item in request.demand},
+                "method": list(request.method),
+                "cutoff": request.cutoff,
+                "biosphere_cutoff": request.biosphere_cutoff,
+                "max_calc": request.max_calc,
+            },
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        # Add this to see the exact error before it's hidden by HTTPException
-        print(f"ERROR: An exception occurred: {e}")
-        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
\ No newline at end of file
+        logging.exception("Unexpected error while creating an edit session")
+        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
+
+    response.headers["Location"] = f"/sessions/{session.id}"
+    response.headers.update(traversal_truncation_headers(traversal_result))
+    return {
+        **session.to_dict(),
+        "nodes": json.loads(df.to_json(orient='records')),
+    }
+
+
+class CellEdit(BaseModel):
+    """
+    Represents an edit of a single cell of a graph traversal table.
+
+    Attributes
+    ----------
+    uid: int
+        The UID of the node.
+    field: str
+        The edited column, `SupplyAmount` or `BurdenIntensity`.
+    value: Optional[float]
+        The new value of the cell. `null` (or the original value) reverts an earlier edit of the cell.
+    """
+    uid: int
+    field: Literal['SupplyAmount', 'BurdenIntensity']
+    value: Optional[float]
+
+
+class EditsRequest(BaseModel):
+    """
+    Represents a request for editing cells of the table of an edit session.
+
+    Attributes
+    ----------
+    edits: list[CellEdit]
+        The edits, applied in order, see `CellEdit`.
+
+    Example
+    -------
+    ```json
+    {
+        "edits": [
+            {"uid": 1, "field": "SupplyAmount", "value": 12.0},
+            {"uid": 4, "field": "BurdenIntensity", "value": 9.5}
+        ]
+    }
+    ```
+    """
+    edits: list[CellEdit] = Field(..., min_length=1)
+
+
+@router.patch(
+    "/sessions/{session_id}/edits",
+    responses={
+        200: {
+            "description": "The new total score and the rows of the table which have changed.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "id": "9b1e7c3a5d2f4e8a9c0b1d2e3f4a5b6c",
+                        "score": 1168.44,
+                        "revision": 1,
+                        "changed": [
+                            {
+                                "UID": 1,
+                                "SupplyAmount": 12.0,
+                                "BurdenIntensity": 26.6,
+                                "Burden(Direct)": 319.2,
+                                "Edited?": True,
+                                "Updated?": False
+                            },
+                            {
+                                "UID": 2,
+                                "SupplyAmount": 66.0,
+                                "BurdenIntensity": 11.2,
+                                "Burden(Direct)": 739.2,
+                                "Edited?": False,
+                                "Updated?": True
+                            }
+                        ]
+                    }
+                }
+            }
+        },
+        400: {
+            "description": "Raised if a UID is not in the table of the session. No edit is applied.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "UIDs [99] are not in the table of the session."}
+                }
+            }
+        },
+        404: {
+            "description": "Raised if the session does not exist or has expired.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Session '9b1e7c3a5d2f4e8a9c0b1d2e3f4a5b6c' not found or expired."}
+                }
+            }
+        },
+        410: {
+            "description": (
+                "Raised if the session has been evicted after the edits, because together with its revisions "
+                "it has grown larger than `BRIGHTWEBAPP_SESSIONS_MAXBYTES`."
+            ),
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Session '9b1e7c3a5d2f4e8a9c0b1d2e3f4a5b6c' has been evicted after the edits."}
+                }
+            }
+        },
+    }
+)
+def edit_session(session_id: str, request: EditsRequest):
+    """
+    Applies edits of single cells to the table of an edit session.
+
+    Only the rows which depend on the edited cells are recomputed
+    (see `brightwebapp.modifications.IncrementalEditor`): an edited supply
+    amount rescales the nodes downstream of the node, as in the web application.
+    Returns the new total score, the new revision of the table and the rows which have changed
+    (`UID`, `SupplyAmount`, `BurdenIntensity`, `Burden(Direct)`, `Edited?` and `Updated?`).
+    The edits of one request form one revision. If the session, together with its revisions,
+    has grown larger than `BRIGHTWEBAPP_SESSIONS_MAXBYTES`, it is evicted and `410 Gone` is returned.
+
+    See Also
+    --------
+    [`brightwebapp.modifications.IncrementalEditor.edit`](https://brightwebapp.readthedocs.io/en/latest/api/modifications/#brightwebapp.modifications.IncrementalEditor.edit)
+    """
+    session = edit_session_store.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"Session '{session_id}' not found or expired.")
+    unknown_uids = sorted({edit.uid for edit in request.edits} - set(session.editor.uids.tolist()))
+    if unknown_uids:
+        raise HTTPException(status_code=400, detail=f"UIDs {unknown_uids} are not in the table of the session.")
+
+    with session.lock:
+        df_changed = session.editor.apply_edits([(edit.uid, edit.field, edit.value) for edit in request.edits])
+        score, revision = session.editor.score, session.editor.revision
+    if not edit_session_store.update_size(session.id):
+        raise HTTPException(
+            status_code=410,
+            detail=(
+                f"Session '{session_id}' has been evicted after the edits. "
+                f"With its revisions, it requires {session.editor.nbytes} bytes, more than the session store holds."
+            ),
+        )
+    return edit_session_response(session.id, score, revision, df_changed)
+
+
+def edit_session_response(session_id: str, score: float, revision: int, df_changed: pd.DataFrame) -> dict:
+    """
+    Returns the score, revision and changed rows of an edit session, see `PATCH /sessions/{session_id}/edits`.
+    """
+    columns = ['UID', 'SupplyAmount', 'BurdenIntensity', 'Burden(Direct)', 'Edited?', 'Updated?']
+    return {
+        "id": session_id,
+        "score": score,
+        "revision": revision,
+        "changed": json.loads(df_changed[columns].to_json(orient='records')),
+    }
+
+
+class RevisionRequest(BaseModel):
+    """
+    Represents a request for restoring a revision of the table of an edit session.
+
+    Attributes
+    ----------
+    revision: int
+        The revision, `0` for the table of the graph traversal.
+    """
+    revision: int = Field(..., ge=0)
+
+
+@router.put(
+    "/sessions/{session_id}/revision",
+    responses={
+        200: {
+            "description": "The total score of the restored revision and the rows of the table which have changed.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "id": "9b1e7c3a5d2f4e8a9c0b1d2e3f4a5b6c",
+                        "score": 1374.66,
+                        "revision": 0,
+                        "changed": [
+                            {
+                                "UID": 1,
+                                "SupplyAmount": 15.5,
+                                "BurdenIntensity": 26.6,
+                                "Burden(Direct)": 412.3,
+                                "Edited?": False,
+                                "Updated?": False
+                            }
+                        ]
+                    }
+                }
+            }
+        },
+        400: {
+            "description": "Raised if the revision does not exist or is no longer kept.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Revision must be between 0 and 3, but got 4."}
+                }
+            }
+        },
+        404: {
+            "description": "Raised if the session does not exist or has expired.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Session '9b1e7c3a5d2f4e8a9c0b1d2e3f4a5b6c' not found or expired."}
+                }
+            }
+        },
+    }
+)
+def set_edit_session_revision(session_id: str, request: RevisionRequest):
+    """
+    Restores a revision of the table of an edit session (undo and redo).
+
+    Revision `0` is the table of the graph traversal, and every request to
+    `PATCH /sessions/{session_id}/edits` creates a new revision. Only the rows
+    changed by the revisions in between are restored. Edits after restoring an
+    earlier revision discard the later revisions. The last
+    `BRIGHTWEBAPP_SESSIONS_MAX_REVISIONS` revisions are kept.
+
+    See Also
+    --------
+    [`brightwebapp.modifications.IncrementalEditor.goto`](https://brightwebapp.readthedocs.io/en/latest/api/modifications/#brightwebapp.modifications.IncrementalEditor.goto)
+    """
+    session = edit_session_store.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"Session '{session_id}' not found or expired.")
+    try:
+        with session.lock:
+            df_changed = session.editor.goto(request.revision)
+            score, revision = session.editor.score, session.editor.revision
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return edit_session_response(session.id, score, revision, df_changed)
+
+
+@router.delete(
+    "/sessions/{session_id}",
+    status_code=204,
+    responses={
+        404: {
+            "description": "Raised if the session does not exist or has expired.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Session '9b1e7c3a5d2f4e8a9c0b1d2e3f4a5b6c' not found or expired."}
+                }
+            }
+        },
+    }
+)
+async def delete_edit_session(session_id: str):
+    """
+    Deletes an edit session and releases its memory.
+    """
+    if not edit_session_store.delete(session_id):
+        raise HTTPException(status_code=404, detail=f"Session '{session_id}' not found or expired.")
+    return Response(status_code=204)
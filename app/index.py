@@ -8,14 +8,8 @@ from brightwebapp.brightway import (
     load_and_set_useeio_project,
     brightway_wasm_database_storage_workaround
 )
-from brightwebapp.modifications import (
-    _create_user_input_columns,
-    _update_burden_intensity_based_on_user_data,
-    _update_production_based_on_user_data,
-    _update_burden_based_on_user_data,
-    _determine_edited_rows
-)
-from brightwebapp.traversal import perform_lca, perform_graph_traversal
+from brightwebapp.modifications import IncrementalEditor
+from brightwebapp.traversal import perform_lca, perform_graph_traversal, LCAPool, TraversalCache
 from brightwebapp.visualization import create_plotly_figure_piechart
 import bw2data as bd
 
@@ -52,15 +46,15 @@ class panel_lca_class:
         self.chosen_method_unit = ''
         self.chosen_amount = 0
         self.lca = None
+        self.lca_pool = LCAPool(dense_max_products=2000) # reuses the factorized (for USEEIO: inverted) technosphere matrix across calculations
+        self.traversal_cache = TraversalCache(maxsize=16, max_frontiers=4) # lowering the cutoff continues the previous graph traversal
         self.scope_dict = {'Scope 1': 0, 'Scope 2': 0, 'Scope 3': 0}
         self.graph_traversal_cutoff = 0.1
         self.graph_traversal = {}
         self.df_graph_traversal_nodes = None
         self.df_graph_traversal_edges = None
-        self.df_tabulator_from_traversal = None
-        self.sum_direct_burden = 0
         self.df_tabulator = None # nota bene: gets updated automatically when cells in the tabulator are edited # https://panel.holoviz.org/reference/widgets/Tabulator.html#editors-editing
-        self.bool_user_provided_data = False
+        self.editor = None # applies the edits of the table to the graph traversal results, one edited cell at a time
 
 
     def reset_results(self, event):
@@ -70,6 +64,7 @@ class panel_lca_class:
         """
         self.scope_dict = {'Scope 1': 0, 'Scope 2': 0, 'Scope 3': 0}
         self.df_tabulator = pd.DataFrame([['']], columns=['Data will appear here after calculations...'])
+        self.editor = None
 
     def set_db(self, event):
         """
@@ -218,6 +213,7 @@ class panel_lca_class:
             self.lca = perform_lca(
                 demand={self.chosen_activity: self.chosen_amount},
                 method=self.chosen_method.name,
+                lca_pool=self.lca_pool,
             )
         except ValueError as e:
             pn.state.notifications.error(str(e), duration=15000)
@@ -228,7 +224,10 @@ class panel_lca_class:
                 biosphere_cutoff=0.01,
                 max_calc=100,
                 return_format='dataframe',
-                lca=self.lca,
+                demand={self.chosen_activity: self.chosen_amount},
+                method=self.chosen_method.name,
+                cache=self.traversal_cache,
+                lca_pool=self.lca_pool,
             )
         except ValueError as e:
             pn.state.notifications.error(str(e), duration=15000)
@@ -297,7 +296,6 @@ def button_action_load_database(event):
 
 
 def button_action_perform_lca(event):
-    panel_lca_class_instance.bool_user_provided_data = False
     if panel_lca_class_instance.df_tabulator is not None:
         panel_lca_class_instance.reset_results(event)
     if widget_autocomplete_product.value == '':
@@ -314,33 +312,51 @@ def button_action_perform_lca(event):
     panel_lca_class_instance.determine_scope_2(event)
     widget_number_lca_score.format = f'{{value:,.3f}} {panel_lca_class_instance.chosen_method_unit}'
     widget_tabulator.value = panel_lca_class_instance.df_tabulator
-    panel_lca_class_instance.df_tabulator_from_traversal = panel_lca_class_instance.df_tabulator.copy()
+    panel_lca_class_instance.editor = IncrementalEditor(df=panel_lca_class_instance.df_tabulator, score=panel_lca_class_instance.lca.score)
     widget_number_lca_score.value = panel_lca_class_instance.lca.score
-    panel_lca_class_instance.sum_direct_burden = panel_lca_class_instance.df_tabulator['Burden(Direct)'].sum()
     pn.state.notifications.success('Completed LCA score calculation!', duration=5000)
     perform_scope_analysis(event)
 
 
 def button_action_update_based_on_user_table_input(event):
-    if panel_lca_class_instance.bool_user_provided_data == True:
-        pn.state.notifications.warning('You have already provided user data. Please re-compute the LCA score to reset the table.', duration=10000)
+    if panel_lca_class_instance.editor is None:
+        pn.state.notifications.error('Please calculate the LCA score first!', duration=5000)
         return
-    if panel_lca_class_instance.df_tabulator.equals(panel_lca_class_instance.df_tabulator_from_traversal):
+    # only the edited cells (and the nodes downstream of them) are recomputed, so the table can be edited again and again
+    df_changed = panel_lca_class_instance.editor.apply_dataframe(panel_lca_class_instance.df_tabulator)
+    if df_changed.empty:
         pn.state.notifications.info('No changes detected in table!', duration=5000)
     else:
-        panel_lca_class_instance.bool_user_provided_data = True
-        pn.state.notifications.info('Updating data...', duration=5000)
-        df_with_user_input_columns = _create_user_input_columns(
-            df_original=panel_lca_class_instance.df_tabulator_from_traversal,
-            df_user_input=panel_lca_class_instance.df_tabulator
-        )
-        df_with_user_input_columns = _determine_edited_rows(df=df_with_user_input_columns)
-        df_with_user_input_columns = _update_burden_intensity_based_on_user_data(df=df_with_user_input_columns)
-        df_with_user_input_columns = _update_production_based_on_user_data(df=df_with_user_input_columns)
-        df_with_user_input_columns = _update_burden_based_on_user_data(df=df_with_user_input_columns)
-        widget_tabulator.value = df_with_user_input_columns
-        widget_number_lca_score.value = df_with_user_input_columns['Burden(Direct)'].sum() - panel_lca_class_instance.sum_direct_burden + panel_lca_class_instance.lca.score
-        pn.state.notifications.success('Completed update!', duration=5000)
+        show_edited_table()
+        pn.state.notifications.success(f'Completed update of {len(df_changed)} rows!', duration=5000)
+
+
+def show_edited_table():
+    panel_lca_class_instance.df_tabulator = panel_lca_class_instance.editor.to_dataframe()
+    widget_tabulator.value = panel_lca_class_instance.df_tabulator
+    widget_number_lca_score.value = panel_lca_class_instance.editor.score
+
+
+def button_action_undo(event):
+    editor = panel_lca_class_instance.editor
+    if editor is None or editor.revision == editor.oldest_revision:
+        pn.state.notifications.info('Nothing to undo!', duration=5000)
+        return
+    # only the rows changed by the last update are restored
+    df_changed = editor.undo()
+    show_edited_table()
+    pn.state.notifications.success(f'Undid update of {len(df_changed)} rows!', duration=5000)
+
+
+def button_action_redo(event):
+    editor = panel_lca_class_instance.editor
+    if editor is None or editor.revision == editor.latest_revision:
+        pn.state.notifications.info('Nothing to redo!', duration=5000)
+        return
+    df_changed = editor.redo()
+    show_edited_table()
+    pn.state.notifications.success(f'Redid update of {len(df_changed)} rows!', duration=5000)
+
 
 def perform_scope_analysis(event):
     pn.state.notifications.info('Performing Scope Analysis...', duration=5000)
@@ -415,6 +431,22 @@ widget_button_udpate = pn.widgets.Button(
 )
 widget_button_udpate.on_click(button_action_update_based_on_user_table_input)
 
+widget_button_undo = pn.widgets.Button(
+    name='Undo',
+    icon='arrow-back-up',
+    button_type='default',
+    sizing_mode='stretch_width'
+)
+widget_button_undo.on_click(button_action_undo)
+
+widget_button_redo = pn.widgets.Button(
+    name='Redo',
+    icon='arrow-forward-up',
+    button_type='default',
+    sizing_mode='stretch_width'
+)
+widget_button_redo.on_click(button_action_redo)
+
 widget_number_lca_score = pn.indicators.Number(
     name='LCA Impact Score',
     font_size='30pt',
@@ -441,6 +473,7 @@ col1 = pn.Column(
     widget_float_slider_cutoff,
     widget_button_lca,
     widget_button_udpate,
+    pn.Row(widget_button_undo, widget_button_redo),
     pn.Spacer(height=10),
     widget_number_lca_score,
     widget_plotly_figure_piechart,
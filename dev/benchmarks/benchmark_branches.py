@@ -0,0 +1,71 @@
+# %%
+"""
+Benchmark of the branch reconstruction step of `perform_graph_traversal`.
+
+Compares the parent-pointer implementation in
+`brightwebapp.traversal._add_branch_information_to_edges_dataframe`
+with the previous implementation, which called
+`brightwebapp.traversal._trace_branch_from_last_node` once for every row.
+
+Run with:
+
+```bash
+python dev/benchmarks/benchmark_branches.py
+```
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from brightwebapp.traversal import (
+    _add_branch_information_to_edges_dataframe,
+    _trace_branch_from_last_node,
+)
+
+
+def random_tree_edges(number_of_edges: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Returns a DataFrame of edges of a random tree rooted at node `0`,
+    in the order in which a priority-first graph traversal would produce them
+    (every consumer node is created before its producer nodes).
+    """
+    rng = np.random.default_rng(seed)
+    producers = np.arange(1, number_of_edges + 1)
+    # random recursive tree: every node is supplied to a uniformly chosen earlier node
+    consumers = rng.integers(0, producers)
+    return pd.DataFrame({
+        'consumer_unique_id': consumers,
+        'producer_unique_id': producers,
+    })
+
+
+def legacy_add_branch_information_to_edges_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    branches = []
+    for _, row in df.iterrows():
+        branches.append({
+            'producer_unique_id': row['producer_unique_id'],
+            'Branch': _trace_branch_from_last_node(df, int(row['producer_unique_id'])),
+        })
+    return pd.DataFrame(branches)
+
+
+def timed(function, *args) -> tuple:
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+# %%
+if __name__ == '__main__':
+    print(f"{'edges':>8} | {'max depth':>9} | {'legacy [s]':>10} | {'parent-pointer [s]':>18} | {'speedup':>8}")
+    for number_of_edges in [100, 1_000, 10_000, 50_000]:
+        df_edges = random_tree_edges(number_of_edges)
+        df_new, time_new = timed(_add_branch_information_to_edges_dataframe, df_edges)
+        max_depth = df_new['Branch'].map(len).max()
+        if number_of_edges <= 10_000:
+            df_legacy, time_legacy = timed(legacy_add_branch_information_to_edges_dataframe, df_edges)
+            pd.testing.assert_frame_equal(df_new, df_legacy)
+            print(f"{number_of_edges:>8} | {max_depth:>9} | {time_legacy:>10.3f} | {time_new:>18.4f} | {time_legacy / time_new:>7.0f}x")
+        else:
+            print(f"{number_of_edges:>8} | {max_depth:>9} | {'skipped':>10} | {time_new:>18.4f} | {'-':>8}")
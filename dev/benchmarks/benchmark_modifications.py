@@ -0,0 +1,262 @@
+# %%
+"""
+Benchmark of the supply propagation step of the user-edit pipeline.
+
+Compares the parent-pointer implementation in
+`brightwebapp.modifications._update_production_based_on_user_data`
+with the previous implementation, which walked the branch of every row
+in `DataFrame.apply(axis=1)`, and checks that both return the same table.
+
+Also measures the time per edit of `brightwebapp.modifications.IncrementalEditor`
+for random single-cell edits and for an edit of the supply amount of the root node
+(which changes every row of the table), and compares `brightwebapp.modifications.evaluate_scenarios`
+with one run of the user-edit pipeline per scenario.
+
+Finally, compares the wall time and peak memory (measured with `tracemalloc`) of
+`brightwebapp.modifications.apply_user_modifications` with those of the five pipeline steps,
+and measures the wall time and peak memory of `brightwebapp.modifications.simulate_user_modifications`
+for 10,000 iterations.
+
+Run with:
+
+```bash
+python dev/benchmarks/benchmark_modifications.py
+```
+"""
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from brightwebapp.modifications import (
+    IncrementalEditor,
+    _create_user_input_columns,
+    _determine_edited_rows,
+    _update_burden_based_on_user_data,
+    _update_burden_intensity_based_on_user_data,
+    _update_production_based_on_user_data,
+    apply_user_modifications,
+    evaluate_scenarios,
+    simulate_user_modifications,
+)
+from brightwebapp.traversal import _build_branches_from_parent_pointers
+
+
+def random_table(number_of_rows: int, fraction_edited: float = 0.01, seed: int = 42) -> pd.DataFrame:
+    """
+    Returns a table of a random tree rooted at node `0` (as built by `perform_graph_traversal`)
+    in which the supply amounts of a random `fraction_edited` of the rows have been edited.
+    """
+    rng = np.random.default_rng(seed)
+    producers = np.arange(1, number_of_rows)
+    # random recursive tree: every node is supplied to a uniformly chosen earlier node
+    consumers = rng.integers(0, producers)
+    branches = _build_branches_from_parent_pointers(consumers, producers)
+    supply = rng.uniform(0, 1, size=number_of_rows)
+    supply[rng.choice(number_of_rows, size=number_of_rows // 100, replace=False)] = 0
+    supply_user = np.full(number_of_rows, np.nan)
+    edited = rng.choice(number_of_rows, size=max(1, int(number_of_rows * fraction_edited)), replace=False)
+    supply_user[edited] = rng.uniform(0, 2, size=len(edited))
+    return pd.DataFrame({
+        'UID': np.arange(number_of_rows),
+        'SupplyAmount': supply,
+        'SupplyAmount_USER': supply_user,
+        'Branch': [np.nan] + branches,
+    })
+
+
+def legacy_update_production_based_on_user_data(df: pd.DataFrame) -> pd.DataFrame:
+    df_filtered = df.dropna(subset=['SupplyAmount_USER'])
+    dict_user_input = df_filtered.set_index('UID')['SupplyAmount_USER'].to_dict()
+    dict_original_amount = df.set_index('UID')['SupplyAmount'].to_dict()
+    df_copy = df.copy()
+
+    def get_new_values(row) -> tuple[float, bool]:
+        if not pd.isna(row['SupplyAmount_USER']):
+            return (row['SupplyAmount_USER'], False)
+        elif not isinstance(row['Branch'], list):
+            return (row['SupplyAmount'], False)
+        elif set(dict_user_input.keys()).intersection(row['Branch']):
+            for branch_UID in reversed(row['Branch']):
+                if branch_UID in dict_user_input:
+                    original_upstream = dict_original_amount[branch_UID]
+                    user_upstream = dict_user_input[branch_UID]
+                    if original_upstream == 0:
+                        return (0, True)
+                    else:
+                        return (row['SupplyAmount'] * (user_upstream / original_upstream), True)
+        else:
+            return (row['SupplyAmount'], False)
+
+    results = df_copy.apply(get_new_values, axis=1)
+    df_copy[['SupplyAmount_EDITED', 'Updated?']] = pd.DataFrame(results.tolist(), index=df_copy.index)
+    df_copy['SupplyAmount'] = df_copy['SupplyAmount_EDITED']
+    df_copy.drop(columns=['SupplyAmount_USER', 'SupplyAmount_EDITED'], inplace=True)
+    return df_copy
+
+
+def benchmark_incremental_edits(df: pd.DataFrame, number_of_edits: int = 100, seed: int = 42) -> tuple:
+    """
+    Returns the time to set up an `IncrementalEditor` for the table,
+    the median and maximum time of random single-cell edits and the time of an edit of the root node.
+    """
+    rng = np.random.default_rng(seed)
+    df_traversal = df.drop(columns=['SupplyAmount_USER'])
+    df_traversal['BurdenIntensity'] = rng.uniform(0, 1, size=len(df))
+    df_traversal['Burden(Direct)'] = df_traversal['SupplyAmount'] * df_traversal['BurdenIntensity']
+    editor, time_setup = timed(IncrementalEditor, df_traversal)
+    times: list = []
+    for uid in rng.integers(0, len(df), size=number_of_edits):
+        field = ['SupplyAmount', 'BurdenIntensity'][int(rng.integers(0, 2))]
+        times.append(timed(editor.edit, uid, field, float(rng.uniform(0, 2)))[1])
+    time_root = timed(editor.edit, 0, 'SupplyAmount', 2.0)[1]
+    return time_setup, float(np.median(times)), max(times), time_root
+
+
+def benchmark_scenarios(df: pd.DataFrame, number_of_scenarios: int, edits_per_scenario: int = 20, seed: int = 42) -> tuple:
+    """
+    Returns the time of `evaluate_scenarios` and of one run of the user-edit pipeline per scenario
+    for random scenarios, and checks that both return the same scores.
+    """
+    rng = np.random.default_rng(seed)
+    df_traversal = df.drop(columns=['SupplyAmount_USER'])
+    df_traversal['BurdenIntensity'] = rng.uniform(0, 1, size=len(df))
+    df_traversal['Burden(Direct)'] = df_traversal['SupplyAmount'] * df_traversal['BurdenIntensity']
+    scenarios: list = [
+        {int(uid): {field: float(rng.uniform(0, 2))} for uid, field in zip(
+            rng.choice(len(df), size=edits_per_scenario, replace=False),
+            rng.choice(['SupplyAmount', 'BurdenIntensity'], size=edits_per_scenario),
+        )}
+        for _ in range(number_of_scenarios)
+    ]
+    results, time_batched = timed(evaluate_scenarios, df_traversal, scenarios)
+
+    def apply_scenarios_one_by_one() -> list:
+        scores: list = []
+        for edits in scenarios:
+            df_user_input = df_traversal.copy()
+            for uid, cells in edits.items():
+                for field, value in cells.items():
+                    df_user_input.loc[uid, field] = value
+            df_edited = _create_user_input_columns(df_original=df_traversal, df_user_input=df_user_input)
+            df_edited = _determine_edited_rows(df=df_edited)
+            df_edited = _update_burden_intensity_based_on_user_data(df=df_edited)
+            df_edited = _update_production_based_on_user_data(df=df_edited)
+            df_edited = _update_burden_based_on_user_data(df=df_edited)
+            scores.append(df_edited['Burden(Direct)'].sum())
+        return scores
+
+    scores, time_one_by_one = timed(apply_scenarios_one_by_one)
+    np.testing.assert_allclose(results.scores.to_numpy(), scores)
+    return time_batched, time_one_by_one
+
+
+def apply_pipeline_steps(df_original: pd.DataFrame, df_user_input: pd.DataFrame) -> pd.DataFrame:
+    df = _create_user_input_columns(df_original=df_original, df_user_input=df_user_input)
+    df = _determine_edited_rows(df=df)
+    df = _update_burden_intensity_based_on_user_data(df=df)
+    df = _update_production_based_on_user_data(df=df)
+    return _update_burden_based_on_user_data(df=df)
+
+
+def benchmark_fused(df: pd.DataFrame, seed: int = 42) -> dict:
+    """
+    Returns the wall time and peak memory of the five pipeline steps and of `apply_user_modifications`
+    for a table with the columns of `perform_graph_traversal` in which 1% of the cells have been edited,
+    and checks that both return the same table.
+    """
+    rng = np.random.default_rng(seed)
+    df_original = df.drop(columns=['SupplyAmount_USER'])
+    df_original['Scope'] = 3
+    df_original['Name'] = [f"Activity {uid}" for uid in df_original['UID']]
+    df_original['BurdenIntensity'] = rng.uniform(0, 1, size=len(df))
+    df_original['Burden(Cumulative)'] = rng.uniform(0, 1, size=len(df))
+    df_original['Burden(Direct)'] = df_original['SupplyAmount'] * df_original['BurdenIntensity']
+    df_original['Depth'] = df_original['Branch'].map(lambda branch: len(branch) if isinstance(branch, list) else 1)
+    df_user_input = df_original.copy()
+    for column in ['SupplyAmount', 'BurdenIntensity']:
+        rows = rng.choice(len(df), size=max(1, len(df) // 100), replace=False)
+        df_user_input.iloc[rows, df_user_input.columns.get_loc(column)] *= 2
+
+    results: dict = {}
+    for name, function in [('pipeline', apply_pipeline_steps), ('fused', apply_user_modifications)]:
+        result, duration = timed(function, df_original, df_user_input)
+        # tracing memory slows down allocations, so that the peak memory is measured in a second run
+        tracemalloc.start()
+        function(df_original, df_user_input)
+        results[name] = (result, duration, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    pd.testing.assert_frame_equal(results['fused'][0], results['pipeline'][0], check_exact=True)
+    return {name: (duration, peak) for name, (_, duration, peak) in results.items()}
+
+
+def benchmark_monte_carlo(df: pd.DataFrame, iterations: int = 10_000, seed: int = 42) -> tuple:
+    """
+    Returns the wall time and peak memory of `simulate_user_modifications` with a relative uncertainty
+    of 10% on the edited cells, for a table in which 1% of the supply amounts and burden intensities have been edited.
+    """
+    rng = np.random.default_rng(seed)
+    df_original = df.drop(columns=['SupplyAmount_USER'])
+    df_original['BurdenIntensity'] = rng.uniform(0, 1, size=len(df))
+    df_original['Burden(Direct)'] = df_original['SupplyAmount'] * df_original['BurdenIntensity']
+    df_user_input = df_original.copy()
+    for column in ['SupplyAmount', 'BurdenIntensity']:
+        rows = rng.choice(len(df), size=max(1, len(df) // 100), replace=False)
+        df_user_input.iloc[rows, df_user_input.columns.get_loc(column)] *= 2
+
+    def simulate() -> None:
+        simulate_user_modifications(df_original, df_user_input, relative_uncertainty=0.1, iterations=iterations, seed=seed)
+
+    _, duration = timed(simulate)
+    tracemalloc.start()
+    simulate()
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return duration, peak
+
+
+def timed(function, *args) -> tuple:
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+# %%
+if __name__ == '__main__':
+    print(f"{'rows':>8} | {'max depth':>9} | {'legacy [s]':>10} | {'parent-pointer [s]':>18} | {'speedup':>8}")
+    for number_of_rows in [1_000, 10_000, 50_000, 200_000]:
+        df = random_table(number_of_rows)
+        max_depth = df['Branch'].map(lambda branch: len(branch) if isinstance(branch, list) else 0).max()
+        df_new, time_new = timed(_update_production_based_on_user_data, df)
+        if number_of_rows <= 50_000:
+            df_legacy, time_legacy = timed(legacy_update_production_based_on_user_data, df)
+            pd.testing.assert_frame_equal(df_new, df_legacy, check_exact=True)
+            print(f"{number_of_rows:>8} | {max_depth:>9} | {time_legacy:>10.3f} | {time_new:>18.4f} | {time_legacy / time_new:>7.0f}x")
+        else:
+            print(f"{number_of_rows:>8} | {max_depth:>9} | {'skipped':>10} | {time_new:>18.4f} | {'-':>8}")
+
+    print()
+    print(f"{'rows':>8} | {'editor setup [s]':>16} | {'median edit [ms]':>16} | {'max edit [ms]':>13} | {'root edit [ms]':>14}")
+    for number_of_rows in [1_000, 10_000, 50_000, 200_000]:
+        time_setup, time_median, time_max, time_root = benchmark_incremental_edits(random_table(number_of_rows))
+        print(f"{number_of_rows:>8} | {time_setup:>16.3f} | {time_median * 1000:>16.2f} | {time_max * 1000:>13.2f} | {time_root * 1000:>14.1f}")
+
+    print()
+    print(f"{'rows':>8} | {'scenarios':>9} | {'one by one [s]':>14} | {'batched [s]':>11} | {'speedup':>8}")
+    for number_of_rows, number_of_scenarios in [(1_000, 100), (10_000, 100), (50_000, 200)]:
+        time_batched, time_one_by_one = benchmark_scenarios(random_table(number_of_rows), number_of_scenarios)
+        print(f"{number_of_rows:>8} | {number_of_scenarios:>9} | {time_one_by_one:>14.3f} | {time_batched:>11.3f} | {time_one_by_one / time_batched:>7.0f}x")
+
+    print()
+    print(f"{'rows':>8} | {'pipeline [s]':>12} | {'fused [s]':>9} | {'pipeline peak [MB]':>18} | {'fused peak [MB]':>15}")
+    for number_of_rows in [10_000, 50_000, 200_000]:
+        results = benchmark_fused(random_table(number_of_rows))
+        (time_pipeline, peak_pipeline), (time_fused, peak_fused) = results['pipeline'], results['fused']
+        print(f"{number_of_rows:>8} | {time_pipeline:>12.3f} | {time_fused:>9.3f} | {peak_pipeline / 1e6:>18.1f} | {peak_fused / 1e6:>15.1f}")
+
+    print()
+    print(f"{'rows':>8} | {'iterations':>10} | {'monte carlo [s]':>15} | {'peak [MB]':>9}")
+    for number_of_rows in [5_000, 50_000, 200_000]:
+        time_monte_carlo, peak_monte_carlo = benchmark_monte_carlo(random_table(number_of_rows))
+        print(f"{number_of_rows:>8} | {10_000:>10} | {time_monte_carlo:>15.3f} | {peak_monte_carlo / 1e6:>9.1f}")
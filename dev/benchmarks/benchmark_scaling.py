@@ -0,0 +1,173 @@
+# %%
+"""
+Scaling benchmark of `perform_graph_traversal` and of the user-edit pipeline
+(`brightwebapp.modifications.apply_user_modifications`), on synthetic supply chains of increasing size
+(see `tests.fixtures.synthetic.example_system_synthetic`).
+
+For every size, records the wall time of the stages of the graph traversal
+(LCA, traversal, DataFrame building, branch reconstruction, serialization;
+see `brightwebapp.timing.StageTimer`) and of the user-edit pipeline
+applied to edits of 1% of the rows.
+
+Results are written to a JSON file, which can be used as a baseline for later runs.
+Stages which are slower than the baseline by more than `--threshold` are reported
+and the script exits with status 1.
+
+Run with:
+
+```bash
+python dev/benchmarks/benchmark_scaling.py --sizes 100 1000 10000 100000 --output dev/benchmarks/baseline_scaling.json
+python dev/benchmarks/benchmark_scaling.py --sizes 100 1000 10000 --compare dev/benchmarks/baseline_scaling.json
+```
+
+Warning
+-------
+Deletes and recreates the Brightway project `synthetic`.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+import bw2data as bd
+import numpy as np
+import pandas as pd
+
+from brightwebapp.modifications import apply_user_modifications
+from brightwebapp.timing import StageTimer
+from brightwebapp.traversal import perform_graph_traversal
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from tests.fixtures.synthetic import example_system_synthetic
+
+
+def edit_rows(df: pd.DataFrame, fraction: float = 0.01, seed: int = 42) -> pd.DataFrame:
+    """
+    Returns a copy of the DataFrame in which the supply amount and burden intensity
+    of a random `fraction` of the rows (except the first) have been changed, as a user would in the table.
+    """
+    rng = np.random.default_rng(seed)
+    df_user_input = df.copy()
+    number_of_edits: int = max(1, int(len(df) * fraction))
+    rows = rng.choice(np.arange(1, len(df)), size=min(number_of_edits, len(df) - 1), replace=False)
+    half: int = len(rows) // 2
+    column_supply = df_user_input.columns.get_loc('SupplyAmount')
+    column_intensity = df_user_input.columns.get_loc('BurdenIntensity')
+    df_user_input.iloc[rows[:half], column_supply] *= 2
+    df_user_input.iloc[rows[half:], column_intensity] *= 0.5
+    return df_user_input
+
+
+def benchmark(number_of_activities: int, max_calc: int, fan_out: int, depth: int, seed: int) -> dict:
+    start = time.perf_counter()
+    system = example_system_synthetic(
+        number_of_activities=number_of_activities,
+        fan_out=fan_out,
+        depth=depth,
+        cycles=max(1, number_of_activities // 100),
+        seed=seed,
+    )
+    setup_ms: float = (time.perf_counter() - start) * 1000
+
+    timer = StageTimer()
+    df = perform_graph_traversal(
+        cutoff=1e-12,
+        biosphere_cutoff=1e-12,
+        max_calc=max_calc,
+        return_format='dataframe',
+        demand={bd.get_node(code=system['demand_code']): 1},
+        method=system['method'],
+        timer=timer,
+    )
+    df_user_input = edit_rows(df, seed=seed)
+    with timer.span('modifications', rows=len(df)):
+        apply_user_modifications(df_original=df, df_user_input=df_user_input)
+
+    stages: dict = {}
+    for span in timer.spans:
+        stages[span.name] = stages.get(span.name, 0) + span.duration_ms
+    return {
+        'activities': number_of_activities,
+        'edges': system['edges'],
+        'rows': len(df),
+        'max_calc': max_calc,
+        'setup_ms': setup_ms,
+        'stages_ms': stages,
+        'total_ms': timer.total_ms,
+    }
+
+
+def environment() -> dict:
+    import bw2calc
+    import bw_graph_tools
+    import scipy
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'scipy': scipy.__version__,
+        'bw2data': '.'.join(map(str, bd.__version__)),
+        'bw2calc': bw2calc.__version__,
+        'bw_graph_tools': bw_graph_tools.__version__,
+    }
+
+
+def compare(results: list, baseline: dict, threshold: float) -> list:
+    """
+    Returns the stages (and the setup) which are more than `threshold` times slower than in the baseline.
+    Sizes and stages missing from the baseline are ignored.
+    """
+    baseline_results: dict = {result['activities']: result for result in baseline['results']}
+    regressions: list = []
+    for result in results:
+        reference: dict | None = baseline_results.get(result['activities'])
+        if reference is None:
+            continue
+        durations = {'setup': result['setup_ms'], **result['stages_ms']}
+        reference_durations = {'setup': reference['setup_ms'], **reference['stages_ms']}
+        for stage, duration in durations.items():
+            # very short stages are too noisy to compare
+            if stage in reference_durations and reference_durations[stage] > 1 and duration > threshold * reference_durations[stage]:
+                regressions.append((result['activities'], stage, reference_durations[stage], duration))
+    return regressions
+
+
+# %%
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1_000, 10_000, 100_000], help="numbers of activities")
+    parser.add_argument('--max-calc', type=int, default=10_000, help="maximum number of calculations of the graph traversal (at most the number of activities)")
+    parser.add_argument('--fan-out', type=int, default=3)
+    parser.add_argument('--depth', type=int, default=6)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', type=Path, help="JSON file to which the results are written")
+    parser.add_argument('--compare', type=Path, help="JSON file of a previous run to compare the results with")
+    parser.add_argument('--threshold', type=float, default=1.5, help="slowdown relative to the baseline reported as a regression")
+    args = parser.parse_args()
+
+    results: list = []
+    stage_names: list = ['setup', 'lci', 'lcia', 'traversal', 'names', 'branches', 'serialization', 'modifications']
+    print(f"{'activities':>10} | {'rows':>7} | " + ' | '.join(f"{name + ' [ms]':>18}" for name in stage_names))
+    for number_of_activities in args.sizes:
+        result = benchmark(number_of_activities, max_calc=min(args.max_calc, number_of_activities), fan_out=args.fan_out, depth=args.depth, seed=args.seed)
+        results.append(result)
+        durations = {'setup': result['setup_ms'], **result['stages_ms']}
+        print(
+            f"{number_of_activities:>10} | {result['rows']:>7} | "
+            + ' | '.join(f"{durations.get(name, float('nan')):>18.1f}" for name in stage_names)
+        )
+
+    if args.output is not None:
+        args.output.write_text(json.dumps({'environment': environment(), 'results': results}, indent=2) + '\n')
+
+    if args.compare is not None:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.threshold)
+        for number_of_activities, stage, reference, duration in regressions:
+            print(f"regression: {stage} at {number_of_activities} activities took {duration:.1f} ms (baseline: {reference:.1f} ms)")
+        if regressions:
+            sys.exit(1)
+        print(f"no stage is more than {args.threshold}x slower than the baseline")
@@ -0,0 +1,232 @@
+# %%
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, Optional
+
+import bw2data as bd
+import numpy as np
+
+from brightwebapp.traversal import LCAPool, format_traversal_result, perform_graph_traversal
+
+
+# per-process state of the worker processes, see `_initialize_worker`.
+_WORKER_LCA_POOL: Optional[LCAPool] = None
+
+
+def _initialize_worker(project: str) -> None:
+    """
+    Sets the current Brightway project of a worker process
+    and creates the [`brightwebapp.traversal.LCAPool`][] which the worker reuses for all its tasks.
+
+    Parameters
+    ----------
+    project : str
+        Name of the Brightway project.
+    """
+    global _WORKER_LCA_POOL
+    bd.projects.set_current(project)
+    _WORKER_LCA_POOL = LCAPool()
+
+
+def _run_traversal_task(index: int, task: dict) -> dict:
+    """
+    Performs the graph traversal of a single batch task in a worker process.
+
+    Exceptions are not raised, but returned as part of the result,
+    so that a failing task does not abort the other tasks of a batch.
+
+    Parameters
+    ----------
+    index : int
+        Position of the task in the batch.
+    task : dict
+        Task, see [`brightwebapp.batch.TraversalWorkerPool`][].
+
+    Returns
+    -------
+    dict
+        `{'index': index, 'status': 'ok', 'truncated': '', 'coverage': 0.98, 'csv': '...'}` on success or
+        `{'index': index, 'status': 'error', 'detail': '...'}` on failure.
+        `truncated` and `coverage` are those of the [`brightwebapp.traversal.TraversalResult`][]
+        (of the first method, for a list of methods); `coverage` is `None` if unknown.
+    """
+    try:
+        # other processes (e.g. the API server) may have modified the project since the worker started.
+        bd.databases.load()
+        bd.methods.load()
+        demand: dict = {}
+        for code, amount in task['demand'].items():
+            try:
+                demand[bd.get_node(code=code)] = amount
+            except bd.errors.UnknownObject:
+                raise ValueError(f"Node not found for code '{code}'.")
+        traversal_result = perform_graph_traversal(
+            cutoff=task.get('cutoff', 0.001),
+            biosphere_cutoff=task.get('biosphere_cutoff', 0.001),
+            max_calc=task.get('max_calc', 100),
+            return_format='traversal_result',
+            demand=demand,
+            method=task['method'],
+            lca_pool=_WORKER_LCA_POOL,
+            time_budget_ms=task.get('time_budget_ms'),
+        )
+        csv_data: str = format_traversal_result(traversal_result, 'csv')
+    except Exception as e:
+        return {'index': index, 'status': 'error', 'detail': f"{type(e).__name__}: {e}"}
+    if isinstance(traversal_result, dict):
+        traversal_result = next(iter(traversal_result.values()))
+    coverage: float = traversal_result.coverage
+    return {
+        'index': index,
+        'status': 'ok',
+        'truncated': traversal_result.truncated,
+        'coverage': None if np.isnan(coverage) else coverage,
+        'csv': csv_data,
+    }
+
+
+class TraversalWorkerPool:
+    """
+    Pool of worker processes which perform graph traversals in parallel.
+
+    Every worker process sets the current Brightway project once
+    and keeps its own [`brightwebapp.traversal.LCAPool`][],
+    so that only the first task of a worker loads the datapackages and factorizes the technosphere matrix.
+    The worker processes are started with the first submitted task
+    and are restarted if the current Brightway project of the calling process changes
+    or if a worker process terminated abruptly.
+
+    Tasks are dictionaries of the form:
+
+    ```python
+    {
+        'demand': {'bike': 1}, # node codes and amounts
+        'method': ('IPCC', ), # or a list of methods
+        'cutoff': 0.001, # optional
+        'biosphere_cutoff': 0.001, # optional
+        'max_calc': 100, # optional
+        'time_budget_ms': 500, # optional
+    }
+    ```
+
+    Example
+    -------
+    ```python
+    >>> worker_pool = TraversalWorkerPool(max_workers=2)
+    >>> tasks = [{'demand': {code: 1}, 'method': ('IPCC', )} for code in ['bike', 'steel']]
+    >>> for result in worker_pool.imap_unordered(tasks):
+    >>>     print(result['index'], result['status'])
+    1 ok
+    0 ok
+    >>> worker_pool.shutdown()
+    ```
+
+    Notes
+    -----
+    Worker processes are started with the `spawn` method,
+    since SQLite connections of the calling process must not be shared with forked processes.
+
+    See Also
+    --------
+    [`brightwebapp.traversal.perform_graph_traversal`][]
+
+    Parameters
+    ----------
+    max_workers : int | None, optional
+        Number of worker processes. If `None`, the number of CPUs.
+    """
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError(
+                f"Expected 'max_workers' to be positive, but got {max_workers}."
+            )
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        self.project: Optional[str] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Returns the process pool executor for the current Brightway project,
+        starting (or restarting) the worker processes if necessary.
+        """
+        with self._lock:
+            if self._executor is not None and self.project != bd.projects.current:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            return self._start_executor()
+
+
+    def _start_executor(self) -> ProcessPoolExecutor:
+        """
+        Starts the worker processes if they are not running. Must be called while holding the lock.
+        """
+        if self._executor is None:
+            self.project = bd.projects.current
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_initialize_worker,
+                initargs=(self.project,),
+            )
+        return self._executor
+
+
+    def submit(self, index: int, task: dict) -> Future:
+        """
+        Submits a task to the worker processes.
+
+        Parameters
+        ----------
+        index : int
+            Position of the task in the batch, returned as part of the result.
+        task : dict
+            Task, see [`brightwebapp.batch.TraversalWorkerPool`][].
+
+        Returns
+        -------
+        Future
+            A future of the result, see [`brightwebapp.batch._run_traversal_task`][].
+        """
+        executor: ProcessPoolExecutor = self._get_executor()
+        try:
+            return executor.submit(_run_traversal_task, index, task)
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+                executor = self._start_executor()
+            return executor.submit(_run_traversal_task, index, task)
+
+
+    def imap_unordered(self, tasks: list[dict]) -> Iterator[dict]:
+        """
+        Submits all tasks to the worker processes and yields their results as they complete.
+
+        Parameters
+        ----------
+        tasks : list[dict]
+            Tasks, see [`brightwebapp.batch.TraversalWorkerPool`][].
+
+        Yields
+        ------
+        dict
+            Results in order of completion, see [`brightwebapp.batch._run_traversal_task`][].
+        """
+        futures: list[Future] = [self.submit(index, task) for index, task in enumerate(tasks)]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes. They are started again with the next submitted task.
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
@@ -3,6 +3,14 @@ import bw2data as bd
 import bw2io as bi
 import os
 
+from bw2data.backends import ActivityDataset
+
+from brightwebapp.caching import LRUCache, _project_revision
+
+_NODE_METADATA_CACHE = LRUCache(maxsize=100_000)
+_NODE_METADATA_FIELDS = ('name', 'location', 'unit', 'reference product')
+_SQLITE_MAX_VARIABLES = 500
+
 def load_and_set_ecoinvent_project(
     username: Optional[str] = None,
     password: Optional[str] = None,
@@ -102,4 +110,101 @@ def brightway_wasm_database_storage_workaround() -> None:
     - [Brightway Documentation: "How do I change my Data Directory"?](https://docs.brightway.dev/en/latest/content/faq/data_management.html#how-do-i-change-my-data-directory)
     - [Brightway Live Issue #10](https://github.com/brightway-lca/brightway-live/issues/10)
     """
-    os.environ["BRIGHTWAY_DIR"] = "/tmp/"
\ No newline at end of file
+    os.environ["BRIGHTWAY_DIR"] = "/tmp/"
+
+
+def get_node_metadata(
+    activity_datapackage_ids,
+    fields: tuple = ('name',),
+) -> dict:
+    """
+    Returns metadata of many Brightway nodes at once.
+
+    All distinct `activity_datapackage_ids` are fetched from the project database in bulk queries
+    (instead of one [`bw2data.get_node`](https://docs.brightway.dev/en/latest/content/api/bw2data/utils/index.html#bw2data.utils.get_node) call per node).
+    Results are stored in a process-wide, bounded LRU cache,
+    keyed by the current project and the modification stamps of its databases
+    (see [`brightwebapp.caching._project_revision`][]).
+    Repeated lookups of the same node are therefore served from memory
+    until the project changes or one of its databases is modified.
+
+    Notes
+    -----
+    The fields `name`, `location` and `reference product` are read from indexed columns of the `ActivityDataset` table.
+    The field `unit` requires unpickling the full node data and is therefore only fetched if requested.
+
+    Example
+    -------
+    ```python
+    >>> get_node_metadata([235, 78, 235], fields=('name', 'location'))
+    {
+        235: {'name': 'Automobiles; at manufacturer', 'location': 'United States'},
+        78: {'name': 'Steel; at mill', 'location': 'United States'},
+    }
+    ```
+
+    See Also
+    --------
+    [`brightwebapp.traversal._nodes_dict_to_dataframe`][]
+
+    Parameters
+    ----------
+    activity_datapackage_ids : Iterable[int]
+        Node ids (`activity_datapackage_id` of `bw_graph_tools` nodes). May contain duplicates.
+    fields : tuple
+        Metadata fields to return.
+        Any combination of `'name'`, `'location'`, `'unit'` and `'reference product'`.
+
+    Returns
+    -------
+    dict
+        A dictionary mapping every distinct node id to a dictionary of the requested fields.
+
+    Raises
+    ------
+    ValueError
+        If `fields` contains an unsupported field.
+    bw2data.errors.UnknownObject
+        If a node id does not exist in the current project.
+    """
+    unsupported_fields = set(fields) - set(_NODE_METADATA_FIELDS)
+    if unsupported_fields:
+        raise ValueError(
+            f"Unsupported metadata fields {sorted(unsupported_fields)}. "
+            f"Expected any of {list(_NODE_METADATA_FIELDS)}."
+        )
+
+    revision: tuple = _project_revision()
+    metadata: dict = {}
+    missing_ids: list = []
+    for node_id in dict.fromkeys(int(node_id) for node_id in activity_datapackage_ids):
+        cached: Optional[dict] = _NODE_METADATA_CACHE.get((revision, node_id))
+        if cached is not None and all(field in cached for field in fields):
+            metadata[node_id] = {field: cached[field] for field in fields}
+        else:
+            missing_ids.append(node_id)
+
+    if missing_ids:
+        columns = [ActivityDataset.id, ActivityDataset.name, ActivityDataset.location, ActivityDataset.product]
+        if 'unit' in fields:
+            columns.append(ActivityDataset.data)
+        fetched: dict = {}
+        for start in range(0, len(missing_ids), _SQLITE_MAX_VARIABLES):
+            chunk = missing_ids[start:start + _SQLITE_MAX_VARIABLES]
+            for row in ActivityDataset.select(*columns).where(ActivityDataset.id.in_(chunk)):
+                fetched[row.id] = {
+                    'name': row.name,
+                    'location': row.location,
+                    'reference product': row.product,
+                }
+                if 'unit' in fields:
+                    fetched[row.id]['unit'] = row.data.get('unit')
+        for node_id in missing_ids:
+            if node_id not in fetched:
+                raise bd.errors.UnknownObject(
+                    f"Node with id {node_id} not found in project '{bd.projects.current}'."
+                )
+            _NODE_METADATA_CACHE.put((revision, node_id), fetched[node_id])
+            metadata[node_id] = {field: fetched[node_id][field] for field in fields}
+
+    return metadata
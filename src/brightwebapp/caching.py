@@ -0,0 +1,239 @@
+# %%
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+import bw2data as bd
+
+
+class LRUCache:
+    """
+    A bounded, process-wide least-recently-used (LRU) cache.
+
+    When the cache holds more than `maxsize` entries
+    (or, if `maxbytes` is set, when the entries together are larger than `maxbytes`),
+    the least recently used entries are evicted.
+    The cache counts hits, misses and evictions,
+    which can be inspected through [`brightwebapp.caching.LRUCache.stats`][].
+
+    The cache can be shared between threads: every method holds the reentrant lock `lock`,
+    which callers can also hold to combine several operations atomically.
+
+    Example
+    -------
+    ```python
+    >>> cache = LRUCache(maxsize=2)
+    >>> cache.put('a', 1)
+    >>> cache.put('b', 2)
+    >>> cache.get('a')
+    1
+    >>> cache.put('c', 3) # evicts 'b'
+    >>> cache.get('b') is None
+    True
+    >>> cache.stats()
+    {'hits': 1, 'misses': 1, 'evictions': 1, 'size': 2, 'maxsize': 2, 'nbytes': 0, 'maxbytes': None}
+    ```
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries held in the cache. Must be positive.
+    maxbytes : int | None, optional
+        Maximum total size of the entries in bytes, as measured by `sizeof`.
+        If `None`, the cache is only bounded by `maxsize`.
+        An entry larger than `maxbytes` is not stored.
+    sizeof : Callable | None, optional
+        Function returning the size of a value in bytes. Required if `maxbytes` is set.
+
+    Raises
+    ------
+    ValueError
+        If `maxsize` is not positive.  
+        If `maxbytes` is set without `sizeof`.
+    """
+    def __init__(
+        self,
+        maxsize: int,
+        maxbytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        if maxsize <= 0:
+            raise ValueError(
+                f"Expected 'maxsize' to be positive, but got {maxsize}."
+            )
+        if maxbytes is not None and sizeof is None:
+            raise ValueError(
+                "If 'maxbytes' is set, 'sizeof' must be provided."
+            )
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.nbytes: int = 0
+        self._data: OrderedDict = OrderedDict()
+        self._sizes: dict = {}
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.lock = threading.RLock()
+
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self._data)
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self.lock:
+            return key in self._data
+
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Returns the value stored under `key` and marks it as most recently used.
+        Returns `default` if `key` is not in the cache.
+        """
+        with self.lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Stores `value` under `key` and evicts the least recently used entries
+        if the cache holds more than `maxsize` entries or more than `maxbytes` bytes.
+        """
+        size: int = self.sizeof(value) if self.sizeof is not None else 0
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+        with self.lock:
+            self.pop(key)
+            self._data[key] = value
+            self._sizes[key] = size
+            self.nbytes += size
+            while len(self._data) > self.maxsize or (self.maxbytes is not None and self.nbytes > self.maxbytes):
+                evicted_key, _ = self._data.popitem(last=False)
+                self.nbytes -= self._sizes.pop(evicted_key)
+                self.evictions += 1
+
+
+    def items(self) -> list:
+        """
+        Returns the `(key, value)` pairs of the cache, from the least to the most recently used.
+        Does not count as hits and does not change the order of the entries.
+        """
+        with self.lock:
+            return list(self._data.items())
+
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Removes the entry stored under `key` and returns its value.
+        Returns `default` if `key` is not in the cache. Does not count as a hit, miss or eviction.
+        """
+        with self.lock:
+            if key not in self._data:
+                return default
+            self.nbytes -= self._sizes.pop(key)
+            return self._data.pop(key)
+
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache and resets the counters.
+        """
+        with self.lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+    def stats(self) -> dict:
+        """
+        Returns a dictionary with the hit, miss and eviction counters
+        and the current and maximum size of the cache.
+        """
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'nbytes': self.nbytes,
+                'maxbytes': self.maxbytes,
+            }
+
+
+def _project_revision() -> tuple:
+    """
+    Returns a hashable stamp of the current Brightway project and the state of its databases.
+
+    The stamp changes whenever the current project changes or a database of the current project is
+    modified. It can therefore be used as part of a cache key for
+    all results derived from the data in the current project.
+
+    Notes
+    -----
+    Only the `modified` timestamp of the database metadata is used.
+    The `processed` timestamp also changes when an unmodified ("dirty") database is processed
+    at the start of an LCA calculation, which does not change its data.
+
+    Returns
+    -------
+    tuple
+        Of the form:
+        ```python
+        (
+            'USEEIO-1.1',
+            (
+                ('USEEIO-1.1', '2025-06-19T10:12:41.361741'),
+            )
+        )
+        ```
+    """
+    return (
+        bd.projects.current,
+        tuple(
+            (name, metadata.get('modified'))
+            for name, metadata in sorted(bd.databases.items())
+        )
+    )
+
+
+def _method_revision(method: tuple) -> tuple:
+    """
+    Returns a hashable stamp of an impact assessment method of the current project.
+
+    Brightway does not store a modification timestamp for methods.
+    The stamp therefore uses the modification time of the processed method datapackage,
+    which is rewritten whenever the characterization factors of the method are written.
+
+    Parameters
+    ----------
+    method : tuple
+        Impact assessment method.
+
+    Returns
+    -------
+    tuple
+        Of the form `(method, modification_time)`.
+        `modification_time` is `None` if the method has not been processed.
+    """
+    method = tuple(method)
+    if method not in bd.methods:
+        return (method, None)
+    try:
+        modification_time = os.path.getmtime(bd.Method(method).filepath_processed())
+    except OSError:
+        modification_time = None
+    return (method, modification_time)
@@ -0,0 +1,180 @@
+# %%
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import bw2calc as bc
+
+
+def _direct_intensity(lca: bc.LCA) -> np.ndarray:
+    """
+    Returns the characterized direct emissions of one unit of every activity (indexed by activity index)
+    of a life-cycle assessment calculation with a loaded characterization matrix.
+    """
+    return np.asarray((lca.characterization_matrix @ lca.biosphere_matrix).sum(axis=0)).ravel()
+
+
+def _contributions(lca: bc.LCA, supply: np.ndarray, direct_intensity: np.ndarray) -> pd.DataFrame:
+    """
+    Returns the direct burden of every activity with a non-zero `supply`,
+    sorted by decreasing absolute direct burden
+    (see [`brightwebapp.dense.DenseInverseLCA.contributions`][]).
+    """
+    burden: np.ndarray = direct_intensity * supply
+    indices: np.ndarray = np.flatnonzero(supply)
+    indices = indices[np.argsort(-np.abs(burden[indices]), kind='stable')]
+    activity_ids: dict = lca.dicts.activity.reversed
+    return pd.DataFrame({
+        'ID': [activity_ids[index] for index in indices],
+        'SupplyAmount': supply[indices],
+        'BurdenIntensity': direct_intensity[indices],
+        'Burden(Direct)': burden[indices],
+    })
+
+
+class DenseInverseLCA(bc.LCA):
+    """
+    Life-cycle assessment calculation which computes the dense total requirements matrix
+    (the Leontief inverse $L = A^{-1}$ of the technosphere matrix $A$) once,
+    instead of factorizing the sparse technosphere matrix.
+
+    For small databases (e.g. input-output databases such as USEEIO with a few hundred sectors),
+    every further calculation is then a vectorized matrix-vector product:
+
+    - the supply of a demand $f$ is $L f$,
+    - the cumulative score of one unit of every product is $b L$,
+      where $b$ is the characterized direct intensity of every activity (`direct_intensity`),
+    - the direct burden of every activity is $b \\circ L f$
+      (see [`brightwebapp.dense.DenseInverseLCA.contributions`][]).
+
+    A [`brightwebapp.traversal.ResumableGraphTraversal`][] of a `DenseInverseLCA` reads the cumulative scores
+    of all inputs of a node from `total_intensity` and the supply of a node from a column of
+    `total_requirements`, so that the graph traversal does not solve any linear system.
+
+    The dense matrix requires $8 n^2$ bytes for $n$ products (about 1.3 MB for USEEIO).
+    If the technosphere matrix has more than `max_products` rows, the calculation falls back to the
+    sparse factorization of `bw2calc.LCA`.
+    [`brightwebapp.traversal.LCAPool`][] uses this class for databases with up to `dense_max_products` products.
+
+    Example
+    -------
+    ```python
+    >>> lca = DenseInverseLCA(demand={node.id: 1}, data_objs=data_objs)
+    >>> lca.lci(factorize=True) # computes the dense inverse
+    >>> lca.lcia()
+    >>> lca.lci(demand={other_node.id: 2}) # matrix-vector product
+    >>> lca.lcia_calculation()
+    >>> lca.contributions().head(3)
+         ID  SupplyAmount  BurdenIntensity  Burden(Direct)
+    0  1270      2.01            0.32            0.64
+    ...
+    ```
+
+    Warnings
+    --------
+    The inverse is not recomputed if the technosphere matrix is modified after `decompose_technosphere`,
+    as with the factorization of `bw2calc.LCA`.
+
+    Parameters
+    ----------
+    *args, **kwargs
+        Arguments of `bw2calc.LCA`.
+    max_products : int
+        Maximum number of products (rows of the technosphere matrix) for which the dense inverse is computed.
+    """
+    def __init__(self, *args, max_products: int = 2000, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_products: int = max_products
+        self.total_requirements: Optional[np.ndarray] = None
+        self._direct_intensity: Optional[np.ndarray] = None
+        self._total_intensity: Optional[np.ndarray] = None
+
+
+    @property
+    def dense(self) -> bool:
+        """
+        `True` if the dense total requirements matrix has been computed.
+        """
+        return self.total_requirements is not None
+
+
+    def decompose_technosphere(self) -> None:
+        """
+        Computes the dense total requirements matrix, or factorizes the technosphere matrix
+        if it has more than `max_products` rows.
+        """
+        if self.technosphere_matrix.shape[0] > self.max_products:
+            super().decompose_technosphere()
+            return
+        self.total_requirements = np.linalg.inv(self.technosphere_matrix.toarray())
+        self._total_intensity = None
+
+
+    def solve_linear_system(self, demand: Optional[np.ndarray] = None) -> np.ndarray:
+        if self.total_requirements is None:
+            return super().solve_linear_system(demand)
+        if demand is None:
+            demand = self.demand_array
+        return self.total_requirements @ demand
+
+
+    def load_lcia_data(self, *args, **kwargs) -> None:
+        # also called by `switch_method`
+        super().load_lcia_data(*args, **kwargs)
+        self._direct_intensity = None
+        self._total_intensity = None
+
+
+    @property
+    def direct_intensity(self) -> np.ndarray:
+        """
+        Characterized direct emissions of one unit of every activity (indexed by activity index).
+        """
+        if self._direct_intensity is None:
+            self._direct_intensity = _direct_intensity(self)
+        return self._direct_intensity
+
+
+    @property
+    def total_intensity(self) -> np.ndarray:
+        """
+        Cumulative score of one unit of every product (indexed by product index).
+        Requires the dense total requirements matrix.
+        """
+        if self.total_requirements is None:
+            raise ValueError(
+                "The dense total requirements matrix has not been computed. "
+                "Call `lci(factorize=True)` first, and check `max_products`."
+            )
+        if self._total_intensity is None:
+            self._total_intensity = self.direct_intensity @ self.total_requirements
+        return self._total_intensity
+
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Size of the dense total requirements matrix and the intensity vectors in bytes.
+        """
+        return sum(
+            array.nbytes for array in (self.total_requirements, self._direct_intensity, self._total_intensity)
+            if array is not None
+        )
+
+
+    def contributions(self) -> pd.DataFrame:
+        """
+        Returns the direct burden of every activity for the current demand,
+        sorted by decreasing absolute direct burden. Activities without supply are omitted.
+
+        Returns
+        -------
+        pd.DataFrame
+            With the columns:
+
+            - `ID`: Brightway node id of the activity
+            - `SupplyAmount`: Supply amount of the activity
+            - `BurdenIntensity`: Characterized direct emissions of one unit of the activity
+            - `Burden(Direct)`: Direct burden of the activity
+        """
+        return _contributions(self, supply=self.supply_array, direct_intensity=self.direct_intensity)
@@ -0,0 +1,262 @@
+# %%
+import math
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+from brightwebapp.traversal import TraversalResult, perform_graph_traversal
+
+
+@dataclass
+class TraversalJob:
+    """
+    Graph traversal submitted to a [`brightwebapp.jobs.TraversalJobQueue`][].
+
+    Attributes
+    ----------
+    id : str
+        Unique identifier of the job.
+    status : str
+        `'queued'`, `'running'`, `'done'` or `'failed'`.
+    created_at : float
+        Time at which the job was submitted (seconds since the epoch).
+    started_at : float | None
+        Time at which the graph traversal started, `None` if the job is queued.
+    finished_at : float | None
+        Time at which the job finished, `None` if the job is queued or running.
+    progress : dict
+        Latest progress of the graph traversal, see [`brightwebapp.traversal.ResumableGraphTraversal.progress`][].
+        Empty until the graph traversal has started.
+    result : TraversalResult | dict | None
+        Result of the graph traversal once the job is done
+        (a dictionary of results if the job was submitted with a list of methods).
+    error : str | None
+        Error message if the job failed.
+    """
+    id: str
+    status: str = 'queued'
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    progress: dict = field(default_factory=dict)
+    result: Optional[TraversalResult | dict] = None
+    error: Optional[str] = None
+
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ('done', 'failed')
+
+
+    def _set_progress(self, progress: dict) -> None:
+        # progress dictionaries are replaced, not updated, so that readers in other threads never see a partial update
+        self.progress = progress
+
+
+    def to_dict(self) -> dict:
+        """
+        Returns the status of the job as a JSON-serializable dictionary (without the result).
+        Unknown numbers (`nan`) are returned as `None`.
+        """
+        progress: dict = {
+            key: None if isinstance(value, float) and math.isnan(value) else value
+            for key, value in self.progress.items()
+        }
+        return {
+            'id': self.id,
+            'status': self.status,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'progress': progress,
+            'error': self.error,
+        }
+
+
+class TraversalJobQueue:
+    """
+    In-process queue of graph traversal jobs, executed by a pool of worker threads.
+
+    [`brightwebapp.jobs.TraversalJobQueue.submit`][] returns a [`brightwebapp.jobs.TraversalJob`][] immediately.
+    The graph traversal is performed by [`brightwebapp.traversal.perform_graph_traversal`][] in a worker thread,
+    which updates the progress of the job while it runs.
+    Finished jobs (and their results) are discarded `ttl` seconds after they finished.
+    Expired jobs are evicted whenever a job is submitted or looked up.
+
+    Worker threads share the memory of the calling process,
+    so that jobs can use the same [`brightwebapp.traversal.TraversalCache`][]
+    and [`brightwebapp.traversal.LCAPool`][] as other requests.
+
+    Example
+    -------
+    ```python
+    >>> job_queue = TraversalJobQueue(max_workers=1, ttl=600)
+    >>> job = job_queue.submit(
+    >>>     demand={bd.get_node(code='bike'): 1},
+    >>>     method=('IPCC', ),
+    >>>     cutoff=0.001,
+    >>> )
+    >>> job_queue.get(job.id).status
+    'running'
+    >>> job_queue.get(job.id).progress
+    {'calculations': 12, 'max_calc': 100, 'nodes': 25, 'coverage': 0.93, 'elapsed_ms': 41.2}
+    >>> job_queue.wait(job.id).result
+    TraversalResult(...)
+    ```
+
+    See Also
+    --------
+    [`brightwebapp.batch.TraversalWorkerPool`][]
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of worker threads, i.e. the number of graph traversals performed concurrently.
+        Further jobs wait in the queue.
+    ttl : float
+        Time in seconds for which finished jobs are kept.
+    """
+    def __init__(self, max_workers: int = 1, ttl: float = 3600):
+        if max_workers <= 0:
+            raise ValueError(
+                f"Expected 'max_workers' to be positive, but got {max_workers}."
+            )
+        self.max_workers: int = max_workers
+        self.ttl: float = ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='traversal-job')
+        self._jobs: dict[str, TraversalJob] = {}
+        self._events: dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self.evictions: int = 0
+
+
+    def _evict_expired(self) -> None:
+        """
+        Discards the jobs which finished more than `ttl` seconds ago. Must be called while holding the lock.
+        """
+        now: float = time.time()
+        for job_id in [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished and now - job.finished_at > self.ttl
+        ]:
+            del self._jobs[job_id]
+            del self._events[job_id]
+            self.evictions += 1
+
+
+    def submit(self, **kwargs) -> TraversalJob:
+        """
+        Submits a graph traversal.
+
+        Parameters
+        ----------
+        **kwargs
+            Arguments of [`brightwebapp.traversal.perform_graph_traversal`][]
+            (except `return_format` and `progress_callback`).
+
+        Returns
+        -------
+        TraversalJob
+            The queued job.
+        """
+        job = TraversalJob(id=uuid.uuid4().hex)
+        with self._lock:
+            self._evict_expired()
+            self._jobs[job.id] = job
+            self._events[job.id] = threading.Event()
+        self._executor.submit(self._run, job, kwargs)
+        return job
+
+
+    def _run(self, job: TraversalJob, kwargs: dict) -> None:
+        """
+        Performs the graph traversal of a job in a worker thread.
+        """
+        job.started_at = time.time()
+        job.status = 'running'
+        status: str = 'done'
+        try:
+            job.result = perform_graph_traversal(
+                return_format='traversal_result',
+                progress_callback=job._set_progress,
+                **kwargs,
+            )
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            status = 'failed'
+        # `finished_at` must be set before the status, see `_evict_expired`
+        job.finished_at = time.time()
+        job.status = status
+        self._events[job.id].set()
+
+
+    def get(self, job_id: str) -> Optional[TraversalJob]:
+        """
+        Returns a job, or `None` if the job does not exist or has expired.
+
+        Parameters
+        ----------
+        job_id : str
+            Unique identifier of the job.
+        """
+        with self._lock:
+            self._evict_expired()
+            return self._jobs.get(job_id)
+
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[TraversalJob]:
+        """
+        Waits until a job has finished and returns it.
+
+        Parameters
+        ----------
+        job_id : str
+            Unique identifier of the job.
+        timeout : float | None, optional
+            Maximum time to wait in seconds. If `None`, waits indefinitely.
+
+        Returns
+        -------
+        TraversalJob | None
+            The job (which may still be running if the timeout expired),
+            or `None` if the job does not exist or has expired.
+        """
+        with self._lock:
+            event: Optional[threading.Event] = self._events.get(job_id)
+        if event is None:
+            return None
+        event.wait(timeout)
+        return self._jobs.get(job_id)
+
+
+    def stats(self) -> dict:
+        """
+        Returns a dictionary with the number of jobs per status and the number of evicted jobs.
+        """
+        with self._lock:
+            self._evict_expired()
+            statuses: list = [job.status for job in self._jobs.values()]
+        return {
+            'queued': statuses.count('queued'),
+            'running': statuses.count('running'),
+            'done': statuses.count('done'),
+            'failed': statuses.count('failed'),
+            'evictions': self.evictions,
+            'max_workers': self.max_workers,
+            'ttl': self.ttl,
+        }
+
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the worker threads. Queued jobs which have not started are cancelled.
+
+        Parameters
+        ----------
+        wait : bool
+            If `True`, waits until the running jobs have finished.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
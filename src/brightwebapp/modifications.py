@@ -1,5 +1,40 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional, Union
+
 import pandas as pd
 import numpy as np
+import bw2calc as bc
+from scipy.sparse import coo_matrix
+from scipy.sparse.linalg import spsolve
+
+from brightwebapp.dense import DenseInverseLCA, _contributions, _direct_intensity
+from brightwebapp.traversal import TraversalResult
+
+
+def _user_values(df_original: pd.DataFrame, df_user_input: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the supply amounts and burden intensities of `df_user_input`
+    in the row order of `df_original`, with `NaN` where they are equal to the original values.
+
+    Raises
+    ------
+    ValueError
+        If the set of UIDs in `df_original` and `df_user_input` do
+        not match exactly.
+    """
+    uids_original: np.ndarray = df_original['UID'].to_numpy()
+    uids_user_input: np.ndarray = df_user_input['UID'].to_numpy()
+    if set(uids_original) != set(uids_user_input):
+        raise ValueError("UIDs in original and user input dataframes do not match.")
+    # tables edited in the web application keep the row order
+    rows = slice(None) if np.array_equal(uids_original, uids_user_input) else pd.Index(uids_user_input).get_indexer(uids_original)
+    values: list = []
+    for column_name in ['SupplyAmount', 'BurdenIntensity']:
+        original: np.ndarray = df_original[column_name].to_numpy(dtype=float)
+        user_input: np.ndarray = df_user_input[column_name].to_numpy(dtype=float)[rows]
+        values.append(np.where(user_input != original, user_input, np.nan))
+    return values[0], values[1]
 
 
 def _create_user_input_columns(
@@ -55,25 +90,10 @@ def _create_user_input_columns(
         If the set of UIDs in `df_original` and `df_user_input` do
         not match exactly.
     """
-    uids_original = set(df_original['UID'])
-    uids_user_input = set(df_user_input['UID'])
-
-    if uids_original != uids_user_input:
-        raise ValueError("UIDs in original and user input dataframes do not match.")
-
-    df_merged = pd.merge(
-        df_original,
-        df_user_input[['UID', 'SupplyAmount', 'BurdenIntensity']],
-        on='UID',
-        how='left',
-        suffixes=('', '_USER')
-    )
-    for column_name in ['SupplyAmount', 'BurdenIntensity']:
-        df_merged[f'{column_name}_USER'] = np.where(
-            df_merged[f'{column_name}_USER'] != df_merged[f'{column_name}'],
-            df_merged[f'{column_name}_USER'],
-            np.nan
-        )
+    supply_user, intensity_user = _user_values(df_original=df_original, df_user_input=df_user_input)
+    df_merged = df_original.reset_index(drop=True)
+    df_merged['SupplyAmount_USER'] = supply_user
+    df_merged['BurdenIntensity_USER'] = intensity_user
     return df_merged
 
 
@@ -113,6 +133,150 @@ def _update_burden_intensity_based_on_user_data(df: pd.DataFrame) -> pd.DataFram
     return df
 
 
+def _parents_from_branches(uids: np.ndarray, branches: np.ndarray) -> np.ndarray:
+    """
+    Returns the row position of the parent of every row of a table of graph traversal nodes, or -1 for the root node.
+
+    The parent of a node is the second-to-last node of its `Branch`
+    (see [`brightwebapp.traversal._add_branch_information_to_edges_dataframe`][]).
+    If the parent is not in the table, the nearest upstream node of the branch which is in the table is used instead.
+
+    Parameters
+    ----------
+    uids : np.ndarray
+        Unique identifiers of the nodes (`UID` column).
+    branches : np.ndarray
+        Branches of the nodes (`Branch` column). Branches which are not lists (e.g. `NaN`) have no parent.
+
+    Returns
+    -------
+    np.ndarray
+        Row positions of the parents.
+    """
+    index = pd.Index(uids)
+    parent_uids: list = [branch[-2] if isinstance(branch, list) and len(branch) > 1 else None for branch in branches]
+    parents: np.ndarray = index.get_indexer(pd.Index(parent_uids, dtype=object))
+    # branches through nodes which are not in the table are searched node by node
+    for row in np.flatnonzero((parents < 0) & np.fromiter((uid is not None for uid in parent_uids), dtype=bool, count=len(parent_uids))):
+        positions: np.ndarray = index.get_indexer(branches[row][:-1])
+        positions = positions[positions >= 0]
+        parents[row] = positions[-1] if len(positions) else -1
+    return parents
+
+
+def _branch_depths(branches: np.ndarray) -> np.ndarray:
+    """
+    Returns the length of every branch (`0` for branches which are not lists, e.g. the `NaN` branch of the root node).
+    """
+    return np.fromiter(
+        (len(branch) if isinstance(branch, list) else 0 for branch in branches),
+        dtype=np.int64,
+        count=len(branches),
+    )
+
+
+def _nearest_edited_ancestors(parents: np.ndarray, depths: np.ndarray, edited: np.ndarray) -> np.ndarray:
+    """
+    Returns the row position of the nearest upstream node with an edited supply amount of every row (-1 if none),
+    in one top-down pass over the depths of the rows.
+
+    Parameters
+    ----------
+    parents : np.ndarray
+        Row positions of the parents (see [`brightwebapp.modifications._parents_from_branches`][]).
+    depths : np.ndarray
+        Depths of the rows. The depth of a row must be larger than the depth of its parent.
+    edited : np.ndarray
+        Boolean array of the rows with an edited supply amount, of shape `(rows,)` or `(scenarios, rows)`.
+
+    Returns
+    -------
+    np.ndarray
+        Row positions of the nearest edited upstream nodes, of the same shape as `edited`.
+    """
+    ancestors: np.ndarray = np.full(edited.shape, -1, dtype=np.int64)
+    order: np.ndarray = np.argsort(depths, kind='stable')
+    for rows in np.split(order, np.flatnonzero(np.diff(depths[order])) + 1) if len(order) else []:
+        rows = rows[parents[rows] >= 0]
+        parents_of_rows: np.ndarray = parents[rows]
+        ancestors[..., rows] = np.where(edited[..., parents_of_rows], parents_of_rows, ancestors[..., parents_of_rows])
+    return ancestors
+
+
+def _has_branch(branches: np.ndarray) -> np.ndarray:
+    """
+    Returns `True` for every branch which is a list (`False` e.g. for the `NaN` branch of the root node).
+    """
+    return np.fromiter((isinstance(branch, list) for branch in branches), dtype=bool, count=len(branches))
+
+
+def _propagate_supply(
+    supply: np.ndarray,
+    supply_user: np.ndarray,
+    parents: np.ndarray,
+    depths: np.ndarray,
+    has_branch: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the supply amounts of all rows after the user edits `supply_user` (`NaN` if not edited)
+    and whether the supply amount of a row was updated because an upstream node was edited
+    (see [`brightwebapp.modifications._update_production_based_on_user_data`][]).
+
+    Parameters
+    ----------
+    supply : np.ndarray
+        Original supply amounts, of shape `(rows,)`.
+    supply_user : np.ndarray
+        Edited supply amounts, of shape `(rows,)` or `(scenarios, rows)`.
+    parents, depths, has_branch : np.ndarray
+        Parents (see [`brightwebapp.modifications._parents_from_branches`][]), depths and existence of the branches of the rows.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Supply amounts and updated rows, of the same shape as `supply_user`.
+    """
+    edited: np.ndarray = ~np.isnan(supply_user)
+    ancestors: np.ndarray = _nearest_edited_ancestors(parents=parents, depths=depths, edited=edited)
+    updated: np.ndarray = has_branch & ~edited & (ancestors >= 0)
+    ancestors = np.where(updated, ancestors, 0)
+    supply_original_upstream: np.ndarray = supply[ancestors]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        supply_scaled: np.ndarray = np.where(
+            supply_original_upstream == 0,
+            0,
+            supply * (np.take_along_axis(supply_user, ancestors, axis=-1) / supply_original_upstream),
+        )
+    return np.where(edited, supply_user, np.where(updated, supply_scaled, supply)), updated
+
+
+def _subtree_sums(parents: np.ndarray, depths: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Returns the sum of `values` over every row and all rows downstream of it,
+    in one bottom-up pass over the depths of the rows.
+
+    Parameters
+    ----------
+    parents : np.ndarray
+        Row positions of the parents (see [`brightwebapp.modifications._parents_from_branches`][]).
+    depths : np.ndarray
+        Depths of the rows. The depth of a row must be larger than the depth of its parent.
+    values : np.ndarray
+        Values of the rows.
+
+    Returns
+    -------
+    np.ndarray
+        Sums over the subtrees of the rows.
+    """
+    sums: np.ndarray = values.copy()
+    order: np.ndarray = np.argsort(depths, kind='stable')
+    for rows in reversed(np.split(order, np.flatnonzero(np.diff(depths[order])) + 1)):
+        rows = rows[parents[rows] >= 0]
+        np.add.at(sums, parents[rows], sums[rows])
+    return sums
+
+
 def _update_production_based_on_user_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Updates the production amount of all nodes which are upstream
@@ -161,50 +325,37 @@ def _update_production_based_on_user_data(df: pd.DataFrame) -> pd.DataFrame:
 
     In this case, the function takes the 'production_user' value of node 4, not of node 1.
 
+    The nearest edited upstream node of every node is found from parent pointers
+    (the parent of a node is the second-to-last node of its branch), in one pass over the nodes
+    ordered by depth: a node inherits the nearest edited upstream node of its parent,
+    unless the parent itself was edited. The supply amounts are then scaled as array operations.
+    This requires one Python pass over the rows (to read the parents) and one array operation per depth,
+    compared to `O(n · edits · depth)` Python operations for a walk along the branch of every node.
+
     Parameters
     ----------
     df : pd.DataFrame
-        Input DataFrame. Must have the columns 'production', 'production_user' and 'branch'.
+        Input DataFrame. Must have the columns 'UID', 'SupplyAmount', 'SupplyAmount_USER' and 'Branch'.
 
     Returns
     -------
     pd.DataFrame
         Output DataFrame.
     """
-    df_filtered = df.dropna(subset=['SupplyAmount_USER'])
-    dict_user_input = df_filtered.set_index('UID')['SupplyAmount_USER'].to_dict()
-    dict_original_amount = df.set_index('UID')['SupplyAmount'].to_dict()
-    
     df_copy = df.copy()
+    branches: np.ndarray = df_copy['Branch'].to_numpy()
+    supply_edited, updated = _propagate_supply(
+        supply=df_copy['SupplyAmount'].to_numpy(dtype=float),
+        supply_user=df_copy['SupplyAmount_USER'].to_numpy(dtype=float),
+        parents=_parents_from_branches(df_copy['UID'].to_numpy(), branches),
+        depths=_branch_depths(branches),
+        has_branch=_has_branch(branches),
+    )
 
-    def get_new_values(row) -> tuple[float, bool]:
-        if not pd.isna(row['SupplyAmount_USER']):
-            return (row['SupplyAmount_USER'], False)
-        
-        elif not isinstance(row['Branch'], list):
-            return (row['SupplyAmount'], False)
-        
-        elif set(dict_user_input.keys()).intersection(row['Branch']):
-            for branch_UID in reversed(row['Branch']):
-                if branch_UID in dict_user_input:
-                    original_upstream = dict_original_amount[branch_UID]
-                    user_upstream = dict_user_input[branch_UID]
-
-                    if original_upstream == 0:
-                        return (0, True) 
-                    else:
-                        new_amount = row['SupplyAmount'] * (user_upstream / original_upstream)
-                        return (new_amount, True) 
-        
-        else:
-            return (row['SupplyAmount'], False)
-
-    results = df_copy.apply(get_new_values, axis=1)
-    df_copy[['SupplyAmount_EDITED', 'Updated?']] = pd.DataFrame(results.tolist(), index=df_copy.index)
+    df_copy['SupplyAmount'] = supply_edited
+    df_copy['Updated?'] = updated
+    df_copy.drop(columns=['SupplyAmount_USER'], inplace=True)
 
-    df_copy['SupplyAmount'] = df_copy['SupplyAmount_EDITED']
-    df_copy.drop(columns=['SupplyAmount_USER', 'SupplyAmount_EDITED'], inplace=True)
-    
     return df_copy
 
 
@@ -252,4 +403,1194 @@ def _determine_edited_rows(df: pd.DataFrame) -> pd.DataFrame:
     | 3   | NaN               | NaN                  | False   |
     """
     df['Edited?'] = df[['SupplyAmount_USER', 'BurdenIntensity_USER']].notnull().any(axis=1)
-    return df
\ No newline at end of file
+    return df
+
+def apply_user_modifications(df_original: pd.DataFrame, df_user_input: pd.DataFrame) -> pd.DataFrame:
+    """
+    Applies the user edits of a graph traversal table and returns the updated table.
+
+    Returns the same table as the user-edit pipeline
+
+    1. [`brightwebapp.modifications._create_user_input_columns`][]
+    2. [`brightwebapp.modifications._determine_edited_rows`][]
+    3. [`brightwebapp.modifications._update_burden_intensity_based_on_user_data`][]
+    4. [`brightwebapp.modifications._update_production_based_on_user_data`][]
+    5. [`brightwebapp.modifications._update_burden_based_on_user_data`][]
+
+    but computes all columns on arrays, without merging the tables or creating intermediate tables.
+    The returned table shares all other columns with `df_original` (which is not modified),
+    so that an update allocates only the columns
+    `'SupplyAmount', 'BurdenIntensity', 'Burden(Direct)', 'Edited?', 'Updated?'`.
+
+    Parameters
+    ----------
+    df_original : pd.DataFrame
+        Original table of the graph traversal.
+        Must have at least columns `'UID', 'SupplyAmount', 'BurdenIntensity', 'Branch'`.
+    df_user_input : pd.DataFrame
+        Table edited by the user, in any row order.
+        Must have at least columns `'UID', 'SupplyAmount', 'BurdenIntensity'`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Original table with the updated columns `'SupplyAmount', 'BurdenIntensity', 'Burden(Direct)'`
+        and the additional columns `'Edited?'` and `'Updated?'`.
+
+    Raises
+    ------
+    ValueError
+        If the set of UIDs in `df_original` and `df_user_input` do
+        not match exactly.
+    """
+    supply_user, intensity_user = _user_values(df_original=df_original, df_user_input=df_user_input)
+    branches: np.ndarray = df_original['Branch'].to_numpy()
+    supply, updated = _propagate_supply(
+        supply=df_original['SupplyAmount'].to_numpy(dtype=float),
+        supply_user=supply_user,
+        parents=_parents_from_branches(df_original['UID'].to_numpy(), branches),
+        depths=_branch_depths(branches),
+        has_branch=_has_branch(branches),
+    )
+    intensity: np.ndarray = np.where(np.isnan(intensity_user), df_original['BurdenIntensity'].to_numpy(dtype=float), intensity_user)
+
+    df: pd.DataFrame = df_original.copy(deep=False)
+    df.index = pd.RangeIndex(len(df))
+    df['SupplyAmount'] = supply
+    df['BurdenIntensity'] = intensity
+    df['Edited?'] = ~np.isnan(supply_user) | ~np.isnan(intensity_user)
+    df['Updated?'] = updated
+    df['Burden(Direct)'] = supply * intensity
+    return df
+
+
+def compute_sensitivities(df: pd.DataFrame, score: Optional[float] = None) -> pd.DataFrame:
+    """
+    Returns the derivatives of the total score with respect to the supply amount and the burden intensity
+    of every node of a graph traversal table, ranked by their relative effect on the total score.
+
+    The derivatives follow the propagation of user edits
+    (see [`brightwebapp.modifications.apply_user_modifications`][]):
+    changing the supply amount $s_k$ of a node $k$ scales the supply amounts of all nodes downstream of it
+    (along `Branch`) by the same ratio. The total score $T$ therefore changes by
+
+    $$
+    \\frac{\\partial T}{\\partial s_k} = \\frac{1}{s_k} \\sum_{d \\in D_k} s_d \\beta_d,
+    \\qquad
+    \\frac{\\partial T}{\\partial \\beta_k} = s_k,
+    $$
+
+    where $D_k$ are the node $k$ and all nodes downstream of it and $\\beta$ are the burden intensities.
+    (If $s_k = 0$, the nodes downstream are set to zero and $\\partial T / \\partial s_k = \\beta_k$.)
+    The sums over all subtrees are computed in one bottom-up pass over the depths of the nodes.
+
+    The elasticities $\\frac{s_k}{T} \\frac{\\partial T}{\\partial s_k}$ and $\\frac{\\beta_k}{T} \\frac{\\partial T}{\\partial \\beta_k}$
+    are the relative changes of the total score per relative change of the supply amount or burden intensity:
+    an elasticity of `0.3` means that a 10% lower supply amount lowers the total score by 3%.
+
+    Example
+    -------
+    ```python
+    >>> compute_sensitivities(df=df_traversal, score=lca.score).head(3)
+       UID  ...  Sensitivity(SupplyAmount)  Sensitivity(BurdenIntensity)  Elasticity(SupplyAmount)  Elasticity(BurdenIntensity)
+    0    0  ...                    1374.66                          1.00                      1.00                         0.00
+    1    1  ...                      88.69                         15.50                      1.00                         0.30
+    2    2  ...                      11.29                         85.25                      0.70                         0.69
+    ```
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Table of the graph traversal.
+        Must have the columns `'UID', 'SupplyAmount', 'BurdenIntensity', 'Branch'`.
+    score : float, optional
+        Total score to which the elasticities are relative (e.g. the life-cycle assessment score).
+        If `None`, the sum of the direct burden (`SupplyAmount * BurdenIntensity`) of the table is used.
+
+    Returns
+    -------
+    pd.DataFrame
+        The table with the additional columns
+        `'Sensitivity(SupplyAmount)', 'Sensitivity(BurdenIntensity)', 'Elasticity(SupplyAmount)', 'Elasticity(BurdenIntensity)'`,
+        sorted by decreasing absolute `'Elasticity(SupplyAmount)'`.
+    """
+    branches: np.ndarray = df['Branch'].to_numpy()
+    supply: np.ndarray = df['SupplyAmount'].to_numpy(dtype=float)
+    intensity: np.ndarray = df['BurdenIntensity'].to_numpy(dtype=float)
+    burden: np.ndarray = supply * intensity
+    burden_downstream: np.ndarray = _subtree_sums(
+        parents=_parents_from_branches(df['UID'].to_numpy(), branches),
+        depths=_branch_depths(branches),
+        values=burden,
+    )
+    total: float = float(burden.sum()) if score is None else float(score)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sensitivity_supply: np.ndarray = np.where(supply == 0, intensity, burden_downstream / supply)
+    df_sensitivities: pd.DataFrame = df.reset_index(drop=True)
+    df_sensitivities['Sensitivity(SupplyAmount)'] = sensitivity_supply
+    df_sensitivities['Sensitivity(BurdenIntensity)'] = supply
+    with np.errstate(divide='ignore', invalid='ignore'):
+        df_sensitivities['Elasticity(SupplyAmount)'] = supply * sensitivity_supply / total
+        df_sensitivities['Elasticity(BurdenIntensity)'] = burden / total
+    order: np.ndarray = np.argsort(-np.abs(df_sensitivities['Elasticity(SupplyAmount)'].to_numpy()), kind='stable')
+    return df_sensitivities.iloc[order].reset_index(drop=True)
+
+
+@dataclass
+class _EditDelta:
+    """
+    Change of the state of an [`brightwebapp.modifications.IncrementalEditor`][] by the edit of one cell:
+    the positions of the changed rows and the values of the state arrays at these rows before and after the edit.
+    """
+    rows: np.ndarray
+    before: tuple
+    after: tuple
+    burden_sum_before: float
+    burden_sum_after: float
+
+
+    @property
+    def nbytes(self) -> int:
+        return self.rows.nbytes + sum(array.nbytes for array in self.before + self.after)
+
+
+class IncrementalEditor:
+    """
+    Applies successive user edits of single cells of a graph traversal table
+    (see [`brightwebapp.traversal.perform_graph_traversal`][]),
+    recomputing only the rows which depend on the edited cell.
+
+    After every edit, [`brightwebapp.modifications.IncrementalEditor.to_dataframe`][] returns the same table
+    as [`brightwebapp.modifications.apply_user_modifications`][]
+    applied to the baseline table and a copy of it containing all edits so far,
+    except that rows which are neither edited nor updated keep the direct burden of the baseline table.
+    The direct burden of a graph traversal node also includes the burden of biosphere flows
+    outside the specific flows, which is not part of `SupplyAmount * BurdenIntensity`.
+
+    The rows of the table are stored in depth-first order of the tree of branches,
+    so that the descendants of a node are a contiguous slice of rows.
+    An edit of the burden intensity of a node changes only the node.
+    An edit of the supply amount of a node changes the node and those of its descendants
+    whose nearest edited upstream node is (or was) the node. The total score is updated by the change
+    of `SupplyAmount * BurdenIntensity` of these rows, so that the baseline (revision `0`) has the score `score`.
+
+    Every call of [`brightwebapp.modifications.IncrementalEditor.edit`][],
+    [`brightwebapp.modifications.IncrementalEditor.apply_edits`][] or
+    [`brightwebapp.modifications.IncrementalEditor.apply_dataframe`][] creates a new revision of the table
+    (the baseline is revision `0`). A revision is stored as the positions of the changed rows
+    and the values of the editor at these rows before and after the edits, not as a copy of the table,
+    so that undoing or redoing a revision only changes these rows
+    (see [`brightwebapp.modifications.IncrementalEditor.goto`][]).
+    Editing after an undo discards the undone revisions.
+
+    Example
+    -------
+    ```python
+    >>> editor = IncrementalEditor(df=df_traversal, score=lca.score)
+    >>> editor.edit(uid=12, field='SupplyAmount', value=0.5) # returns the changed rows
+    >>> editor.edit(uid=31, field='BurdenIntensity', value=2.1)
+    >>> editor.score
+    2.43
+    >>> editor.edit(uid=12, field='SupplyAmount', value=None) # reverts the edit
+    >>> editor.undo() # restores the edit
+    >>> editor.revision
+    2
+    >>> editor.goto(0) # baseline
+    >>> editor.to_dataframe()
+    ```
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Baseline table of the graph traversal.
+        Must have the columns `'UID', 'SupplyAmount', 'BurdenIntensity', 'Burden(Direct)', 'Branch'`.
+    score : float, optional
+        Life-cycle assessment score of the baseline. Includes the burden of nodes which are not in the table.
+        If `None`, the sum of the direct burden of the baseline table is used.
+    max_revisions : int | None, optional
+        Maximum number of revisions kept for undo. Older revisions can no longer be restored.
+        If `None`, all revisions are kept.
+    """
+    fields: tuple = ('SupplyAmount', 'BurdenIntensity')
+    # arrays which are changed by edits, and stored in the revisions
+    _state: tuple = ('_supply_user', '_intensity_user', '_intensity', '_ancestors', '_supply', '_updated', '_burden')
+
+    def __init__(self, df: pd.DataFrame, score: Optional[float] = None, max_revisions: Optional[int] = None):
+        self._df: pd.DataFrame = df.reset_index(drop=True)
+        self.uids: np.ndarray = self._df['UID'].to_numpy()
+        self._positions: pd.Index = pd.Index(self.uids)
+        if not self._positions.is_unique:
+            raise ValueError("UIDs of the table are not unique.")
+        self._supply_original: np.ndarray = self._df['SupplyAmount'].to_numpy(dtype=float)
+        self._intensity_original: np.ndarray = self._df['BurdenIntensity'].to_numpy(dtype=float)
+        branches: np.ndarray = self._df['Branch'].to_numpy()
+        self._parents: np.ndarray = _parents_from_branches(self.uids, branches)
+        self._preorder, self._order, self._ends = self._depth_first_order(self._parents, _branch_depths(branches))
+
+        number_of_rows: int = len(self._df)
+        self._supply: np.ndarray = self._supply_original.copy()
+        self._intensity: np.ndarray = self._intensity_original.copy()
+        self._supply_user: np.ndarray = np.full(number_of_rows, np.nan)
+        self._intensity_user: np.ndarray = np.full(number_of_rows, np.nan)
+        # nearest upstream node with an edited supply amount (row position, -1 if none)
+        self._ancestors: np.ndarray = np.full(number_of_rows, -1, dtype=np.int64)
+        self._updated: np.ndarray = np.zeros(number_of_rows, dtype=bool)
+        self._burden: np.ndarray = self._supply * self._intensity
+        self._burden_sum: float = float(self._burden.sum())
+        self._baseline_burden_sum: float = self._burden_sum
+        self._burden_original: np.ndarray = self._df['Burden(Direct)'].to_numpy(dtype=float)
+        self._baseline_score: float = float(self._burden_original.sum()) if score is None else float(score)
+
+        self.max_revisions: Optional[int] = max_revisions
+        # revisions after `oldest_revision`, as lists of `_EditDelta`; the first `_position` revisions are applied
+        self._history: list = []
+        self._position: int = 0
+        self.oldest_revision: int = 0
+        self._deltas: Optional[list] = None
+
+
+    @staticmethod
+    def _depth_first_order(parents: np.ndarray, depths: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the preorder position of every row, the rows in preorder
+        and the preorder position after the last descendant of every row,
+        so that the descendants of row `i` are `order[preorder[i] + 1:ends[i]]`.
+
+        Rows are processed level by level, where the depth of a row must be larger than the depth of its parent.
+        """
+        number_of_rows: int = len(parents)
+        has_parent: np.ndarray = parents >= 0
+        sizes: np.ndarray = _subtree_sums(parents=parents, depths=depths, values=np.ones(number_of_rows, dtype=np.int64))
+
+        # siblings are ordered by row; the subtree of a row starts after the subtrees of its earlier siblings
+        preorder: np.ndarray = np.empty(number_of_rows, dtype=np.int64)
+        roots: np.ndarray = np.flatnonzero(~has_parent)
+        preorder[roots] = np.cumsum(sizes[roots]) - sizes[roots]
+        children: np.ndarray = np.flatnonzero(has_parent)
+        parent_depths: np.ndarray = depths[parents[children]]
+        children = children[np.lexsort((children, parents[children], parent_depths))]
+        parent_depths = depths[parents[children]]
+        for rows in np.split(children, np.flatnonzero(np.diff(parent_depths)) + 1) if len(children) else []:
+            parents_of_rows: np.ndarray = parents[rows]
+            offsets: np.ndarray = np.cumsum(sizes[rows]) - sizes[rows]
+            first_siblings: np.ndarray = np.flatnonzero(np.r_[True, parents_of_rows[1:] != parents_of_rows[:-1]])
+            offsets -= np.repeat(offsets[first_siblings], np.diff(np.r_[first_siblings, len(rows)]))
+            preorder[rows] = preorder[parents_of_rows] + 1 + offsets
+        order: np.ndarray = np.empty(number_of_rows, dtype=np.int64)
+        order[preorder] = np.arange(number_of_rows)
+        return preorder, order, preorder + sizes
+
+
+    @property
+    def score(self) -> float:
+        """
+        Life-cycle assessment score including all edits.
+        """
+        return self._baseline_score + self._burden_sum - self._baseline_burden_sum
+
+
+    @property
+    def revision(self) -> int:
+        """
+        Current revision of the table (`0` for the baseline).
+        """
+        return self.oldest_revision + self._position
+
+
+    @property
+    def latest_revision(self) -> int:
+        """
+        Latest revision of the table, which can be restored with [`brightwebapp.modifications.IncrementalEditor.redo`][].
+        """
+        return self.oldest_revision + len(self._history)
+
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Size of the baseline table, of the arrays of the editor and of the stored revisions in bytes.
+        """
+        return int(self._df.memory_usage(deep=True).sum()) + sum(
+            value.nbytes for value in vars(self).values() if isinstance(value, np.ndarray)
+        ) + sum(delta.nbytes for deltas in self._history for delta in deltas)
+
+
+    def _snapshot(self, rows: np.ndarray) -> tuple:
+        return tuple(getattr(self, name)[rows] for name in self._state)
+
+
+    def _restore(self, rows: np.ndarray, values: tuple, burden_sum: float) -> None:
+        for name, array in zip(self._state, values):
+            getattr(self, name)[rows] = array
+        self._burden_sum = burden_sum
+
+
+    @contextmanager
+    def _revision(self):
+        """
+        Collects the deltas of the edits made within the context into a new revision.
+        """
+        self._deltas = []
+        try:
+            yield
+        finally:
+            deltas, self._deltas = self._deltas, None
+            if deltas:
+                del self._history[self._position:]
+                self._history.append(deltas)
+                self._position += 1
+                if self.max_revisions is not None and len(self._history) > self.max_revisions:
+                    del self._history[0]
+                    self._position -= 1
+                    self.oldest_revision += 1
+
+
+    def _recompute_supply(self, rows: np.ndarray) -> None:
+        """
+        Recomputes the supply amount and direct burden of `rows` from their nearest edited upstream node.
+        """
+        ancestors: np.ndarray = self._ancestors[rows]
+        edited: np.ndarray = ~np.isnan(self._supply_user[rows])
+        updated: np.ndarray = ~edited & (ancestors >= 0)
+        supply: np.ndarray = np.where(edited, self._supply_user[rows], self._supply_original[rows])
+        supply_original_upstream: np.ndarray = self._supply_original[ancestors[updated]]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            supply[updated] = np.where(
+                supply_original_upstream == 0,
+                0,
+                self._supply_original[rows[updated]] * (self._supply_user[ancestors[updated]] / supply_original_upstream),
+            )
+        self._supply[rows] = supply
+        self._updated[rows] = updated
+        self._recompute_burden(rows)
+
+
+    def _recompute_burden(self, rows: np.ndarray) -> None:
+        burden: np.ndarray = self._supply[rows] * self._intensity[rows]
+        self._burden_sum += float((burden - self._burden[rows]).sum())
+        self._burden[rows] = burden
+
+
+    def edit(self, uid, field: str, value: Optional[float]) -> pd.DataFrame:
+        """
+        Sets the supply amount or burden intensity of a node and propagates the change.
+
+        As in [`brightwebapp.modifications._create_user_input_columns`][],
+        a value equal to the baseline value is not an edit. Setting the baseline value (or `None`)
+        therefore reverts an earlier edit of the cell.
+
+        Parameters
+        ----------
+        uid
+            UID of the node.
+        field : str
+            `'SupplyAmount'` or `'BurdenIntensity'`.
+        value : float | None
+            New value of the cell.
+
+        Returns
+        -------
+        pd.DataFrame
+            Rows of the table which have changed, as in [`brightwebapp.modifications.IncrementalEditor.to_dataframe`][].
+
+        Raises
+        ------
+        ValueError
+            If the UID is not in the table or the field cannot be edited.
+        """
+        row: int = self._row(uid, field)
+        with self._revision():
+            rows: np.ndarray = self._edit(row, field, value)
+        return self._rows_to_dataframe(rows)
+
+
+    def _row(self, uid, field: str) -> int:
+        """
+        Returns the row position of a node, after checking that the UID and the field can be edited.
+        """
+        if field not in self.fields:
+            raise ValueError(f"Field must be one of {self.fields}, but got '{field}'.")
+        row: int = self._positions.get_indexer([uid])[0]
+        if row < 0:
+            raise ValueError(f"UID {uid} is not in the table.")
+        return row
+
+
+    def _edit(self, row: int, field: str, value: Optional[float]) -> np.ndarray:
+        """
+        Edits a cell, records the change in the current revision and returns the recomputed rows.
+        """
+        value = np.nan if value is None else float(value)
+        if field == 'BurdenIntensity':
+            changed: np.ndarray = np.array([row])
+            before: tuple = self._snapshot(changed)
+            burden_sum_before: float = self._burden_sum
+            self._intensity_user[row] = np.nan if value == self._intensity_original[row] else value
+            self._intensity[row] = self._intensity_original[row] if np.isnan(self._intensity_user[row]) else value
+            rows: np.ndarray = changed
+            self._recompute_burden(rows)
+        else:
+            was_edited: bool = not np.isnan(self._supply_user[row])
+            descendants: np.ndarray = self._order[self._preorder[row] + 1:self._ends[row]]
+            if was_edited:
+                # descendants downstream of another edited node within the subtree are not affected
+                affected: np.ndarray = descendants[self._ancestors[descendants] == row]
+            else:
+                affected = descendants[self._ancestors[descendants] == self._ancestors[row]]
+            changed = np.concatenate([[row], affected])
+            before = self._snapshot(changed)
+            burden_sum_before = self._burden_sum
+            self._supply_user[row] = np.nan if value == self._supply_original[row] else value
+            is_edited: bool = not np.isnan(self._supply_user[row])
+            self._ancestors[affected] = row if is_edited else self._ancestors[row]
+            # the supply amount of edited descendants does not depend on upstream nodes
+            rows = np.concatenate([[row], affected[np.isnan(self._supply_user[affected])]])
+            self._recompute_supply(rows)
+        self._deltas.append(_EditDelta(
+            rows=changed,
+            before=before,
+            after=self._snapshot(changed),
+            burden_sum_before=burden_sum_before,
+            burden_sum_after=self._burden_sum,
+        ))
+        return rows
+
+
+    def apply_edits(self, edits: list) -> pd.DataFrame:
+        """
+        Applies several edits of single cells, in order, as one revision.
+
+        Parameters
+        ----------
+        edits : list
+            Edits as `(uid, field, value)` tuples, see [`brightwebapp.modifications.IncrementalEditor.edit`][].
+
+        Returns
+        -------
+        pd.DataFrame
+            Rows of the table which have changed.
+
+        Raises
+        ------
+        ValueError
+            If a UID is not in the table or a field cannot be edited. No edit is applied.
+        """
+        rows: list = [self._row(uid, field) for uid, field, _ in edits]
+        with self._revision():
+            changed: list = [self._edit(row, field, value) for row, (_, field, value) in zip(rows, edits)]
+        return self._rows_to_dataframe(np.unique(np.concatenate(changed)) if changed else np.array([], dtype=np.int64))
+
+
+    def goto(self, revision: int) -> pd.DataFrame:
+        """
+        Restores a revision of the table, by undoing or redoing the revisions in between.
+        Only the rows changed by these revisions are restored.
+
+        Parameters
+        ----------
+        revision : int
+            Revision between [`brightwebapp.modifications.IncrementalEditor.oldest_revision`][]
+            and [`brightwebapp.modifications.IncrementalEditor.latest_revision`][].
+
+        Returns
+        -------
+        pd.DataFrame
+            Rows of the table which have changed.
+
+        Raises
+        ------
+        ValueError
+            If the revision is not available.
+        """
+        if not self.oldest_revision <= revision <= self.latest_revision:
+            raise ValueError(
+                f"Revision must be between {self.oldest_revision} and {self.latest_revision}, but got {revision}."
+            )
+        changed: list = []
+        while self.revision > revision:
+            self._position -= 1
+            for delta in reversed(self._history[self._position]):
+                self._restore(delta.rows, delta.before, delta.burden_sum_before)
+                changed.append(delta.rows)
+        while self.revision < revision:
+            for delta in self._history[self._position]:
+                self._restore(delta.rows, delta.after, delta.burden_sum_after)
+                changed.append(delta.rows)
+            self._position += 1
+        return self._rows_to_dataframe(np.unique(np.concatenate(changed)) if changed else np.array([], dtype=np.int64))
+
+
+    def undo(self) -> pd.DataFrame:
+        """
+        Restores the previous revision of the table, see [`brightwebapp.modifications.IncrementalEditor.goto`][].
+
+        Raises
+        ------
+        ValueError
+            If there is no revision to undo.
+        """
+        if self.revision == self.oldest_revision:
+            raise ValueError("There is no revision to undo.")
+        return self.goto(self.revision - 1)
+
+
+    def redo(self) -> pd.DataFrame:
+        """
+        Restores the next revision of the table, see [`brightwebapp.modifications.IncrementalEditor.goto`][].
+
+        Raises
+        ------
+        ValueError
+            If there is no revision to redo.
+        """
+        if self.revision == self.latest_revision:
+            raise ValueError("There is no revision to redo.")
+        return self.goto(self.revision + 1)
+
+
+    def apply_dataframe(self, df_user_input: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies all cells of `'SupplyAmount'` and `'BurdenIntensity'` of a table
+        which differ from the current state of the editor (e.g. a table edited by the user in the web application).
+        Rows upstream in the table are applied first.
+
+        Parameters
+        ----------
+        df_user_input : pd.DataFrame
+            Table with at least the columns `'UID', 'SupplyAmount', 'BurdenIntensity'`.
+
+        Returns
+        -------
+        pd.DataFrame
+            Rows of the table which have changed.
+
+        Raises
+        ------
+        ValueError
+            If the set of UIDs of the table and of the baseline do not match exactly.
+        """
+        if set(df_user_input['UID']) != set(self.uids):
+            raise ValueError("UIDs in original and user input dataframes do not match.")
+        rows: np.ndarray = self._positions.get_indexer(df_user_input['UID'])
+        changed: list = []
+        with self._revision():
+            for field, state in zip(self.fields, (self._supply, self._intensity)):
+                values: np.ndarray = df_user_input[field].to_numpy(dtype=float)
+                differs: np.ndarray = (values != state[rows]) & ~(np.isnan(values) & np.isnan(state[rows]))
+                for position in np.argsort(self._preorder[rows[differs]], kind='stable'):
+                    changed.append(self._edit(rows[differs][position], field, values[differs][position]))
+        return self._rows_to_dataframe(np.unique(np.concatenate(changed)) if changed else np.array([], dtype=np.int64))
+
+
+    def _rows_to_dataframe(self, rows: np.ndarray) -> pd.DataFrame:
+        df: pd.DataFrame = self._df.iloc[rows].copy()
+        df['SupplyAmount'] = self._supply[rows]
+        df['BurdenIntensity'] = self._intensity[rows]
+        edited: np.ndarray = ~np.isnan(self._supply_user[rows]) | ~np.isnan(self._intensity_user[rows])
+        updated: np.ndarray = self._updated[rows]
+        df['Burden(Direct)'] = np.where(edited | updated, self._burden[rows], self._burden_original[rows])
+        df['Edited?'] = edited
+        df['Updated?'] = updated
+        return df
+
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Returns the table including all edits, with the additional columns `'Edited?'` and `'Updated?'`
+        (see [`brightwebapp.modifications._determine_edited_rows`][]
+        and [`brightwebapp.modifications._update_production_based_on_user_data`][]).
+
+        Returns
+        -------
+        pd.DataFrame
+            Output DataFrame.
+        """
+        return self._rows_to_dataframe(np.arange(len(self._df)))
+
+
+@dataclass
+class ScenarioResults:
+    """
+    Results of [`brightwebapp.modifications.evaluate_scenarios`][].
+
+    Attributes
+    ----------
+    scores : pd.Series
+        Life-cycle assessment score of every scenario, indexed by scenario name.
+    supply : pd.DataFrame
+        Supply amount of every node (columns, by UID) in every scenario (rows, by scenario name).
+    burdens : pd.DataFrame
+        Direct burden of every node (columns, by UID) in every scenario (rows, by scenario name).
+    """
+    scores: pd.Series
+    supply: pd.DataFrame
+    burdens: pd.DataFrame
+
+
+def evaluate_scenarios(
+    df: pd.DataFrame,
+    scenarios: Union[dict, list],
+    score: Optional[float] = None,
+    chunk_size: int = 100,
+) -> ScenarioResults:
+    """
+    Evaluates many sets of user edits ("what-if" scenarios) of one graph traversal table at once.
+
+    Every scenario is a mapping of UIDs to the edited cells of the node, for instance
+
+    ```python
+    {
+        'supplier switch': {12: {'SupplyAmount': 0}, 31: {'SupplyAmount': 0.8}},
+        'efficiency gains': {7: {'BurdenIntensity': 0.9}},
+    }
+    ```
+
+    For every scenario, the supply amounts and direct burdens are the same as those of
+    [`brightwebapp.modifications.apply_user_modifications`][] applied to the table with the edits of the scenario,
+    except that rows which are neither edited nor updated keep the direct burden of the baseline table
+    (as in [`brightwebapp.modifications.IncrementalEditor`][]). A scenario without edits has the score `score`.
+    Instead of one copy of the table per scenario, the edits of all scenarios are stored in arrays
+    of shape `(scenarios, rows)`, and the nearest edited upstream node of every row in every scenario
+    is found in a single top-down pass over the depths of the rows
+    (see [`brightwebapp.modifications._nearest_edited_ancestors`][]).
+
+    Example
+    -------
+    ```python
+    >>> results = evaluate_scenarios(df=df_traversal, scenarios=scenarios, score=lca.score)
+    >>> results.scores
+    supplier switch     2.17
+    efficiency gains    2.38
+    dtype: float64
+    >>> results.burdens.loc['supplier switch', 31]
+    0.42
+    ```
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Baseline table of the graph traversal.
+        Must have the columns `'UID', 'SupplyAmount', 'BurdenIntensity', 'Burden(Direct)', 'Branch'`.
+    scenarios : dict | list
+        Scenarios, by name. If a list, the scenarios are named by their position.
+        Edited cells must be `'SupplyAmount'` or `'BurdenIntensity'`.
+        As in [`brightwebapp.modifications._create_user_input_columns`][], values equal to the baseline are not edits.
+    score : float, optional
+        Life-cycle assessment score of the baseline. Includes the burden of nodes which are not in the table.
+        If `None`, the sum of the direct burden of the baseline table is used.
+    chunk_size : int
+        Maximum number of scenarios evaluated in one pass, limiting the memory of intermediate arrays
+        to about `10 * 8 * chunk_size * rows` bytes.
+
+    Returns
+    -------
+    ScenarioResults
+        Scores, supply amounts and direct burdens of all scenarios.
+
+    Raises
+    ------
+    ValueError
+        If an edited UID is not in the table or an edited cell cannot be edited.
+    """
+    names: list = list(scenarios) if isinstance(scenarios, dict) else list(range(len(scenarios)))
+    edit_sets: list = list(scenarios.values()) if isinstance(scenarios, dict) else list(scenarios)
+    uids: np.ndarray = df['UID'].to_numpy()
+    positions = pd.Index(uids)
+    branches: np.ndarray = df['Branch'].to_numpy()
+    parents: np.ndarray = _parents_from_branches(uids, branches)
+    depths: np.ndarray = _branch_depths(branches)
+    has_branch: np.ndarray = _has_branch(branches)
+    originals: dict = {field: df[field].to_numpy(dtype=float) for field in IncrementalEditor.fields}
+    burden_original: np.ndarray = df['Burden(Direct)'].to_numpy(dtype=float)
+
+    # edits as (scenario, UID, field, value) columns
+    scenario_indices, edited_uids, fields, values = [], [], [], []
+    for scenario_index, edits in enumerate(edit_sets):
+        for uid, cells in edits.items():
+            for field, value in cells.items():
+                if field not in IncrementalEditor.fields:
+                    raise ValueError(f"Field must be one of {IncrementalEditor.fields}, but got '{field}'.")
+                scenario_indices.append(scenario_index)
+                edited_uids.append(uid)
+                fields.append(field)
+                values.append(np.nan if value is None else value)
+    rows: np.ndarray = positions.get_indexer(pd.Index(edited_uids, dtype=object))
+    if (rows < 0).any():
+        raise ValueError(f"UID {edited_uids[int(np.flatnonzero(rows < 0)[0])]} is not in the table.")
+    scenario_indices_array: np.ndarray = np.asarray(scenario_indices, dtype=np.int64)
+    fields_array: np.ndarray = np.asarray(fields, dtype=object)
+    values_array: np.ndarray = np.asarray(values, dtype=float)
+
+    supply: np.ndarray = np.empty((len(edit_sets), len(df)))
+    burdens: np.ndarray = np.empty((len(edit_sets), len(df)))
+    burden_sums: np.ndarray = np.empty(len(edit_sets))
+    for start in range(0, len(edit_sets), chunk_size):
+        stop: int = min(start + chunk_size, len(edit_sets))
+        in_chunk: np.ndarray = (scenario_indices_array >= start) & (scenario_indices_array < stop)
+        user: dict = {}
+        for field, original in originals.items():
+            user[field] = np.full((stop - start, len(df)), np.nan)
+            selected: np.ndarray = in_chunk & (fields_array == field)
+            user[field][scenario_indices_array[selected] - start, rows[selected]] = values_array[selected]
+            user[field][user[field] == original] = np.nan
+
+        supply[start:stop], updated = _propagate_supply(
+            supply=originals['SupplyAmount'],
+            supply_user=user['SupplyAmount'],
+            parents=parents,
+            depths=depths,
+            has_branch=has_branch,
+        )
+        intensity: np.ndarray = np.where(np.isnan(user['BurdenIntensity']), originals['BurdenIntensity'], user['BurdenIntensity'])
+        burden: np.ndarray = supply[start:stop] * intensity
+        burden_sums[start:stop] = burden.sum(axis=1)
+        changed: np.ndarray = updated | ~np.isnan(user['SupplyAmount']) | ~np.isnan(user['BurdenIntensity'])
+        burdens[start:stop] = np.where(changed, burden, burden_original)
+
+    baseline_burden_sum: float = float((originals['SupplyAmount'] * originals['BurdenIntensity']).sum())
+    baseline_score: float = float(burden_original.sum()) if score is None else float(score)
+    return ScenarioResults(
+        scores=pd.Series(baseline_score - baseline_burden_sum + burden_sums, index=names, dtype=float),
+        supply=pd.DataFrame(supply, index=names, columns=uids),
+        burdens=pd.DataFrame(burdens, index=names, columns=uids),
+    )
+
+
+@dataclass
+class MonteCarloResults:
+    """
+    Results of [`brightwebapp.modifications.simulate_user_modifications`][].
+
+    Attributes
+    ----------
+    scores : np.ndarray
+        Life-cycle assessment score of every iteration.
+    score_percentiles : pd.Series
+        Percentiles of the score, indexed by percentile.
+    supply : pd.DataFrame
+        Percentiles of the supply amount of every node (columns, by UID) by percentile (rows).
+    burdens : pd.DataFrame
+        Percentiles of the direct burden of every node (columns, by UID) by percentile (rows).
+    """
+    scores: np.ndarray
+    score_percentiles: pd.Series
+    supply: pd.DataFrame
+    burdens: pd.DataFrame
+
+
+_DISTRIBUTIONS: tuple = ('normal', 'lognormal', 'uniform', 'triangular')
+
+
+def _scaled_percentiles(
+    coefficients: np.ndarray,
+    columns: np.ndarray,
+    percentiles: np.ndarray,
+    percentiles_reversed: np.ndarray,
+) -> np.ndarray:
+    """
+    Returns the percentiles of `coefficients * samples[:, columns]`,
+    given the `percentiles` of the columns of the samples and the percentiles at `100 - q` (`percentiles_reversed`).
+    A negative coefficient reverses the order of the samples.
+    """
+    return np.where(
+        coefficients >= 0,
+        coefficients * percentiles[:, columns],
+        coefficients * percentiles_reversed[:, columns],
+    )
+
+
+def simulate_user_modifications(
+    df_original: pd.DataFrame,
+    df_user_input: Optional[pd.DataFrame] = None,
+    distributions: Optional[dict] = None,
+    relative_uncertainty: Optional[float] = None,
+    iterations: int = 10_000,
+    percentiles: tuple = (2.5, 50, 97.5),
+    score: Optional[float] = None,
+    seed: Optional[int] = None,
+) -> MonteCarloResults:
+    """
+    Propagates the uncertainty of user edits of a graph traversal table to the supply amounts and direct burdens
+    of the nodes and to the total score, by Monte Carlo simulation.
+
+    Every edited cell (a supply amount or burden intensity of `df_user_input` which differs from `df_original`,
+    or a cell with a distribution in `distributions`) is drawn `iterations` times from
+
+    - its distribution in `distributions`, if any,
+    - a normal distribution with the edited value as mean and `relative_uncertainty` times its absolute value
+      as standard deviation, if `relative_uncertainty` is provided,
+    - otherwise, the edited value itself.
+
+    Every iteration is propagated as in [`brightwebapp.modifications.apply_user_modifications`][],
+    except that rows which are neither edited nor updated keep the direct burden of `df_original`
+    (as in [`brightwebapp.modifications.IncrementalEditor`][]). Without edits, every iteration has the score `score`.
+    Since the set of edited cells is the same in all iterations, the supply amount of every node
+    is either its own sample, or its original supply amount scaled by the sampled ratio of its nearest edited upstream node.
+    The nearest edited upstream nodes are found once, and the direct burdens of all nodes
+    whose burden intensity is not edited are summed per upstream node.
+    An iteration is therefore a product of the samples with one weight per edited cell,
+    and the memory is of the order of `iterations * edited cells` instead of `iterations * rows`.
+    The percentiles of these nodes are the percentiles of the sampled ratios, scaled by their supply amount or direct burden.
+
+    Example
+    -------
+    ```python
+    >>> results = simulate_user_modifications(
+    ...     df_original=df_traversal,
+    ...     df_user_input=df_tabulator,
+    ...     distributions={31: {'BurdenIntensity': {'distribution': 'lognormal', 'mean': -0.1, 'sigma': 0.2}}},
+    ...     relative_uncertainty=0.1,
+    ...     score=lca.score,
+    ... )
+    >>> results.score_percentiles
+    2.5     2.01
+    50.0    2.17
+    97.5    2.36
+    dtype: float64
+    >>> results.burdens[31]
+    2.5     0.31
+    50.0    0.42
+    97.5    0.57
+    Name: 31, dtype: float64
+    ```
+
+    Parameters
+    ----------
+    df_original : pd.DataFrame
+        Table of the graph traversal.
+        Must have the columns `'UID', 'SupplyAmount', 'BurdenIntensity', 'Burden(Direct)', 'Branch'`.
+    df_user_input : pd.DataFrame, optional
+        Table edited by the user, with the same UIDs as `df_original`.
+        If `None`, only the cells in `distributions` are edited.
+    distributions : dict, optional
+        Distributions of edited cells, as a mapping of UIDs to fields (`'SupplyAmount'` or `'BurdenIntensity'`) to a dictionary
+        with the name of the distribution (`'distribution'`: one of `'normal'`, `'lognormal'`, `'uniform'`, `'triangular'`)
+        and the arguments of the corresponding method of `numpy.random.Generator`, for instance
+        `{12: {'SupplyAmount': {'distribution': 'uniform', 'low': 0.4, 'high': 0.6}}}`.
+    relative_uncertainty : float, optional
+        Relative standard deviation of the edited cells without a distribution.
+    iterations : int
+        Number of iterations.
+    percentiles : tuple
+        Percentiles (between 0 and 100) returned for the score and every node.
+    score : float, optional
+        Life-cycle assessment score of `df_original`. Includes the burden of nodes which are not in the table.
+        If `None`, the sum of the direct burden of `df_original` is used.
+    seed : int, optional
+        Seed of the random number generator.
+
+    Returns
+    -------
+    MonteCarloResults
+        Scores of all iterations and percentiles of the score, supply amounts and direct burdens.
+
+    Raises
+    ------
+    ValueError
+        If `iterations` is smaller than 1, the UIDs of the tables do not match,
+        or a distribution refers to a UID which is not in the table, to a field which cannot be edited
+        or to an unknown distribution.
+    """
+    if iterations < 1:
+        raise ValueError(f"Expected at least 1 iteration, but got {iterations}.")
+    uids: np.ndarray = df_original['UID'].to_numpy()
+    positions = pd.Index(uids)
+    branches: np.ndarray = df_original['Branch'].to_numpy()
+    parents: np.ndarray = _parents_from_branches(uids, branches)
+    depths: np.ndarray = _branch_depths(branches)
+    has_branch: np.ndarray = _has_branch(branches)
+    originals: dict = {field: df_original[field].to_numpy(dtype=float) for field in IncrementalEditor.fields}
+    number_of_rows: int = len(df_original)
+    if df_user_input is None:
+        values_user: tuple = (np.full(number_of_rows, np.nan), np.full(number_of_rows, np.nan))
+    else:
+        values_user = _user_values(df_original=df_original, df_user_input=df_user_input)
+    user: dict = dict(zip(IncrementalEditor.fields, values_user))
+
+    specifications: dict = {field: {} for field in IncrementalEditor.fields}
+    for uid, cells in (distributions or {}).items():
+        row: int = positions.get_indexer([uid])[0]
+        if row < 0:
+            raise ValueError(f"UID {uid} is not in the table.")
+        for field, specification in cells.items():
+            if field not in IncrementalEditor.fields:
+                raise ValueError(f"Field must be one of {IncrementalEditor.fields}, but got '{field}'.")
+            if specification.get('distribution') not in _DISTRIBUTIONS:
+                raise ValueError(f"Distribution must be one of {_DISTRIBUTIONS}, but got '{specification.get('distribution')}'.")
+            specifications[field][row] = specification
+
+    # samples of the edited cells, of shape (iterations, edited cells) per field
+    rng = np.random.default_rng(seed)
+    edited_rows: dict = {}
+    samples: dict = {}
+    for field in IncrementalEditor.fields:
+        rows: np.ndarray = np.union1d(np.flatnonzero(~np.isnan(user[field])), list(specifications[field])).astype(np.int64)
+        values: np.ndarray = user[field][rows]
+        field_samples: np.ndarray = np.broadcast_to(values, (iterations, len(rows))).copy()
+        without_distribution: np.ndarray = np.array([row not in specifications[field] for row in rows], dtype=bool)
+        if relative_uncertainty is not None and without_distribution.any():
+            field_samples[:, without_distribution] = rng.normal(
+                loc=values[without_distribution],
+                scale=relative_uncertainty * np.abs(values[without_distribution]),
+                size=(iterations, int(without_distribution.sum())),
+            )
+        for column in np.flatnonzero(~without_distribution):
+            parameters: dict = dict(specifications[field][rows[column]])
+            field_samples[:, column] = getattr(rng, parameters.pop('distribution'))(size=iterations, **parameters)
+        edited_rows[field] = rows
+        samples[field] = field_samples
+
+    supply: np.ndarray = originals['SupplyAmount']
+    intensity: np.ndarray = originals['BurdenIntensity']
+    supply_rows: np.ndarray = edited_rows['SupplyAmount']
+    supply_edited: np.ndarray = np.zeros(number_of_rows, dtype=bool)
+    supply_edited[supply_rows] = True
+    intensity_edited: np.ndarray = np.zeros(number_of_rows, dtype=bool)
+    intensity_edited[edited_rows['BurdenIntensity']] = True
+
+    # scaling of the supply amount of every row: column of the nearest edited upstream node, or the last column (no scaling)
+    ancestors: np.ndarray = _nearest_edited_ancestors(parents=parents, depths=depths, edited=supply_edited)
+    updated: np.ndarray = has_branch & ~supply_edited & (ancestors >= 0)
+    column_of_edited_row: np.ndarray = np.full(number_of_rows, len(supply_rows))
+    column_of_edited_row[supply_rows] = np.arange(len(supply_rows))
+    columns: np.ndarray = np.where(updated, column_of_edited_row[ancestors], len(supply_rows))
+    factors: np.ndarray = np.ones((iterations, len(supply_rows) + 1))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(samples['SupplyAmount'], supply[supply_rows], out=factors[:, :-1])
+    factors[:, :-1][:, supply[supply_rows] == 0] = 0
+
+    # rows with an edited burden intensity are sampled explicitly
+    intensity_rows: np.ndarray = edited_rows['BurdenIntensity']
+    intensity_supply: np.ndarray = supply[intensity_rows] * factors[:, columns[intensity_rows]]
+    edited_both: np.ndarray = supply_edited[intensity_rows]
+    intensity_supply[:, edited_both] = samples['SupplyAmount'][:, column_of_edited_row[intensity_rows[edited_both]]]
+    intensity_burdens: np.ndarray = intensity_supply * samples['BurdenIntensity']
+
+    scaled: np.ndarray = ~supply_edited & ~intensity_edited
+    edited_supply_only: np.ndarray = supply_edited[supply_rows] & ~intensity_edited[supply_rows]
+    burdens_sum: np.ndarray = (
+        factors @ np.bincount(columns[scaled], weights=(supply * intensity)[scaled], minlength=len(supply_rows) + 1)
+        + samples['SupplyAmount'] @ np.where(edited_supply_only, intensity[supply_rows], 0)
+        + intensity_burdens.sum(axis=1)
+    )
+    burden_original: np.ndarray = df_original['Burden(Direct)'].to_numpy(dtype=float)
+    baseline_burden_sum: float = float((supply * intensity).sum())
+    baseline_score: float = float(burden_original.sum()) if score is None else float(score)
+    scores: np.ndarray = baseline_score - baseline_burden_sum + burdens_sum
+
+    q: np.ndarray = np.asarray(percentiles, dtype=float)
+    factor_percentiles, factor_percentiles_reversed = np.split(np.percentile(factors, np.concatenate([q, 100 - q]), axis=0), 2)
+    supply_percentiles, supply_percentiles_reversed = np.split(np.percentile(samples['SupplyAmount'], np.concatenate([q, 100 - q]), axis=0), 2)
+    node_supply: np.ndarray = _scaled_percentiles(supply, columns, factor_percentiles, factor_percentiles_reversed)
+    node_burdens: np.ndarray = _scaled_percentiles(
+        np.where(updated, supply * intensity, burden_original), columns, factor_percentiles, factor_percentiles_reversed
+    )
+    node_supply[:, supply_rows] = supply_percentiles
+    node_burdens[:, supply_rows] = _scaled_percentiles(
+        intensity[supply_rows], np.arange(len(supply_rows)), supply_percentiles, supply_percentiles_reversed
+    )
+    node_supply[:, intensity_rows] = np.percentile(intensity_supply, q, axis=0)
+    node_burdens[:, intensity_rows] = np.percentile(intensity_burdens, q, axis=0)
+
+    index = pd.Index(q, name='Percentile')
+    return MonteCarloResults(
+        scores=scores,
+        score_percentiles=pd.Series(np.percentile(scores, q), index=index, dtype=float),
+        supply=pd.DataFrame(node_supply, index=index, columns=uids),
+        burdens=pd.DataFrame(node_burdens, index=index, columns=uids),
+    )
+
+
+@dataclass
+class ExactModificationResults:
+    """
+    Results of [`brightwebapp.modifications.solve_user_modifications`][].
+
+    Attributes
+    ----------
+    score : float
+        Life-cycle assessment score with all edits, including the burden of nodes below the cutoff of the graph traversal.
+    nodes : pd.DataFrame
+        Nodes of the graph traversal, with the columns
+        `'UID', 'SupplyAmount', 'BurdenIntensity', 'Burden(Direct)', 'Edited?', 'Updated?'`.
+    activities : pd.DataFrame
+        Direct burden of every activity of the technosphere
+        (see [`brightwebapp.dense.DenseInverseLCA.contributions`][]).
+    """
+    score: float
+    nodes: pd.DataFrame
+    activities: pd.DataFrame
+
+
+def _exchange_keys(products: np.ndarray, consumers: np.ndarray, number_of_activities: int) -> np.ndarray:
+    """
+    Returns one integer per (product row, consumer activity column) pair of the technosphere matrix,
+    with consumer `-1` for the demand.
+    """
+    return products * (number_of_activities + 1) + consumers + 1
+
+
+def solve_user_modifications(
+    lca: bc.LCA,
+    traversal: TraversalResult,
+    df_user_input: pd.DataFrame,
+    max_rank: int = 50,
+) -> ExactModificationResults:
+    """
+    Applies the user edits of a graph traversal table to the technosphere and biosphere
+    of the life-cycle assessment calculation and solves the edited system exactly,
+    reusing the factorization (or dense inverse) of the technosphere matrix.
+
+    [`brightwebapp.modifications.apply_user_modifications`][] rescales the supply amounts of the nodes
+    downstream of an edited node in the table only. This ignores other consumers of the same products
+    and all nodes below the cutoff of the graph traversal. Here, edits are mapped to the matrices instead:
+
+    - An edit of the `SupplyAmount` of a node from $s$ to $s'$ scales the exchange from the reference product
+      of the node to the activity of its parent node (the technosphere matrix entry $a_{pi}$) by $s'/s$.
+      Every node supplied through the same exchange changes accordingly. An edit of the node producing the
+      functional unit scales the demand. Edited nodes downstream of other edited exchanges are scaled by both.
+    - An edit of the `BurdenIntensity` of a node sets the characterized direct emissions
+      of one unit of its activity, in all nodes of the activity.
+
+    With $k$ edited exchanges, the technosphere matrix changes by $A' = A + U V^T$, where $U$ and $V$ have $k$ columns.
+    The supply is updated with the Woodbury matrix identity
+
+    $$
+    x' = y - Z (I + V^T Z)^{-1} V^T y, \\quad Z = A^{-1} U,
+    $$
+
+    where $y = A^{-1} f$ is the supply for the (edited) demand $f$.
+    This requires $k$ solves with the existing factorization (back-substitutions), instead of a new factorization.
+    Above `max_rank` edited exchanges, the edited technosphere matrix is solved directly.
+
+    Example
+    -------
+    ```python
+    >>> with lca_pool.checkout(demand=demand, method=method) as lca:
+    >>>     traversal = perform_graph_traversal(..., return_format='traversal_result')
+    >>>     results = solve_user_modifications(lca=lca, traversal=traversal, df_user_input=df_edited)
+    >>> results.score
+    1186.3
+    ```
+
+    Warnings
+    --------
+    `lca` must hold the inventory of the demand of the graph traversal
+    (e.g. within [`brightwebapp.traversal.LCAPool.checkout`][] with the same demand and method).
+    It is factorized if it has not been factorized yet, but not modified otherwise.
+
+    Parameters
+    ----------
+    lca : bc.LCA
+        Life-cycle assessment calculation of the graph traversal.
+    traversal : TraversalResult
+        Graph traversal (see [`brightwebapp.traversal.perform_graph_traversal`][] with `return_format='traversal_result'`).
+    df_user_input : pd.DataFrame
+        Table edited by the user.
+        Must have at least columns `'UID', 'SupplyAmount', 'BurdenIntensity'`.
+    max_rank : int
+        Maximum number of edited exchanges for which the Woodbury matrix identity is used.
+
+    Returns
+    -------
+    ExactModificationResults
+        Score, nodes and activities with all edits.
+
+    Raises
+    ------
+    ValueError
+        If the UIDs of the table and of the graph traversal do not match,
+        if nodes of the same exchange (or activity) are edited to different ratios (or intensities),
+        if the supply amount of a node with zero supply is edited,
+        or if the edited technosphere matrix is singular.
+    """
+    supply_user, intensity_user = _user_values(
+        df_original=pd.DataFrame({
+            'UID': traversal.uid,
+            'SupplyAmount': traversal.supply_amount,
+            'BurdenIntensity': traversal.burden_intensity,
+        }),
+        df_user_input=df_user_input,
+    )
+    technosphere_matrix = lca.technosphere_matrix
+    number_of_activities: int = technosphere_matrix.shape[1]
+    parents: np.ndarray = traversal.parent_index
+    consumers: np.ndarray = np.where(parents >= 0, traversal.activity_index[parents], -1)
+    keys: np.ndarray = _exchange_keys(traversal.reference_product_index, consumers, number_of_activities)
+
+    # supply edits: ratios of technosphere exchanges (or of the demand)
+    edited_rows: np.ndarray = np.flatnonzero(~np.isnan(supply_user))
+    if (traversal.supply_amount[edited_rows] == 0).any():
+        raise ValueError("The supply amount of nodes with zero supply cannot be edited.")
+    edited_exchanges = pd.Series(supply_user[edited_rows] / traversal.supply_amount[edited_rows], index=keys[edited_rows])
+    if not edited_exchanges.groupby(level=0).agg(lambda ratios: np.allclose(ratios, ratios.iloc[0])).all():
+        raise ValueError("Nodes supplied through the same exchange must be edited to the same ratio.")
+    edited_exchanges = edited_exchanges[~edited_exchanges.index.duplicated()]
+    row_ratios: np.ndarray = edited_exchanges.reindex(keys, fill_value=1.0).to_numpy()
+
+    # intensity edits: characterized direct emissions of one unit of the activities
+    direct_intensity: np.ndarray = lca.direct_intensity if isinstance(lca, DenseInverseLCA) else _direct_intensity(lca)
+    edited_rows = np.flatnonzero(~np.isnan(intensity_user))
+    edited_intensities = pd.Series(
+        intensity_user[edited_rows],
+        index=traversal.activity_index[edited_rows],
+    )
+    if not edited_intensities.groupby(level=0).agg(lambda values: np.allclose(values, values.iloc[0])).all():
+        raise ValueError("Nodes of the same activity must be edited to the same burden intensity.")
+    edited_intensities = edited_intensities[~edited_intensities.index.duplicated()]
+    direct_intensity_edited: np.ndarray = direct_intensity.copy()
+    direct_intensity_edited[edited_intensities.index.to_numpy(dtype=np.int64)] = edited_intensities.to_numpy()
+
+    # solve the edited system
+    if not (isinstance(lca, DenseInverseLCA) and lca.dense) and not hasattr(lca, 'solver'):
+        lca.decompose_technosphere()
+    exchange_products, exchange_consumers = np.divmod(edited_exchanges.index.to_numpy(dtype=np.int64), number_of_activities + 1)
+    exchange_consumers -= 1
+    exchange_ratios: np.ndarray = edited_exchanges.to_numpy()
+    is_demand: np.ndarray = exchange_consumers < 0
+    demand: np.ndarray = lca.demand_array.copy()
+    demand[exchange_products[is_demand]] *= exchange_ratios[is_demand]
+    supply: np.ndarray = lca.solve_linear_system(demand) if is_demand.any() else lca.supply_array.copy()
+    products, consumers_edited, ratios = exchange_products[~is_demand], exchange_consumers[~is_demand], exchange_ratios[~is_demand]
+    changes: np.ndarray = (ratios - 1) * np.asarray(technosphere_matrix[products, consumers_edited]).ravel()
+    if 0 < len(changes) <= max_rank:
+        columns: np.ndarray = np.zeros((technosphere_matrix.shape[0], len(changes)))
+        columns[products, np.arange(len(changes))] = changes
+        solved: np.ndarray = np.column_stack([lca.solve_linear_system(column) for column in columns.T])
+        try:
+            correction: np.ndarray = np.linalg.solve(np.eye(len(changes)) + solved[consumers_edited], supply[consumers_edited])
+        except np.linalg.LinAlgError:
+            raise ValueError("The edited technosphere matrix is singular.")
+        supply = supply - solved @ correction
+    elif len(changes) > max_rank:
+        technosphere_edited = technosphere_matrix + coo_matrix((changes, (products, consumers_edited)), shape=technosphere_matrix.shape)
+        supply = spsolve(technosphere_edited.tocsc(), demand)
+    if not np.isfinite(supply).all():
+        raise ValueError("The edited technosphere matrix is singular.")
+
+    # nodes: the supply amount of a node is the product of the exchanges along its branch
+    cumulative_ratios: np.ndarray = row_ratios.copy()
+    order: np.ndarray = np.argsort(traversal.depth, kind='stable')
+    for rows in np.split(order, np.flatnonzero(np.diff(traversal.depth[order])) + 1) if len(order) else []:
+        rows = rows[parents[rows] >= 0]
+        cumulative_ratios[rows] *= cumulative_ratios[parents[rows]]
+    intensity_changed: np.ndarray = np.isin(traversal.activity_index, edited_intensities.index.to_numpy(dtype=np.int64))
+    intensity: np.ndarray = np.where(
+        intensity_changed,
+        direct_intensity_edited[traversal.activity_index],
+        traversal.burden_intensity,
+    )
+    supply_nodes: np.ndarray = traversal.supply_amount * cumulative_ratios
+    edited: np.ndarray = ~np.isnan(supply_user) | ~np.isnan(intensity_user)
+    return ExactModificationResults(
+        score=float(direct_intensity_edited @ supply),
+        nodes=pd.DataFrame({
+            'UID': traversal.uid,
+            'SupplyAmount': supply_nodes,
+            'BurdenIntensity': intensity,
+            'Burden(Direct)': supply_nodes * intensity,
+            'Edited?': edited,
+            'Updated?': ~edited & ((cumulative_ratios != 1) | intensity_changed),
+        }),
+        activities=_contributions(lca, supply=supply, direct_intensity=direct_intensity_edited),
+    )
@@ -0,0 +1,240 @@
+# %%
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pandas as pd
+
+from brightwebapp.caching import LRUCache
+from brightwebapp.modifications import IncrementalEditor
+
+
+@dataclass
+class EditSession:
+    """
+    Edits of one graph traversal table, held by an [`brightwebapp.sessions.EditSessionStore`][].
+
+    Attributes
+    ----------
+    id : str
+        Unique identifier of the session.
+    editor : IncrementalEditor
+        Editor of the table, see [`brightwebapp.modifications.IncrementalEditor`][].
+    metadata : dict
+        Description of the graph traversal of the table (e.g. demand, method and cutoff).
+    created_at : float
+        Time at which the session was created (seconds since the epoch).
+    accessed_at : float
+        Time at which the session was last looked up (seconds since the epoch).
+    lock : threading.Lock
+        Lock to be held while editing the table, so that concurrent edits of the same session are applied one after the other.
+    """
+    id: str
+    editor: IncrementalEditor
+    metadata: dict = field(default_factory=dict)
+    created_at: float = field(default_factory=time.time)
+    accessed_at: float = field(default_factory=time.time)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+
+    def to_dict(self) -> dict:
+        """
+        Returns the status of the session as a JSON-serializable dictionary (without the table).
+        """
+        return {
+            'id': self.id,
+            'created_at': self.created_at,
+            'accessed_at': self.accessed_at,
+            'rows': len(self.editor.uids),
+            'score': self.editor.score,
+            'revision': self.editor.revision,
+            'metadata': self.metadata,
+        }
+
+
+class EditSessionStore:
+    """
+    In-process store of edit sessions, each holding an [`brightwebapp.modifications.IncrementalEditor`][]
+    of a graph traversal table, so that clients can edit a table on the server cell by cell
+    instead of uploading the whole table after every edit.
+
+    Sessions which have not been looked up for `ttl` seconds expire.
+    The memory of every session, including its revisions, is accounted for
+    (see [`brightwebapp.modifications.IncrementalEditor.nbytes`][]):
+    when the sessions hold more than `maxsize` entries or together more than `maxbytes` bytes,
+    the least recently used sessions are evicted, as in [`brightwebapp.caching.LRUCache`][].
+    Expired sessions are evicted whenever a session is created or looked up.
+    After a session has been edited, its size is updated with [`brightwebapp.sessions.EditSessionStore.update_size`][].
+
+    Example
+    -------
+    ```python
+    >>> store = EditSessionStore(maxbytes=2**30, ttl=1800)
+    >>> session = store.create(df=df_traversal, score=lca.score, metadata={'method': ('IPCC',)})
+    >>> with session.lock:
+    >>>     session.editor.edit(uid=12, field='SupplyAmount', value=0.5)
+    >>> store.update_size(session.id) # False if the session has grown larger than `maxbytes`
+    True
+    >>> store.get(session.id).editor.score
+    2.43
+    >>> store.delete(session.id)
+    True
+    ```
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of sessions.
+    maxbytes : int | None, optional
+        Maximum total size of the sessions in bytes. If `None`, the store is only bounded by `maxsize`.
+    ttl : float
+        Time in seconds after the last lookup after which a session expires.
+    max_revisions : int | None, optional
+        Maximum number of revisions kept for undo in every session.
+        If `None`, all revisions are kept.
+    """
+    def __init__(
+        self,
+        maxsize: int = 100,
+        maxbytes: Optional[int] = None,
+        ttl: float = 3600,
+        max_revisions: Optional[int] = None,
+    ):
+        self.ttl: float = ttl
+        self.max_revisions: Optional[int] = max_revisions
+        self._sessions = LRUCache(maxsize=maxsize, maxbytes=maxbytes, sizeof=lambda session: session.editor.nbytes)
+        self._lock = threading.Lock()
+        self.expirations: int = 0
+
+
+    def _evict_expired(self) -> None:
+        """
+        Discards the sessions which have not been looked up for more than `ttl` seconds. Must be called while holding the lock.
+        """
+        now: float = time.time()
+        # sessions are ordered by their last lookup
+        for session_id, session in self._sessions.items():
+            if now - session.accessed_at <= self.ttl:
+                break
+            self._sessions.pop(session_id)
+            self.expirations += 1
+
+
+    def create(self, df: pd.DataFrame, score: Optional[float] = None, metadata: Optional[dict] = None) -> EditSession:
+        """
+        Creates a session for a graph traversal table.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Table of the graph traversal, see [`brightwebapp.modifications.IncrementalEditor`][].
+        score : float, optional
+            Life-cycle assessment score of the table.
+        metadata : dict, optional
+            Description of the graph traversal of the table.
+
+        Returns
+        -------
+        EditSession
+            The new session.
+
+        Raises
+        ------
+        ValueError
+            If the session is larger than `maxbytes`.
+        """
+        session = EditSession(
+            id=uuid.uuid4().hex,
+            editor=IncrementalEditor(df=df, score=score, max_revisions=self.max_revisions),
+            metadata=metadata or {},
+        )
+        with self._lock:
+            self._evict_expired()
+            self._sessions.put(session.id, session)
+            if session.id not in self._sessions:
+                raise ValueError(
+                    f"The session requires {session.editor.nbytes} bytes, "
+                    f"more than the maximum size of the store ({self._sessions.maxbytes} bytes)."
+                )
+        return session
+
+
+    def get(self, session_id: str) -> Optional[EditSession]:
+        """
+        Returns a session and marks it as accessed, or `None` if the session does not exist, has expired or has been evicted.
+
+        Parameters
+        ----------
+        session_id : str
+            Unique identifier of the session.
+        """
+        with self._lock:
+            self._evict_expired()
+            session: Optional[EditSession] = self._sessions.get(session_id)
+            if session is not None:
+                session.accessed_at = time.time()
+        return session
+
+
+    def update_size(self, session_id: str) -> bool:
+        """
+        Updates the memory accounted for a session after it has been edited,
+        and evicts the least recently used sessions if the sessions together exceed `maxbytes`.
+        A session which has grown larger than `maxbytes` is discarded.
+
+        Parameters
+        ----------
+        session_id : str
+            Unique identifier of the session.
+
+        Returns
+        -------
+        bool
+            `True` if the session is still held by the store,
+            `False` if it has been discarded (or did not exist).
+        """
+        with self._lock:
+            session: Optional[EditSession] = self._sessions.pop(session_id)
+            if session is None:
+                return False
+            self._sessions.put(session_id, session)
+            return session_id in self._sessions
+
+
+    def delete(self, session_id: str) -> bool:
+        """
+        Deletes a session.
+
+        Parameters
+        ----------
+        session_id : str
+            Unique identifier of the session.
+
+        Returns
+        -------
+        bool
+            `True` if the session existed.
+        """
+        with self._lock:
+            return self._sessions.pop(session_id) is not None
+
+
+    def stats(self) -> dict:
+        """
+        Returns a dictionary with the number and total size of the sessions
+        and the number of evicted (least recently used) and expired sessions.
+        """
+        with self._lock:
+            self._evict_expired()
+            stats: dict = self._sessions.stats()
+        return {
+            'sessions': stats['size'],
+            'maxsize': stats['maxsize'],
+            'nbytes': stats['nbytes'],
+            'maxbytes': stats['maxbytes'],
+            'evictions': stats['evictions'],
+            'expirations': self.expirations,
+            'ttl': self.ttl,
+        }
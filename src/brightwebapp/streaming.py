@@ -0,0 +1,186 @@
+# %%
+import math
+import queue
+import threading
+import time
+from contextlib import nullcontext
+from itertools import islice
+from typing import Iterator, Optional
+
+import bw_graph_tools as bgt
+
+from brightwebapp.brightway import get_node_metadata
+from brightwebapp.traversal import (
+    LCAPool,
+    ResumableGraphTraversal,
+    _validate_demand,
+    perform_lca,
+)
+
+
+# marks the end of the events put on the queue by the traversal thread
+_END_OF_EVENTS = object()
+
+
+def _json_number(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def iter_graph_traversal_events(
+    demand: dict,
+    method: tuple,
+    cutoff: float,
+    biosphere_cutoff: float,
+    max_calc: int,
+    time_budget_ms: Optional[float] = None,
+    lca_pool: Optional[LCAPool] = None,
+    interval_ms: float = 250,
+) -> Iterator[dict]:
+    """
+    Performs a graph traversal in a background thread and yields progress events while it runs.
+
+    Every `interval_ms`, a `progress` event and (if new nodes were found) a `nodes` event are yielded.
+    The last event is a `summary` event, or an `error` event if the life-cycle assessment or graph traversal failed.
+    Closing the generator (e.g. when a client disconnects) cancels the graph traversal
+    (see [`brightwebapp.traversal.ResumableGraphTraversal.cancel`][]).
+
+    Events are dictionaries with the type of the event under `event`:
+
+    ```python
+    {'event': 'progress', 'calculations': 12, 'max_calc': 100, 'nodes': 25, 'coverage': 0.93, 'elapsed_ms': 41.2}
+    {'event': 'nodes', 'nodes': [
+        {'uid': 3, 'parent_uid': 0, 'name': 'Steel; at mill', 'depth': 2, 'supply_amount': 0.5,
+         'burden_direct': 0.1, 'burden_cumulative': 2.3},
+        ...
+    ]}
+    {'event': 'summary', 'nodes': 42, 'edges': 41, 'calculations': 30, 'coverage': 0.99,
+     'total_score': 2.5, 'elapsed_ms': 120.5, 'truncated': ''}
+    {'event': 'error', 'detail': 'ValueError: ...'}
+    ```
+
+    Nodes are numbered by their unique identifier (`uid`), as in [`brightwebapp.traversal.TraversalResult`][].
+    The `parent_uid` of the first node is `None`. Unknown numbers (`nan`) are returned as `None`.
+
+    See Also
+    --------
+    [`brightwebapp.traversal.perform_graph_traversal`][]
+
+    Parameters
+    ----------
+    demand : dict
+        A dictionary representing the reference product demand, see [`brightwebapp.traversal.perform_lca`][].
+    method : tuple
+        A tuple representing the method to be used for the life-cycle assessment.
+    cutoff : float
+        Cutoff of the graph traversal.
+    biosphere_cutoff : float
+        Biosphere cutoff of the graph traversal.
+    max_calc : int
+        Maximum number of calculations of the graph traversal.
+    time_budget_ms : float | None, optional
+        Wall-clock time budget of the graph traversal in milliseconds, see [`brightwebapp.traversal._traverse_graph`][].
+    lca_pool : LCAPool | None, optional
+        A [`brightwebapp.traversal.LCAPool`][] which provides the life-cycle assessment calculation.
+    interval_ms : float
+        Minimum time between two `progress` events in milliseconds.
+
+    Yields
+    ------
+    dict
+        The events of the graph traversal.
+
+    Raises
+    ------
+    ValueError
+        If `demand` does not contain exactly one activity.
+    """
+    _validate_demand(demand)
+    events: queue.Queue = queue.Queue()
+    cancelled = threading.Event()
+    holder: dict = {}
+
+    def run() -> None:
+        try:
+            if lca_pool is not None:
+                lca_context = lca_pool.checkout(demand=demand, method=method)
+            else:
+                lca_context = nullcontext(perform_lca(demand=demand, method=method))
+            with lca_context as lca:
+                traversal = ResumableGraphTraversal(
+                    lca=lca,
+                    settings=bgt.GraphTraversalSettings(
+                        cutoff=cutoff,
+                        biosphere_cutoff=biosphere_cutoff,
+                        max_calc=max_calc,
+                    )
+                )
+                holder['traversal'] = traversal
+                if cancelled.is_set():
+                    traversal.cancel()
+                counts: dict = {'nodes': 0, 'edges': 0, 'emitted': 0.0}
+
+                def emit(progress: Optional[dict]) -> None:
+                    # without `progress`, only the remaining new nodes are emitted
+                    now: float = time.monotonic()
+                    if progress is not None:
+                        if (now - counts['emitted']) * 1000 < interval_ms:
+                            return
+                        counts['emitted'] = now
+                        events.put({'event': 'progress', **progress})
+                    nodes: dict = traversal._nodes
+                    new_nodes: list = list(islice(reversed(nodes.values()), len(nodes) - counts['nodes']))[::-1]
+                    new_edges: list = traversal._edges[counts['edges']:]
+                    counts['nodes'], counts['edges'] = len(nodes), len(traversal._edges)
+                    parent_uid: dict = {edge.producer_unique_id: edge.consumer_unique_id for edge in new_edges}
+                    new_nodes = [
+                        {
+                            'uid': node.unique_id,
+                            'parent_uid': parent_uid.get(node.unique_id) if node.unique_id > 0 else None,
+                            'activity_datapackage_id': node.activity_datapackage_id,
+                            'depth': node.depth,
+                            'supply_amount': node.supply_amount,
+                            'burden_direct': node.direct_emissions_score,
+                            'burden_cumulative': node.cumulative_score,
+                        }
+                        for node in new_nodes if node.unique_id != -1
+                    ]
+                    if new_nodes:
+                        events.put({'event': 'nodes', 'nodes': new_nodes})
+
+                traversal.traverse(time_budget_ms=time_budget_ms, progress_callback=emit)
+                emit(None)
+                progress: dict = traversal.progress
+                events.put({
+                    'event': 'summary',
+                    'nodes': progress['nodes'],
+                    'edges': max(len(traversal._edges) - 1, 0),
+                    'calculations': progress['calculations'],
+                    'coverage': progress['coverage'],
+                    'total_score': traversal.total_score,
+                    'elapsed_ms': progress['elapsed_ms'],
+                    'truncated': traversal.truncated or '',
+                })
+        except Exception as e:
+            events.put({'event': 'error', 'detail': f"{type(e).__name__}: {e}"})
+        finally:
+            events.put(_END_OF_EVENTS)
+
+    thread = threading.Thread(target=run, name='traversal-stream', daemon=True)
+    thread.start()
+    try:
+        while (event := events.get()) is not _END_OF_EVENTS:
+            if event['event'] == 'nodes':
+                names: dict = get_node_metadata(
+                    [node['activity_datapackage_id'] for node in event['nodes']],
+                    fields=('name',),
+                )
+                for node in event['nodes']:
+                    node['name'] = names[node.pop('activity_datapackage_id')]['name']
+            yield {
+                key: _json_number(value) if isinstance(value, float) else value
+                for key, value in event.items()
+            }
+    finally:
+        cancelled.set()
+        if 'traversal' in holder:
+            holder['traversal'].cancel()
@@ -0,0 +1,157 @@
+# %%
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Optional
+
+
+@dataclass
+class Span:
+    """
+    Wall time (and optionally peak memory) of one stage of a calculation,
+    recorded by a [`brightwebapp.timing.StageTimer`][].
+
+    Attributes
+    ----------
+    name : str
+        Name of the stage, e.g. `'lci'` or `'traversal'`.
+    duration_ms : float
+        Wall time of the stage in milliseconds.
+    peak_memory_bytes : int | None
+        Peak memory allocated by Python during the stage in bytes (measured with `tracemalloc`),
+        `None` if memory was not traced.
+    counts : dict
+        Counts recorded during the stage, e.g. `{'nodes': 42, 'edges': 41}`.
+    """
+    name: str
+    duration_ms: float
+    peak_memory_bytes: Optional[int] = None
+    counts: dict = field(default_factory=dict)
+
+
+class StageTimer:
+    """
+    Records the wall time, counts and (optionally) peak memory of the stages of a calculation.
+
+    Functions which accept a `timer` argument
+    (e.g. [`brightwebapp.traversal.perform_graph_traversal`][]) wrap each of their stages
+    in [`brightwebapp.timing.StageTimer.span`][]. After the call, the timer holds one
+    [`brightwebapp.timing.Span`][] per stage. A `callback` is called with every span as soon as the stage ends,
+    for instance to forward the spans to a logging or tracing system.
+
+    Example
+    -------
+    ```python
+    >>> timer = StageTimer()
+    >>> perform_graph_traversal(..., timer=timer)
+    >>> timer.to_dict()
+    [
+        {'name': 'lci', 'duration_ms': 120.4, 'peak_memory_bytes': None, 'counts': {}},
+        {'name': 'lcia', 'duration_ms': 3.2, 'peak_memory_bytes': None, 'counts': {}},
+        {'name': 'traversal', 'duration_ms': 45.1, 'peak_memory_bytes': None, 'counts': {'nodes': 42, 'edges': 41, 'calculations': 30}},
+        ...
+    ]
+    >>> timer.server_timing()
+    'lci;dur=120.4, lcia;dur=3.2, traversal;dur=45.1, ...'
+    ```
+
+    Warnings
+    --------
+    If `trace_memory` is `True`, memory allocations are traced with `tracemalloc`,
+    which slows down the calculation considerably. Only memory allocated by Python
+    (including NumPy arrays) is traced. Spans must not be nested if memory is traced,
+    since every span resets the peak of `tracemalloc`.
+
+    Parameters
+    ----------
+    callback : Callable[[Span], None] | None, optional
+        Function called with every completed span.
+    trace_memory : bool
+        If `True`, the peak memory of every span is recorded.
+    """
+    def __init__(
+        self,
+        callback: Optional[Callable[[Span], None]] = None,
+        trace_memory: bool = False,
+    ):
+        self.callback: Optional[Callable[[Span], None]] = callback
+        self.trace_memory: bool = trace_memory
+        self.spans: list[Span] = []
+
+
+    @contextmanager
+    def span(self, name: str, **counts) -> Iterator[dict]:
+        """
+        Context manager which records the wall time of a stage.
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage.
+        **counts
+            Counts known before the stage starts.
+
+        Yields
+        ------
+        dict
+            The counts of the span, to which counts can be added while the stage runs.
+        """
+        started_tracing: bool = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        start: float = time.perf_counter()
+        try:
+            yield counts
+        finally:
+            duration_ms: float = (time.perf_counter() - start) * 1000
+            peak_memory_bytes: Optional[int] = tracemalloc.get_traced_memory()[1] if self.trace_memory else None
+            if started_tracing:
+                tracemalloc.stop()
+            span = Span(name=name, duration_ms=duration_ms, peak_memory_bytes=peak_memory_bytes, counts=counts)
+            self.spans.append(span)
+            if self.callback is not None:
+                self.callback(span)
+
+
+    @property
+    def total_ms(self) -> float:
+        """
+        Sum of the wall times of all spans in milliseconds.
+        """
+        return sum(span.duration_ms for span in self.spans)
+
+
+    def to_dict(self) -> list[dict]:
+        """
+        Returns the spans as a list of dictionaries.
+        """
+        return [
+            {
+                'name': span.name,
+                'duration_ms': span.duration_ms,
+                'peak_memory_bytes': span.peak_memory_bytes,
+                'counts': dict(span.counts),
+            }
+            for span in self.spans
+        ]
+
+
+    def server_timing(self) -> str:
+        """
+        Returns the spans as the value of an HTTP
+        [`Server-Timing`](https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Server-Timing) header.
+        Spans with the same name are reported separately, in the order in which they were recorded.
+        """
+        return ', '.join(f"{span.name};dur={span.duration_ms:.1f}" for span in self.spans)
+
+
+def _span(timer: Optional[StageTimer], name: str, **counts):
+    """
+    Returns `timer.span(name, **counts)`, or a context manager which does nothing if `timer` is `None`.
+    """
+    if timer is None:
+        return nullcontext(counts)
+    return timer.span(name, **counts)
@@ -1,12 +1,86 @@
 # %%
+import dataclasses
+import hashlib
+from array import array
+import io
+import os
+import tempfile
+import threading
+import time
+import warnings
+import weakref
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, fields
+from functools import cached_property
+from heapq import heappop, heappush
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterator, NamedTuple, Optional
+
+import numpy as np
 import pandas as pd
+from scipy.sparse.linalg import SuperLU, splu
 import bw_graph_tools as bgt
+from bw_graph_tools.graph_traversal.utils import CachingSolver
 import bw2calc as bc
 import bw2data as bd
 from bw2data.backends.proxies import Activity
 
+from brightwebapp.brightway import get_node_metadata
+from brightwebapp.caching import LRUCache, _project_revision, _method_revision
+from brightwebapp.dense import DenseInverseLCA, _direct_intensity
+from brightwebapp.timing import StageTimer, _span
 
-def perform_lca(demand: dict, method: tuple) -> bc.LCA:
+
+def _validate_demand(demand: dict) -> None:
+    """
+    Checks that a demand dictionary contains exactly one `bw2data` node.
+
+    Parameters
+    ----------
+    demand : dict
+        Demand dictionary of `bw2data` nodes and amounts.
+
+    Raises
+    ------
+    ValueError
+        If `demand` does not contain exactly one activity.
+        If the key in `demand` is not a valid `bw2data` node dictionary.
+    """
+    if len(demand) != 1:
+        raise ValueError(
+            "Demand dictionary must contain exactly one activity."
+        )
+    if not isinstance(next(iter(demand)), Activity):
+        raise ValueError(
+            "The key in the demand dictionary must be a valid bw2data node dictionary."
+        )
+
+
+@contextmanager
+def _lca_context(
+    demand: dict,
+    method: tuple,
+    lca_pool: Optional['LCAPool'] = None,
+    timer: Optional[StageTimer] = None,
+) -> Iterator[bc.LCA]:
+    """
+    Context manager which yields an `LCA` object for `demand` and `method`,
+    checked out from `lca_pool` (see [`brightwebapp.traversal.LCAPool.checkout`][]) or calculated from scratch.
+    """
+    if lca_pool is not None:
+        with lca_pool.checkout(demand=demand, method=method, timer=timer) as lca:
+            yield lca
+    else:
+        yield perform_lca(demand=demand, method=method, timer=timer)
+
+
+def perform_lca(
+    demand: dict,
+    method: tuple,
+    lca_pool: Optional['LCAPool'] = None,
+    timer: Optional[StageTimer] = None,
+) -> bc.LCA:
     """
     Performs a life-cycle assessment calculation using the `bw2calc` library.
 
@@ -35,11 +109,20 @@ def perform_lca(demand: dict, method: tuple) -> bc.LCA:
         ```python
         ('Impact Potential', 'GCC')
         ```
+    lca_pool : LCAPool | None, optional
+        A [`brightwebapp.traversal.LCAPool`][].
+        If provided, the calculation reuses the factorized technosphere matrix held by the pool.
+    timer : StageTimer | None, optional
+        A [`brightwebapp.timing.StageTimer`][] which records the `lci` and `lcia` stages.
 
     Warnings
     --------
     The `demand` dictionary must contain exactly one activity.
 
+    If `lca_pool` is provided, the returned `LCA` object is shared by the pool.
+    It is only valid until the next calculation with the same pool.
+    Use [`brightwebapp.traversal.LCAPool.checkout`][] directly if several threads share a pool.
+
     See Also
     --------
     [Brightway Documentation: LCA Calculations](https://docs.brightway.dev/en/latest/content/cheatsheet/lca.html)
@@ -55,38 +138,814 @@ def perform_lca(demand: dict, method: tuple) -> bc.LCA:
         If `demand` does not contain exactly one activity.
         If the key in `demand` is not a valid `bw2data` node dictionary.
     """
-    if len(demand) != 1:
-        raise ValueError(
-            "Demand dictionary must contain exactly one activity."
+    _validate_demand(demand)
+
+    if lca_pool is not None:
+        with lca_pool.checkout(demand=demand, method=method, timer=timer) as lca:
+            return lca
+
+    with _span(timer, 'lci'):
+        my_functional_unit, data_objs, _ = bd.prepare_lca_inputs(
+            demand=demand,
+            method=method
         )
-    if not isinstance(next(iter(demand)), Activity):
-        raise ValueError(
-            "The key in the demand dictionary must be a valid bw2data node dictionary."
+        lca = bc.LCA(
+            demand=my_functional_unit,
+            data_objs=data_objs,
         )
-
-    my_functional_unit, data_objs, _ = bd.prepare_lca_inputs(
-        demand=demand,
-        method=method
-    )
-    lca = bc.LCA(
-        demand=my_functional_unit,
-        data_objs=data_objs,
-    )
-    lca.lci()
-    lca.lcia()
+        lca.lci()
+    with _span(timer, 'lcia'):
+        lca.lcia()
     return lca
 
 
+class LCAPool:
+    """
+    Pool of reusable, factorized life-cycle assessment calculations.
+
+    For a fixed project, the technosphere matrix does not change between calculations.
+    The pool therefore keeps one `bw2calc.LCA` object with a factorized technosphere matrix
+    for every set of databases (the databases of the demand and all databases they depend on).
+    New demands are served by solving the factorized system again (`LCA.lci(demand=...)`),
+    new methods by replacing the characterization matrix (`LCA.switch_method(...)`).
+    Only the first calculation for a set of databases loads the datapackages and factorizes the technosphere matrix.
+
+    Pooled `LCA` objects are keyed by the current project and the modification stamps of its databases
+    (see [`brightwebapp.caching._project_revision`][]), so that modified databases are loaded again.
+    The least recently used `LCA` object is discarded if the pool holds more than `maxsize` objects.
+
+    If `dense_max_products` is positive, technosphere matrices with up to `dense_max_products` rows
+    are inverted instead of factorized (see [`brightwebapp.dense.DenseInverseLCA`][]).
+    For small (e.g. input-output) databases, inventories and graph traversals are then computed
+    from matrix-vector products with the dense total requirements matrix.
+
+    Example
+    -------
+    ```python
+    >>> lca_pool = LCAPool()
+    >>> with lca_pool.checkout(demand={bd.get_node(code='bike'): 1}, method=('IPCC', )) as lca:
+    >>>     lca.score
+    >>> with lca_pool.checkout(demand={bd.get_node(code='steel'): 2}, method=('IPCC', )) as lca:
+    >>>     lca.score # no new factorization
+    >>> lca_pool.stats()
+    {'factorizations': 1, 'reuses': 1, 'method_switches': 0, 'size': 1, 'maxsize': 4, 'dense_max_products': 0}
+    ```
+
+    See Also
+    --------
+    [`brightwebapp.traversal.perform_lca`][]  
+    [`brightwebapp.traversal.perform_graph_traversal`][]  
+    [Brightway Documentation: LCA Calculations](https://docs.brightway.dev/en/latest/content/cheatsheet/lca.html)
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of `LCA` objects held in the pool.
+    dense_max_products : int
+        Maximum number of products of a technosphere matrix which is inverted instead of factorized.
+        If `0`, technosphere matrices are always factorized.
+    """
+    def __init__(self, maxsize: int = 4, dense_max_products: int = 0):
+        self._entries = LRUCache(maxsize=maxsize)
+        self.dense_max_products: int = dense_max_products
+        self._lock = threading.Lock()
+        self.factorizations: int = 0
+        self.reuses: int = 0
+        self.method_switches: int = 0
+
+
+    @contextmanager
+    def checkout(self, demand: dict, method: tuple, timer: Optional[StageTimer] = None) -> Iterator[bc.LCA]:
+        """
+        Context manager which yields an `LCA` object with the inventory and impact assessment
+        calculated for `demand` and `method`.
+
+        The `LCA` object is locked while the context is active, so that it can safely be used
+        (for instance for a graph traversal) while other threads use the same pool.
+
+        Parameters
+        ----------
+        demand : dict
+            A dictionary representing the reference product demand, see [`brightwebapp.traversal.perform_lca`][].
+        method : tuple
+            A tuple representing the method to be used for the life-cycle assessment.
+        timer : StageTimer | None, optional
+            A [`brightwebapp.timing.StageTimer`][] which records the `lci` and `lcia` stages.
+            The `lci` stage counts whether the technosphere matrix was factorized (`factorized`).
+
+        Yields
+        ------
+        bc.LCA
+            The pooled `LCA` object. Must not be used after the context is exited.
+
+        Raises
+        ------
+        ValueError
+            If `demand` does not contain exactly one activity.
+            If the key in `demand` is not a valid `bw2data` node dictionary.
+        """
+        _validate_demand(demand)
+        database_names: frozenset = frozenset().union(*[
+            bd.Database(database_name).find_graph_dependents()
+            for database_name in {node['database'] for node in demand}
+        ])
+        key: tuple = (_project_revision(), database_names)
+        indexed_demand: dict = {node.id: amount for node, amount in demand.items()}
+
+        with self._lock:
+            entry: Optional[dict] = self._entries.get(key)
+            if entry is None:
+                entry = {'lock': threading.Lock(), 'lca': None, 'method_revision': None}
+                self._entries.put(key, entry)
+
+        with entry['lock']:
+            if entry['lca'] is None:
+                with _span(timer, 'lci', factorized=1):
+                    _, data_objs, _ = bd.prepare_lca_inputs(demand=demand, method=method)
+                    if self.dense_max_products > 0:
+                        lca = DenseInverseLCA(
+                            demand=indexed_demand,
+                            data_objs=data_objs,
+                            max_products=self.dense_max_products,
+                        )
+                    else:
+                        lca = bc.LCA(
+                            demand=indexed_demand,
+                            data_objs=data_objs,
+                        )
+                    lca.lci(factorize=True)
+                with _span(timer, 'lcia'):
+                    lca.lcia()
+                entry['lca'] = lca
+                entry['method_revision'] = _method_revision(method)
+                self.factorizations += 1
+            else:
+                lca = entry['lca']
+                with _span(timer, 'lci', factorized=0):
+                    lca.lci(demand=indexed_demand)
+                with _span(timer, 'lcia'):
+                    method_revision: tuple = _method_revision(method)
+                    if entry['method_revision'] != method_revision:
+                        lca.switch_method(tuple(method))
+                        entry['method_revision'] = method_revision
+                        self.method_switches += 1
+                    lca.lcia()
+                self.reuses += 1
+            yield lca
+
+
+    def clear(self) -> None:
+        """
+        Discards all pooled `LCA` objects and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.factorizations = 0
+            self.reuses = 0
+            self.method_switches = 0
+
+
+    def stats(self) -> dict:
+        """
+        Returns a dictionary with the number of factorizations, reuses and method switches
+        and the current and maximum size of the pool.
+        """
+        return {
+            'factorizations': self.factorizations,
+            'reuses': self.reuses,
+            'method_switches': self.method_switches,
+            'size': len(self._entries),
+            'maxsize': self._entries.maxsize,
+            'dense_max_products': self.dense_max_products,
+        }
+
+
+class _SparseColumn(NamedTuple):
+    """
+    Row indices and values of a column of a sparse matrix,
+    in place of the `scipy.sparse.coo_matrix` expected by `NewNodeEachVisitGraphTraversal.add_biosphere_flows`.
+    """
+    row: np.ndarray
+    data: np.ndarray
+
+
+class _ReentrantCachingSolver(CachingSolver):
+    """
+    Caching solver of a graph traversal which does not modify the `LCA` object.
+
+    The `CachingSolver` of `bw_graph_tools` writes the demand into `LCA.demand_array`.
+    This solver passes the demand vector to `LCA.solve_linear_system` instead,
+    so that the traversal can be resumed while the `LCA` object is used for other calculations
+    (for instance by an [`brightwebapp.traversal.LCAPool`][]).
+
+    Solutions are cached per solver (not in a cache shared by all solvers),
+    bounded by `maxsize` solutions and `maxbytes` bytes.
+    For a [`brightwebapp.dense.DenseInverseLCA`][], solutions are columns of the dense total requirements matrix
+    and are not cached.
+    """
+    def __init__(self, lca: bc.LCA, maxsize: int = 8096, maxbytes: int = 64 * 2**20):
+        super().__init__(lca)
+        self._solutions = LRUCache(maxsize=maxsize, maxbytes=maxbytes, sizeof=lambda solution: solution.nbytes)
+
+
+    def calculate(self, index: int) -> np.ndarray:
+        if isinstance(self.lca, DenseInverseLCA) and self.lca.dense:
+            return self.lca.total_requirements[:, index]
+        solution: Optional[np.ndarray] = self._solutions.get(index)
+        if solution is None:
+            demand_vector: np.ndarray = np.zeros(self.lca.technosphere_matrix.shape[0])
+            demand_vector[index] = 1
+            solution = self.lca.solve_linear_system(demand_vector)
+            self._solutions.put(index, solution)
+        return solution
+
+
+# approximate size of a `Node`, `Edge` or `Flow` object of `bw_graph_tools` with its attributes
+_GRAPH_OBJECT_NBYTES: int = 512
+
+
+class ResumableGraphTraversal(bgt.NewNodeEachVisitGraphTraversal):
+    """
+    Graph traversal which can be continued to a lower cutoff or a higher maximum number of calculations.
+
+    The graph traversal of `bw_graph_tools` discards the edges whose cumulative score is below the cutoff
+    and the nodes left on its priority queue when the maximum number of calculations is reached.
+    This class keeps both as the "frontier" of the traversal.
+    [`brightwebapp.traversal.ResumableGraphTraversal.refine`][] continues the traversal from the frontier,
+    so that the nodes which have already been visited are neither solved nor created again.
+
+    Without a binding `max_calc`, a refined traversal contains the same nodes (supply chain paths)
+    as a new traversal with the lower cutoff. The unique identifiers of the nodes
+    (and therefore the order of the nodes) can differ.
+
+    [`brightwebapp.traversal.ResumableGraphTraversal.detach`][] releases the `LCA` object
+    and the matrices derived from it (e.g. before the traversal is cached),
+    and [`brightwebapp.traversal.ResumableGraphTraversal.attach`][] provides an `LCA` object again before refining.
+
+    Example
+    -------
+    ```python
+    >>> traversal = ResumableGraphTraversal(
+    >>>     lca=lca,
+    >>>     settings=bgt.GraphTraversalSettings(cutoff=0.1, biosphere_cutoff=0.01, max_calc=100),
+    >>> )
+    >>> traversal.traverse()
+    >>> len(traversal.nodes)
+    5
+    >>> traversal.refine(cutoff=0.01)
+    >>> len(traversal.nodes)
+    42
+    >>> traversal.detach()
+    >>> traversal.attach(lca) # the same calculation, e.g. from an `LCAPool`
+    >>> traversal.refine(cutoff=0.001)
+    ```
+
+    See Also
+    --------
+    [`brightwebapp.traversal._traverse_graph`][]  
+    [`bw_graph_tools.NewNodeEachVisitGraphTraversal`](https://docs.brightway.dev/projects/graphtools/en/latest/content/api/bw_graph_tools/graph_traversal/new_node_each_visit/index.html#bw_graph_tools.graph_traversal.new_node_each_visit.NewNodeEachVisitGraphTraversal)
+
+    Parameters
+    ----------
+    lca : bc.LCA
+        An instance of the `bw2calc.LCA` class with the inventory and impact assessment calculated.
+        The traversal does not modify the `LCA` object.
+    settings : bgt.GraphTraversalSettings
+        Settings of the graph traversal.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._caching_solver = _ReentrantCachingSolver(self.lca)
+        self._attach_dense_matrices()
+        # the score of the `LCA` object can change if it is used for other calculations
+        self.total_score: float = self.lca.score
+        self.lock = threading.Lock()
+        self.cutoff: float = self.settings.cutoff
+        self.max_calc: int = self.settings.max_calc
+        self.truncated: Optional[str] = None
+        self.progress_callback: Optional[Callable[[dict], None]] = None
+        self._cancelled: bool = False
+        self._deadline: Optional[float] = None
+        self._started: float = time.monotonic()
+        # sum of the direct emissions scores of all nodes, see `progress`
+        self._covered_score: float = 0.0
+        self._heap: list = []
+        # edges discarded by the cutoff (or not evaluated within the time budget, with infinite score), as parallel arrays
+        self._pruned_consumer_unique_ids = array('q')
+        self._pruned_product_indices = array('q')
+        self._pruned_product_amounts = array('d')
+        self._pruned_scores = array('d')
+
+
+    @property
+    def frontier_size(self) -> int:
+        """
+        Number of nodes left on the priority queue and edges discarded by the cutoff.
+        If zero, refining the traversal does not add any nodes.
+        """
+        return len(self._heap) + len(self._pruned_scores)
+
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Approximate size in bytes of the cached solutions, the nodes, edges and flows
+        and the discarded edges of the traversal.
+        The `LCA` object and the matrices derived from it are not included,
+        see [`brightwebapp.traversal.ResumableGraphTraversal.detach`][].
+        """
+        return (
+            self._caching_solver._solutions.nbytes
+            + _GRAPH_OBJECT_NBYTES * (len(self._nodes) + len(self._edges) + len(self._flows) + len(self._heap))
+            + 32 * len(self._pruned_scores)
+        )
+
+
+    @property
+    def attached(self) -> bool:
+        """
+        Whether the traversal holds an `LCA` object and can be refined.
+        """
+        return self.lca is not None
+
+
+    def _attach_dense_matrices(self) -> None:
+        # with a dense total requirements matrix, scores are read from the intensity vectors of the `LCA` object
+        # and matrix columns from the index arrays of CSC matrices, see `_dense_traverse_edges`
+        self._total_intensity: Optional[np.ndarray] = None
+        if isinstance(self.lca, DenseInverseLCA) and self.lca.dense:
+            self._total_intensity = self.lca.total_intensity
+            self._direct_intensity: np.ndarray = self.lca.direct_intensity
+            self._technosphere_csc = self.lca.technosphere_matrix.tocsc()
+            self._technosphere_csc.sort_indices()
+            self._characterized_biosphere_csc = self.characterized_biosphere.tocsc()
+            self._characterized_biosphere_csc.sort_indices()
+            product_indices: np.ndarray = np.fromiter(self.production_exchange_mapping.keys(), dtype=np.int64)
+            producer_indices: np.ndarray = np.fromiter(self.production_exchange_mapping.values(), dtype=np.int64)
+            self._production_amounts: np.ndarray = np.zeros(self.lca.technosphere_matrix.shape[0])
+            self._production_amounts[product_indices] = np.asarray(
+                self.lca.technosphere_matrix[product_indices, producer_indices]
+            ).ravel()
+
+
+    def detach(self) -> None:
+        """
+        Releases the `LCA` object and the matrices derived from it
+        (the characterized biosphere matrix and, for a dense total requirements matrix, the CSC copies of the matrices).
+        The nodes, edges, frontier and cached solutions are kept.
+
+        A cached traversal then no longer keeps the factorized technosphere matrix alive,
+        also after an [`brightwebapp.traversal.LCAPool`][] has discarded the `LCA` object.
+        """
+        self.lca = None
+        self._caching_solver.lca = None
+        self.characterized_biosphere = None
+        self.production_exchange_mapping = None
+        self._total_intensity = None
+        self._direct_intensity = None
+        self._technosphere_csc = None
+        self._characterized_biosphere_csc = None
+        self._production_amounts = None
+
+
+    def attach(self, lca: bc.LCA) -> None:
+        """
+        Provides the `LCA` object of the traversal again after [`brightwebapp.traversal.ResumableGraphTraversal.detach`][].
+
+        Parameters
+        ----------
+        lca : bc.LCA
+            An `LCA` object with the same technosphere matrix and method as the original one
+            and the inventory and impact assessment calculated (e.g. from an [`brightwebapp.traversal.LCAPool`][]).
+            The total score of the traversal is not changed.
+        """
+        self.lca = lca
+        self._caching_solver.lca = lca
+        self.production_exchange_mapping = {
+            x: y for x, y in zip(*self.get_production_exchanges(lca.technosphere_mm))
+        }
+        self.characterized_biosphere = self.get_characterized_biosphere(lca)
+        self._attach_dense_matrices()
+
+
+    @property
+    def progress(self) -> dict:
+        """
+        Progress of the graph traversal, of the form:
+
+        ```python
+        {
+            'calculations': 12, # number of calculations performed
+            'max_calc': 100, # maximum number of calculations
+            'nodes': 25, # number of nodes found (without the functional unit)
+            'coverage': 0.93, # share of the total score covered by the direct burdens of the nodes
+            'elapsed_ms': 41.2, # wall-clock time since the (last) start of the traversal
+        }
+        ```
+        """
+        return {
+            'calculations': max(self.calculation_count, 0),
+            'max_calc': self._max_calc,
+            'nodes': len(self._nodes) - (self._functional_unit_unique_id in self._nodes),
+            'coverage': self._covered_score / self.total_score if self.total_score else np.nan,
+            'elapsed_ms': (time.monotonic() - self._started) * 1000,
+        }
+
+
+    def _start(
+        self,
+        time_budget_ms: Optional[float],
+        progress_callback: Optional[Callable[[dict], None]],
+    ) -> None:
+        self.truncated = None
+        self.progress_callback = progress_callback
+        self._started = time.monotonic()
+        self._deadline = None if time_budget_ms is None else self._started + time_budget_ms / 1000
+
+
+    def cancel(self) -> None:
+        """
+        Stops the graph traversal after the current calculation.
+        Can be called from another thread while the traversal runs; `truncated` is then set to `'cancelled'`.
+        """
+        self._cancelled = True
+
+
+    def _deadline_exceeded(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+
+    def traverse(
+        self,
+        *args,
+        time_budget_ms: Optional[float] = None,
+        progress_callback: Optional[Callable[[dict], None]] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Performs the graph traversal, see `NewNodeEachVisitGraphTraversal.traverse`.
+
+        Parameters
+        ----------
+        time_budget_ms : float | None, optional
+            Wall-clock time budget of the traversal in milliseconds.
+            If the budget is exceeded, the traversal stops and `truncated` is set to `'time_budget'`.
+            The inputs of the first node are always traversed.
+            The traversal can be continued with [`brightwebapp.traversal.ResumableGraphTraversal.refine`][].
+        progress_callback : Callable[[dict], None] | None, optional
+            Function called with the [`brightwebapp.traversal.ResumableGraphTraversal.progress`][]
+            after every expanded node and at the end of the traversal.
+        """
+        self._start(time_budget_ms, progress_callback)
+        try:
+            super().traverse(*args, **kwargs)
+        finally:
+            self.progress_callback = None
+
+
+    def _traverse(self, heap: list, max_depth: Optional[int] = None) -> None:
+        """
+        Expands the nodes on the priority queue `heap` (the loop of `NewNodeEachVisitGraphTraversal._traverse`),
+        until the queue is empty, the maximum number of calculations is reached or the time budget is exceeded.
+        """
+        self._heap = heap
+        while heap:
+            if self.exceeded_calculation_count:
+                warnings.warn("Stopping traversal due to calculation count.")
+                self.truncated = 'max_calc'
+                break
+            if self._cancelled:
+                self.truncated = 'cancelled'
+                break
+            # the functional unit and the first node are always traversed, so that the result is never empty
+            if heap[0][1].unique_id > 0 and self._deadline_exceeded():
+                self.truncated = 'time_budget'
+                break
+            _, node = heappop(heap)
+            product_indices, product_amounts = self.get_demand_vector_for_activity(
+                node=node,
+                skip_coproducts=self.settings.skip_coproducts,
+                matrix=self.lca.technosphere_matrix,
+            )
+            self._traverse_edges_of_node(
+                node=node,
+                product_indices=product_indices,
+                product_amounts=product_amounts,
+                max_depth=max_depth or self.settings.max_depth,
+            )
+            if self.progress_callback is not None:
+                self.progress_callback(self.progress)
+        if self.progress_callback is not None:
+            self.progress_callback(self.progress)
+
+
+    def _traverse_edges_of_node(
+        self,
+        node: bgt.Node,
+        product_indices: list[int],
+        product_amounts: list[float],
+        max_depth: Optional[int],
+    ) -> None:
+        self.traverse_edges(
+            consumer_index=node.activity_index,
+            consumer_unique_id=node.unique_id,
+            consumer_max_depth=node.max_depth,
+            product_indices=product_indices,
+            product_amounts=product_amounts,
+            lca=self.lca,
+            current_depth=node.depth,
+            max_depth=max_depth,
+            calculation_count=self._calculation_count,
+            characterized_biosphere=self.characterized_biosphere,
+            matrix=self.lca.technosphere_matrix,
+            edges=self._edges,
+            flows=self._flows,
+            nodes=self._nodes,
+            heap=self._heap,
+            caching_solver=self._caching_solver,
+            static_activity_indices=self.static_activity_indices,
+            production_exchange_mapping=self.production_exchange_mapping,
+            separate_biosphere_flows=self.settings.separate_biosphere_flows,
+            cutoff_score=self.cutoff_score,
+            biosphere_cutoff_score=self.biosphere_cutoff_score,
+        )
+
+
+    def get_demand_vector_for_activity(
+        self,
+        node: bgt.Node,
+        skip_coproducts: bool,
+        matrix,
+    ) -> tuple[list[int], list[float]]:
+        if self._total_intensity is None or node is self._root_node:
+            return super().get_demand_vector_for_activity(node=node, skip_coproducts=skip_coproducts, matrix=matrix)
+        # same inputs (in the same order) as `bw_graph_tools.graph_traversal.utils.get_demand_vector_for_activity`
+        start, end = self._technosphere_csc.indptr[node.activity_index:node.activity_index + 2]
+        rows: np.ndarray = self._technosphere_csc.indices[start:end]
+        amounts: np.ndarray = -node.supply_amount * self._technosphere_csc.data[start:end]
+        mask: np.ndarray = (rows != node.reference_product_index) & (amounts != 0)
+        if skip_coproducts:
+            mask &= amounts > 0
+        return rows[mask].tolist(), amounts[mask].tolist()
+
+
+    def _prune(self, consumer_unique_id: int, product_index: int, product_amount: float, score: float) -> None:
+        self._pruned_consumer_unique_ids.append(consumer_unique_id)
+        self._pruned_product_indices.append(product_index)
+        self._pruned_product_amounts.append(product_amount)
+        self._pruned_scores.append(score)
+
+
+    def traverse_edges(
+        self,
+        *,
+        consumer_unique_id: int,
+        product_indices: list[int],
+        product_amounts: list[float],
+        characterized_biosphere,
+        caching_solver: CachingSolver,
+        production_exchange_mapping: dict[int, int],
+        static_activity_indices: set[int],
+        cutoff_score: float,
+        **kwargs,
+    ) -> None:
+        """
+        Creates the nodes and edges of the inputs of a node,
+        remembering the edges discarded by the cutoff.
+        Inputs which cannot be evaluated within the time budget are remembered as well.
+        With a dense total requirements matrix, the scores of all inputs are computed at once.
+        """
+        kept_product_indices: list = []
+        kept_product_amounts: list = []
+        inputs: list = list(zip(product_indices, product_amounts))
+        scores: Optional[np.ndarray] = None
+        if self._total_intensity is not None and inputs:
+            indices, amounts = zip(*inputs)
+            scores = np.abs(np.asarray(amounts, dtype=float) * self._total_intensity[list(indices)])
+        for position, (product_index, product_amount) in enumerate(inputs):
+            if production_exchange_mapping[product_index] in static_activity_indices:
+                continue
+            if consumer_unique_id > 0 and self._deadline_exceeded():
+                for deferred_product_index, deferred_product_amount in inputs[position:]:
+                    self._prune(consumer_unique_id, deferred_product_index, deferred_product_amount, np.inf)
+                self.truncated = 'time_budget'
+                break
+            if scores is not None:
+                score: float = float(scores[position])
+            else:
+                score = abs(float((characterized_biosphere * caching_solver(product_index, product_amount)).sum()))
+            if score >= cutoff_score:
+                kept_product_indices.append(product_index)
+                kept_product_amounts.append(product_amount)
+            elif score > 0:
+                self._prune(consumer_unique_id, product_index, product_amount, score)
+        number_of_nodes: int = len(kwargs['nodes'])
+        if scores is not None:
+            self._dense_traverse_edges(
+                consumer_unique_id=consumer_unique_id,
+                product_indices=kept_product_indices,
+                product_amounts=kept_product_amounts,
+                production_exchange_mapping=production_exchange_mapping,
+                **kwargs,
+            )
+        else:
+            super().traverse_edges(
+                consumer_unique_id=consumer_unique_id,
+                product_indices=kept_product_indices,
+                product_amounts=kept_product_amounts,
+                characterized_biosphere=characterized_biosphere,
+                caching_solver=caching_solver,
+                production_exchange_mapping=production_exchange_mapping,
+                static_activity_indices=static_activity_indices,
+                cutoff_score=cutoff_score,
+                **kwargs,
+            )
+        # new nodes are appended to the `nodes` dictionary
+        for node in islice(reversed(kwargs['nodes'].values()), len(kwargs['nodes']) - number_of_nodes):
+            self._covered_score += float(node.direct_emissions_score)
+
+
+    def _dense_traverse_edges(
+        self,
+        *,
+        consumer_index: int,
+        consumer_unique_id: int,
+        consumer_max_depth: Optional[int],
+        product_indices: list[int],
+        product_amounts: list[float],
+        lca: bc.LCA,
+        current_depth: int,
+        calculation_count,
+        edges: list,
+        flows: list,
+        nodes: dict,
+        heap: list,
+        production_exchange_mapping: dict[int, int],
+        separate_biosphere_flows: bool,
+        biosphere_cutoff_score: float,
+        max_depth: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Creates the nodes and edges of the inputs of a node which are above the cutoff
+        (as `NewNodeEachVisitGraphTraversal.traverse_edges`) from the intensity vectors
+        of a [`brightwebapp.dense.DenseInverseLCA`][], without solving or slicing matrices.
+        """
+        biosphere = self._characterized_biosphere_csc
+        for product_index, product_amount in zip(product_indices, product_amounts):
+            producer_index: int = production_exchange_mapping[product_index]
+            cumulative_score: float = float(product_amount * self._total_intensity[product_index])
+            production_amount: float = float(self._production_amounts[product_index])
+            scale: float = product_amount / production_amount
+            producing_node = bgt.Node(
+                unique_id=next(calculation_count),
+                activity_datapackage_id=lca.dicts.activity.reversed[producer_index],
+                activity_index=producer_index,
+                reference_product_datapackage_id=lca.dicts.product.reversed[product_index],
+                reference_product_index=product_index,
+                reference_product_production_amount=production_amount,
+                supply_amount=scale,
+                depth=current_depth + 1,
+                max_depth=consumer_max_depth,
+                cumulative_score=cumulative_score,
+                direct_emissions_score=float(scale * self._direct_intensity[producer_index]),
+            )
+            edges.append(
+                bgt.Edge(
+                    consumer_index=consumer_index,
+                    consumer_unique_id=consumer_unique_id,
+                    producer_index=producer_index,
+                    producer_unique_id=producing_node.unique_id,
+                    product_index=product_index,
+                    amount=product_amount,
+                )
+            )
+            flow_score: float = 0.0
+            if separate_biosphere_flows:
+                start, end = biosphere.indptr[producer_index:producer_index + 2]
+                flow_score = self.add_biosphere_flows(
+                    flows=flows,
+                    matrix=_SparseColumn(row=biosphere.indices[start:end], data=scale * biosphere.data[start:end]),
+                    lca=lca,
+                    node=producing_node,
+                    biosphere_cutoff_score=biosphere_cutoff_score,
+                )
+            producing_node.direct_emissions_score_outside_specific_flows = (
+                producing_node.direct_emissions_score - flow_score
+            )
+            producing_node.remaining_cumulative_score_outside_specific_flows = (
+                producing_node.cumulative_score - flow_score
+            )
+            nodes[producing_node.unique_id] = producing_node
+            if producing_node.max_depth is not None:
+                satisfies_depth_constraint: bool = producing_node.max_depth > producing_node.depth
+            else:
+                satisfies_depth_constraint = max_depth is None or producing_node.depth < max_depth
+            if satisfies_depth_constraint:
+                heappush(heap, (abs(1 / cumulative_score), producing_node))
+
+
+    def refine(
+        self,
+        cutoff: Optional[float] = None,
+        max_calc: Optional[int] = None,
+        time_budget_ms: Optional[float] = None,
+        progress_callback: Optional[Callable[[dict], None]] = None,
+    ) -> None:
+        """
+        Continues the graph traversal to a lower cutoff and/or a higher maximum number of calculations.
+
+        The discarded edges whose cumulative score is above the new cutoff are added to the traversal
+        (in order of decreasing score), then the traversal continues from the priority queue.
+        A traversal which was stopped by its time budget is continued with the same cutoff.
+
+        Parameters
+        ----------
+        cutoff : float | None, optional
+            New cutoff. Must not be larger than the current cutoff. If `None`, the current cutoff is kept.
+        max_calc : int | None, optional
+            New maximum number of calculations (in total, including the calculations already performed).
+            Must not be smaller than the current value. If `None`, the current value is kept.
+        time_budget_ms : float | None, optional
+            Wall-clock time budget of the refinement in milliseconds, see [`brightwebapp.traversal.ResumableGraphTraversal.traverse`][].
+        progress_callback : Callable[[dict], None] | None, optional
+            Function called with the progress of the refinement, see [`brightwebapp.traversal.ResumableGraphTraversal.traverse`][].
+
+        Raises
+        ------
+        ValueError
+            If `cutoff` is larger than the current cutoff or `max_calc` is smaller than the current value,
+            or if the traversal is detached from its `LCA` object.
+        """
+        if not self.attached:
+            raise ValueError("Cannot refine a detached graph traversal. Attach an LCA object first.")
+        cutoff = self.cutoff if cutoff is None else cutoff
+        max_calc = self.max_calc if max_calc is None else max_calc
+        if cutoff > self.cutoff:
+            raise ValueError(
+                f"Cannot refine a graph traversal with cutoff {self.cutoff} to the larger cutoff {cutoff}."
+            )
+        if max_calc < self.max_calc:
+            raise ValueError(
+                f"Cannot refine a graph traversal with max_calc {self.max_calc} to the smaller max_calc {max_calc}."
+            )
+        self._start(time_budget_ms, progress_callback)
+        self._cancelled = False
+        self.cutoff = cutoff
+        self.max_calc = max_calc
+        self._max_calc = max_calc
+        self.cutoff_score = abs(self.total_score * cutoff)
+
+        scores: np.ndarray = np.array(self._pruned_scores, dtype=np.float64)
+        resumed: np.ndarray = scores >= self.cutoff_score
+        if resumed.any():
+            consumer_unique_ids: np.ndarray = np.array(self._pruned_consumer_unique_ids, dtype=np.int64)
+            product_indices: np.ndarray = np.array(self._pruned_product_indices, dtype=np.int64)
+            product_amounts: np.ndarray = np.array(self._pruned_product_amounts, dtype=np.float64)
+            order: np.ndarray = np.flatnonzero(resumed)[np.argsort(-scores[resumed], kind='stable')]
+            resumed_edges: list = list(zip(
+                consumer_unique_ids[order].tolist(),
+                product_indices[order].tolist(),
+                product_amounts[order].tolist(),
+            ))
+            kept: np.ndarray = ~resumed
+            self._pruned_consumer_unique_ids = array('q', consumer_unique_ids[kept].tobytes())
+            self._pruned_product_indices = array('q', product_indices[kept].tobytes())
+            self._pruned_product_amounts = array('d', product_amounts[kept].tobytes())
+            self._pruned_scores = array('d', scores[kept].tobytes())
+            for consumer_unique_id, product_index, product_amount in resumed_edges:
+                self._traverse_edges_of_node(
+                    node=self._nodes[consumer_unique_id],
+                    product_indices=[product_index],
+                    product_amounts=[product_amount],
+                    max_depth=self.settings.max_depth,
+                )
+
+        try:
+            self._traverse(self._heap, max_depth=self.settings.max_depth)
+        finally:
+            self.progress_callback = None
+        self._flows.sort(reverse=True)
+        non_terminal_nodes: set = {edge.consumer_unique_id for edge in self._edges}
+        for unique_id, node in self._nodes.items():
+            node.terminal = unique_id not in non_terminal_nodes
+
+
 def _traverse_graph(
     lca: bc.LCA,
     cutoff: float,
     biosphere_cutoff: float,
     max_calc: int,
+    time_budget_ms: Optional[float] = None,
+    progress_callback: Optional[Callable[[dict], None]] = None,
 ) -> dict:
     """
     Conducts a graph traversal of a life-cycle assessment calculation
     using the `bw_graph_tools` library.
 
+    The graph traversal is performed by a [`brightwebapp.traversal.ResumableGraphTraversal`][],
+    which is returned as well and can be continued to a lower cutoff.
+
     Warnings
     --------
     This function uses the new (v0.5) API of `bw_graph_tools` to perform a graph traversal:  
@@ -107,6 +966,13 @@ def _traverse_graph(
         A float representing the biosphere cutoff threshold for the graph traversal.
     max_calc : int
         An integer representing the maximum number of calculations to be performed during the graph traversal.
+    time_budget_ms : float | None, optional
+        Wall-clock time budget of the graph traversal in milliseconds. If `None`, the traversal is not limited in time.  
+        If the budget is exceeded, the traversal stops after the current calculation
+        and `traversal.truncated` is set to `'time_budget'`.
+    progress_callback : Callable[[dict], None] | None, optional
+        Function called with the progress of the graph traversal after every expanded node,
+        see [`brightwebapp.traversal.ResumableGraphTraversal.progress`][].
 
     Returns
     -------
@@ -116,11 +982,12 @@ def _traverse_graph(
         ```python
         {
             'nodes': dict,  # Dictionary of Node objects
-            'edges': list   # List of Edge objects
+            'edges': list,  # List of Edge objects
+            'traversal': ResumableGraphTraversal  # to continue the traversal with a lower cutoff
         }
         ```
     """
-    traversal = bgt.NewNodeEachVisitGraphTraversal(
+    traversal = ResumableGraphTraversal(
         lca=lca,
         settings=bgt.GraphTraversalSettings(
             cutoff=cutoff,
@@ -128,10 +995,11 @@ def _traverse_graph(
             max_calc=max_calc,
         )
     )
-    traversal.traverse()
+    traversal.traverse(time_budget_ms=time_budget_ms, progress_callback=progress_callback)
     return {
         'nodes': traversal.nodes,
         'edges': traversal.edges,
+        'traversal': traversal,
     }
 
 
@@ -143,6 +1011,8 @@ def _nodes_dict_to_dataframe(
     with human-readable descriptions and emissions values of the nodes in the graph traversal.
     Every node in the graph traversal is represented by a row in the DataFrame.
 
+    Node names are resolved in bulk through [`brightwebapp.brightway.get_node_metadata`][].
+
     Warnings
     --------
     By default, only the node producing the functional unit is scope 1.
@@ -152,7 +1022,8 @@ def _nodes_dict_to_dataframe(
     --------
     [`bw_graph_tools.graph_traversal.new_node_each_visit.NewNodeEachVisitGraphTraversal`](https://docs.brightway.dev/projects/graphtools/en/latest/content/api/bw_graph)  
     [`brightwebapp.traversal._traverse_graph`][]  
-    [`brightwebapp.traversal._edges_dict_to_dataframe`][]
+    [`brightwebapp.traversal._edges_dict_to_dataframe`][]  
+    [`brightwebapp.brightway.get_node_metadata`][]
 
     Parameters
     ----------
@@ -217,6 +1088,13 @@ def _nodes_dict_to_dataframe(
             f"Expected 'nodes' to be a dict, but got {type(nodes)}."
         )
 
+    node_names: dict = {
+        node_id: metadata['name']
+        for node_id, metadata in get_node_metadata(
+            node.activity_datapackage_id for node in nodes.values() if node.unique_id != -1
+        ).items()
+    }
+
     list_of_row_dicts = []
 
     for node in nodes.values():
@@ -231,7 +1109,7 @@ def _nodes_dict_to_dataframe(
             {
                 'UID': node.unique_id,
                 'Scope': scope,
-                'Name': bd.get_node(id=node.activity_datapackage_id)['name'],
+                'Name': node_names[node.activity_datapackage_id],
                 'SupplyAmount': node.supply_amount,
                 'BurdenIntensity': node.direct_emissions_score/node.supply_amount,
                 'Burden(Cumulative)': node.cumulative_score,
@@ -397,6 +1275,91 @@ def _trace_branch_from_last_node(
     return branch
 
 
+def _build_branches_from_parent_pointers(
+    consumer_unique_ids: np.ndarray,
+    producer_unique_ids: np.ndarray,
+) -> list:
+    """
+    Given two arrays of graph edges (`consumer_unique_ids[i] -> producer_unique_ids[i]`),
+    returns for every edge the branch of nodes that lead from the root node to the producer node.
+
+    Every producer node of a graph traversal has exactly one parent (consumer) node.
+    The function therefore first builds a parent-pointer mapping in a single pass over the edges
+    and then derives the branches from the parents. Every branch is built exactly once
+    by appending the producer node to the (already computed) branch of its parent.
+    The cost is `O(n · depth)`, compared to `O(n² · depth)` for repeated calls of
+    [`brightwebapp.traversal._trace_branch_from_last_node`][].
+
+    If a producer node appears more than once, the first edge determines its parent,
+    consistent with [`brightwebapp.traversal._trace_branch_from_last_node`][].
+
+    Example
+    -------
+    ```python
+    >>> _build_branches_from_parent_pointers(
+    >>>     consumer_unique_ids=np.array([0, 0, 0, 2, 3, 5]),
+    >>>     producer_unique_ids=np.array([1, 2, 3, 4, 5, 6]),
+    >>> )
+    [[0, 1], [0, 2], [0, 3], [0, 2, 4], [0, 3, 5], [0, 3, 5, 6]]
+    ```
+
+    See Also
+    --------
+    [`brightwebapp.traversal._add_branch_information_to_edges_dataframe`][]
+
+    Parameters
+    ----------
+    consumer_unique_ids : np.ndarray
+        Integer array of consumer node unique ids.
+    producer_unique_ids : np.ndarray
+        Integer array of producer node unique ids. Must have the same length as `consumer_unique_ids`.
+
+    Returns
+    -------
+    list
+        A list of branches (lists of `int`), one for every edge, in the order of the input arrays.
+
+    Raises
+    ------
+    ValueError
+        If the arrays have different lengths.  
+        If the edges contain a cycle.
+    """
+    consumer_unique_ids = np.asarray(consumer_unique_ids, dtype=np.int64)
+    producer_unique_ids = np.asarray(producer_unique_ids, dtype=np.int64)
+    if consumer_unique_ids.shape != producer_unique_ids.shape:
+        raise ValueError(
+            "Arrays 'consumer_unique_ids' and 'producer_unique_ids' must have the same length."
+        )
+
+    unique_producers, first_occurrence = np.unique(producer_unique_ids, return_index=True)
+    parent_of: dict = dict(zip(
+        unique_producers.tolist(),
+        consumer_unique_ids[first_occurrence].tolist()
+    ))
+
+    branch_of: dict = {}
+    max_branch_length: int = len(parent_of) + 1
+    for producer in unique_producers.tolist():
+        if producer in branch_of:
+            continue
+        unresolved: list = []
+        node: int = producer
+        while node in parent_of and node not in branch_of:
+            unresolved.append(node)
+            if len(unresolved) > max_branch_length:
+                raise ValueError(
+                    f"Cycle detected in graph edges while tracing node {producer}."
+                )
+            node = parent_of[node]
+        branch: list = branch_of.get(node, [node])
+        for node in reversed(unresolved):
+            branch = branch + [node]
+            branch_of[node] = branch
+
+    return [branch_of[producer] for producer in producer_unique_ids.tolist()]
+
+
 def _add_branch_information_to_edges_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     Given a dataframe of graph edges with columns `consumer_unique_id` and `producer_unique_id`
@@ -438,6 +1401,7 @@ def _add_branch_information_to_edges_dataframe(df: pd.DataFrame) -> pd.DataFrame
 
     See Also
     --------
+    [`brightwebapp.traversal._build_branches_from_parent_pointers`][]  
     [`brightwebapp.traversal._trace_branch_from_last_node`][]
 
     Parameters
@@ -454,16 +1418,909 @@ def _add_branch_information_to_edges_dataframe(df: pd.DataFrame) -> pd.DataFrame
     if df.empty:
         return pd.DataFrame()
 
-    branches: list = []
+    producer_unique_ids: np.ndarray = df['producer_unique_id'].to_numpy()
+    branches: list = _build_branches_from_parent_pointers(
+        consumer_unique_ids=df['consumer_unique_id'].to_numpy(),
+        producer_unique_ids=producer_unique_ids,
+    )
+
+    return pd.DataFrame({
+        'producer_unique_id': producer_unique_ids,
+        'Branch': branches,
+    })
+
+
+@dataclass
+class TraversalResult:
+    """
+    Columnar representation of a graph traversal.
+
+    Nodes and edges of the graph traversal are stored as contiguous NumPy arrays,
+    filled directly from the `bw_graph_tools` `Node` and `Edge` objects
+    (see [`brightwebapp.traversal.TraversalResult.from_traversal`][]).
+    Node names and branches are only computed when they are first needed,
+    and the DataFrame, CSV and Arrow representations are built on demand.
+
+    The virtual functional unit node (`unique_id == -1`) is not included.
+    Node arrays are ordered by traversal order (the same order as the rows of the DataFrame),
+    edge arrays by the order in which the edges were found.
 
-    for _, row in df.iterrows():
-        branch: list = _trace_branch_from_last_node(df, int(row['producer_unique_id']))
-        branches.append({
-            'producer_unique_id': row['producer_unique_id'],
-            'Branch': branch
+    Example
+    -------
+    ```python
+    >>> result = TraversalResult.from_traversal(nodes=traversal['nodes'], edges=traversal['edges'])
+    >>> result.burden_direct.sum()
+    37.15
+    >>> result.to_dataframe()
+    ```
+
+    See Also
+    --------
+    [`brightwebapp.traversal.perform_graph_traversal`][]
+
+    Attributes
+    ----------
+    uid : np.ndarray
+        Unique identifiers of the nodes (`int64`).
+    scope : np.ndarray
+        Scope of the nodes (`int64`, 1 for the node producing the functional unit, 3 for all other nodes).
+    activity_datapackage_id : np.ndarray
+        Brightway node ids of the nodes (`int64`).
+    depth : np.ndarray
+        Depth of the nodes in the graph (`int64`).
+    supply_amount : np.ndarray
+        Supply amount of the nodes (`float64`).
+    burden_intensity : np.ndarray
+        Direct burden per unit supply amount of the nodes (`float64`).
+    burden_cumulative : np.ndarray
+        Cumulative burden of the nodes (`float64`).
+    burden_direct : np.ndarray
+        Direct burden of the nodes (`float64`).
+    parent_index : np.ndarray
+        Position of the parent (consumer) node in the node arrays (`int64`), `-1` for nodes without parent.
+    activity_index : np.ndarray
+        Technosphere matrix column index of the nodes (`int64`).
+    reference_product_index : np.ndarray
+        Technosphere matrix row index of the reference product of the nodes (`int64`).
+    reference_product_production_amount : np.ndarray
+        Net production amount of the reference product of the nodes (`float64`).
+    consumer_unique_id : np.ndarray
+        Unique identifiers of the consumer nodes of the edges (`int64`).
+    producer_unique_id : np.ndarray
+        Unique identifiers of the producer nodes of the edges (`int64`).
+    total_score : float
+        Total score of the life-cycle assessment calculation, `nan` if unknown.
+    truncated : str
+        Reason why the graph traversal stopped before the cutoff was reached
+        (`'max_calc'`, `'time_budget'` or `'cancelled'`), empty if it was not truncated.
+    """
+    uid: np.ndarray
+    scope: np.ndarray
+    activity_datapackage_id: np.ndarray
+    depth: np.ndarray
+    supply_amount: np.ndarray
+    burden_intensity: np.ndarray
+    burden_cumulative: np.ndarray
+    burden_direct: np.ndarray
+    parent_index: np.ndarray
+    activity_index: np.ndarray
+    reference_product_index: np.ndarray
+    reference_product_production_amount: np.ndarray
+    consumer_unique_id: np.ndarray
+    producer_unique_id: np.ndarray
+    total_score: float = np.nan
+    truncated: str = ''
+
+
+    @classmethod
+    def from_traversal(
+        cls,
+        nodes: dict,
+        edges: list,
+        total_score: float = np.nan,
+        truncated: Optional[str] = None,
+    ) -> 'TraversalResult':
+        """
+        Builds a `TraversalResult` from the nodes and edges of a graph traversal
+        (see [`brightwebapp.traversal._traverse_graph`][]).
+
+        The edge linking the virtual functional unit node (`unique_id == -1`) to the first node is skipped,
+        consistent with [`brightwebapp.traversal._edges_dict_to_dataframe`][].
+
+        Parameters
+        ----------
+        nodes : dict
+            A dictionary of `bw_graph_tools` `Node` objects.
+        edges : list
+            A list of `bw_graph_tools` `Edge` objects.
+        total_score : float, optional
+            Total score of the life-cycle assessment calculation.
+        truncated : str | None, optional
+            Reason why the graph traversal was truncated, see `ResumableGraphTraversal.truncated`.
+
+        Returns
+        -------
+        TraversalResult
+            The columnar graph traversal.
+
+        Raises
+        ------
+        TypeError
+            If `nodes` is not a dictionary or `edges` is not a list.
+        """
+        if not isinstance(nodes, dict):
+            raise TypeError(
+                f"Expected 'nodes' to be a dict, but got {type(nodes)}."
+            )
+        if not isinstance(edges, list):
+            raise TypeError(
+                f"Expected 'edges' to be a list, but got {type(edges)}."
+            )
+        list_of_nodes: list = [node for node in nodes.values() if node.unique_id != -1]
+        number_of_nodes: int = len(list_of_nodes)
+        list_of_edges: list = edges[1:]
+        number_of_edges: int = len(list_of_edges)
+
+        def node_array(attribute: str, dtype: type) -> np.ndarray:
+            return np.fromiter(
+                (getattr(node, attribute) for node in list_of_nodes),
+                dtype=dtype,
+                count=number_of_nodes,
+            )
+
+        def edge_array(attribute: str) -> np.ndarray:
+            return np.fromiter(
+                (getattr(edge, attribute) for edge in list_of_edges),
+                dtype=np.int64,
+                count=number_of_edges,
+            )
+
+        uid = node_array('unique_id', np.int64)
+        supply_amount = node_array('supply_amount', np.float64)
+        direct_emissions_score = node_array('direct_emissions_score', np.float64)
+        consumer_unique_id = edge_array('consumer_unique_id')
+        producer_unique_id = edge_array('producer_unique_id')
+
+        position_of_uid: dict = dict(zip(uid.tolist(), range(number_of_nodes)))
+        parent_index = np.full(number_of_nodes, -1, dtype=np.int64)
+        for consumer, producer in zip(consumer_unique_id[::-1].tolist(), producer_unique_id[::-1].tolist()):
+            if producer in position_of_uid and consumer in position_of_uid:
+                parent_index[position_of_uid[producer]] = position_of_uid[consumer]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            burden_intensity = direct_emissions_score / supply_amount
+
+        return cls(
+            uid=uid,
+            scope=np.where(uid == 0, 1, 3).astype(np.int64),
+            activity_datapackage_id=node_array('activity_datapackage_id', np.int64),
+            depth=node_array('depth', np.int64),
+            supply_amount=supply_amount,
+            burden_intensity=burden_intensity,
+            burden_cumulative=node_array('cumulative_score', np.float64),
+            burden_direct=direct_emissions_score + node_array('direct_emissions_score_outside_specific_flows', np.float64),
+            parent_index=parent_index,
+            activity_index=node_array('activity_index', np.int64),
+            reference_product_index=node_array('reference_product_index', np.int64),
+            reference_product_production_amount=node_array('reference_product_production_amount', np.float64),
+            consumer_unique_id=consumer_unique_id,
+            producer_unique_id=producer_unique_id,
+            total_score=float(total_score),
+            truncated=truncated or '',
+        )
+
+
+    def __len__(self) -> int:
+        return len(self.uid)
+
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Total size of the node and edge arrays in bytes.
+        """
+        return sum(
+            getattr(self, field.name).nbytes
+            for field in fields(self)
+            if isinstance(getattr(self, field.name), np.ndarray)
+        )
+
+
+    @property
+    def coverage(self) -> float:
+        """
+        Share of the total score covered by the direct burdens of the traversed nodes
+        (`burden_intensity * supply_amount`, without the burdens outside the specific biosphere flows),
+        `nan` if the total score is unknown or zero.
+        Close to 1 for a complete graph traversal with a low cutoff.
+        """
+        if not self.total_score:
+            return np.nan
+        return float(np.nansum(self.burden_intensity * self.supply_amount) / self.total_score)
+
+
+    def save(self, path: str | Path) -> None:
+        """
+        Saves the node and edge arrays to an uncompressed NumPy `.npz` file.
+        The file is written atomically, so that concurrent readers never see a partially written file.
+
+        See Also
+        --------
+        [`brightwebapp.traversal.TraversalResult.load`][]
+
+        Parameters
+        ----------
+        path : str | Path
+            Path of the `.npz` file.
+        """
+        path = Path(path)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                np.savez(file, **{field.name: getattr(self, field.name) for field in fields(self)})
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+
+    @classmethod
+    def load(cls, path: str | Path) -> 'TraversalResult':
+        """
+        Loads a `TraversalResult` saved with [`brightwebapp.traversal.TraversalResult.save`][].
+
+        Parameters
+        ----------
+        path : str | Path
+            Path of the `.npz` file.
+
+        Returns
+        -------
+        TraversalResult
+            The columnar graph traversal. Node names are resolved again from the current project when needed.
+        """
+        with np.load(path, allow_pickle=False) as arrays:
+            return cls(**{
+                field.name: arrays[field.name].item() if arrays[field.name].ndim == 0 else arrays[field.name]
+                for field in fields(cls)
+                if field.name in arrays
+            })
+
+
+    @cached_property
+    def names(self) -> list:
+        """
+        Names of the nodes, resolved in bulk through [`brightwebapp.brightway.get_node_metadata`][].
+        """
+        node_names: dict = get_node_metadata(self.activity_datapackage_id.tolist())
+        return [node_names[node_id]['name'] for node_id in self.activity_datapackage_id.tolist()]
+
+
+    @cached_property
+    def branches(self) -> list:
+        """
+        Branches of the nodes (lists of unique identifiers from the first node to the node itself),
+        `None` for nodes which are not the producer of any edge.
+        See [`brightwebapp.traversal._build_branches_from_parent_pointers`][].
+        """
+        branch_of_producer: dict = dict(zip(
+            self.producer_unique_id.tolist(),
+            _build_branches_from_parent_pointers(
+                consumer_unique_ids=self.consumer_unique_id,
+                producer_unique_ids=self.producer_unique_id,
+            )
+        ))
+        return [branch_of_producer.get(uid) for uid in self.uid.tolist()]
+
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Returns the graph traversal as a DataFrame.
+        See [`brightwebapp.traversal.perform_graph_traversal`][] for a description of the columns.
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame with one row per node.
+        """
+        return self._to_dataframe(slice(None))
+
+
+    def _to_dataframe(self, rows: slice) -> pd.DataFrame:
+        """
+        Returns the rows `rows` of the graph traversal as a DataFrame.
+        Names are only resolved for these rows, unless they are already resolved for all nodes.
+        """
+        if rows == slice(None) or 'names' in self.__dict__:
+            names: list = self.names[rows]
+        else:
+            node_ids: list = self.activity_datapackage_id[rows].tolist()
+            node_names: dict = get_node_metadata(node_ids)
+            names: list = [node_names[node_id]['name'] for node_id in node_ids]
+        return pd.DataFrame({
+            'UID': self.uid[rows],
+            'Scope': self.scope[rows],
+            'Name': pd.Series(names, dtype=object),
+            'SupplyAmount': self.supply_amount[rows],
+            'BurdenIntensity': self.burden_intensity[rows],
+            'Burden(Cumulative)': self.burden_cumulative[rows],
+            'Burden(Direct)': self.burden_direct[rows],
+            'Depth': self.depth[rows],
+            'Branch': pd.Series(
+                [np.nan if branch is None else branch for branch in self.branches[rows]],
+                dtype=object
+            ),
         })
 
-    return pd.DataFrame(branches)
+
+    def to_csv(self) -> str:
+        """
+        Returns the graph traversal as a CSV string, separated by `,` without an index column.
+        """
+        return self.to_dataframe().to_csv(index=False)
+
+
+    def iter_csv(self, chunksize: int = 1000) -> Iterator[str]:
+        """
+        Yields the graph traversal as CSV, `chunksize` rows at a time.
+        The first chunk starts with the header row.
+        Together, the chunks are identical to [`brightwebapp.traversal.TraversalResult.to_csv`][].
+
+        Neither the DataFrame of all nodes nor the complete CSV string is built,
+        so that the first chunk is available quickly and memory use stays bounded by `chunksize`.
+
+        Parameters
+        ----------
+        chunksize : int
+            Number of rows per chunk.
+
+        Yields
+        ------
+        str
+            CSV string of up to `chunksize` rows.
+        """
+        yield from _iter_csv(self._to_dataframe, len(self), chunksize)
+
+
+    def to_arrow(self):
+        """
+        Returns the graph traversal as a [PyArrow Table](https://arrow.apache.org/docs/python/generated/pyarrow.Table.html).
+        The `Branch` column is a native `list<int32>` column (`null` for nodes without branch).
+
+        Warnings
+        --------
+        Requires the optional dependency `pyarrow`.
+
+        Returns
+        -------
+        pyarrow.Table
+            A table with one row per node and the same columns as [`brightwebapp.traversal.TraversalResult.to_dataframe`][].
+
+        Raises
+        ------
+        ImportError
+            If `pyarrow` is not installed.
+        """
+        pa = _import_pyarrow()
+        return pa.table({
+            'UID': pa.array(self.uid),
+            'Scope': pa.array(self.scope),
+            'Name': pa.array(self.names, type=pa.string()),
+            'SupplyAmount': pa.array(self.supply_amount),
+            'BurdenIntensity': pa.array(self.burden_intensity),
+            'Burden(Cumulative)': pa.array(self.burden_cumulative),
+            'Burden(Direct)': pa.array(self.burden_direct),
+            'Depth': pa.array(self.depth),
+            'Branch': pa.array(self.branches, type=pa.list_(pa.int32())),
+        })
+
+
+    def to_parquet(self) -> bytes:
+        """
+        Returns the graph traversal as a [Parquet](https://parquet.apache.org) file
+        with the columns of [`brightwebapp.traversal.TraversalResult.to_arrow`][].
+
+        Warnings
+        --------
+        Requires the optional dependency `pyarrow`.
+
+        Raises
+        ------
+        ImportError
+            If `pyarrow` is not installed.
+        """
+        return _arrow_table_to_parquet(self.to_arrow())
+
+
+def _import_pyarrow():
+    """
+    Returns the `pyarrow` module.
+
+    Raises
+    ------
+    ImportError
+        If `pyarrow` is not installed.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "The 'pyarrow' package is required for Arrow output. "
+            "Install it with `pip install brightwebapp[arrow]`."
+        ) from e
+    return pa
+
+
+def _arrow_table_to_parquet(table) -> bytes:
+    """
+    Returns a PyArrow Table as a Parquet file.
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer)
+    return buffer.getvalue()
+
+
+def _arrow_table_to_ipc_stream(table) -> bytes:
+    """
+    Returns a PyArrow Table in the [Arrow IPC streaming format](https://arrow.apache.org/docs/format/Columnar.html#ipc-streaming-format)
+    (media type `application/vnd.apache.arrow.stream`).
+    """
+    pa = _import_pyarrow()
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _iter_csv(
+    dataframe_of_rows,
+    number_of_rows: int,
+    chunksize: int,
+) -> Iterator[str]:
+    """
+    Yields a table as CSV, `chunksize` rows at a time, separated by `,` without an index column.
+    The first chunk starts with the header row.
+
+    Parameters
+    ----------
+    dataframe_of_rows : Callable
+        Function returning the DataFrame of the rows in a `slice`.
+    number_of_rows : int
+        Number of rows of the table.
+    chunksize : int
+        Number of rows per chunk. Must be positive.
+
+    Yields
+    ------
+    str
+        CSV string of up to `chunksize` rows.
+
+    Raises
+    ------
+    ValueError
+        If `chunksize` is not positive.
+    """
+    if chunksize <= 0:
+        raise ValueError(
+            f"Expected 'chunksize' to be positive, but got {chunksize}."
+        )
+    for start in range(0, max(number_of_rows, 1), chunksize):
+        yield dataframe_of_rows(slice(start, start + chunksize)).to_csv(index=False, header=(start == 0))
+
+
+def _method_label(method: tuple) -> str:
+    """
+    Returns a compact string label of an impact assessment method,
+    used to name the columns of multi-method tables.
+
+    Example
+    -------
+    ```python
+    >>> _method_label(('Impact Potential', 'GCC'))
+    'Impact Potential|GCC'
+    ```
+    """
+    return '|'.join(str(part) for part in method)
+
+
+# factorizations of transposed technosphere matrices, kept as long as their `LCA` object (e.g. in an `LCAPool`)
+_TRANSPOSED_SOLVERS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_TRANSPOSED_SOLVERS_LOCK = threading.Lock()
+
+
+def _solve_transposed(lca: bc.LCA, rhs: np.ndarray) -> np.ndarray:
+    """
+    Solves the adjoint system $A^T x = \\text{rhs}$ of the technosphere matrix $A$ of `lca`.
+
+    For a [`brightwebapp.dense.DenseInverseLCA`][] with a dense total requirements matrix $L = A^{-1}$,
+    $x = L^T \\text{rhs}$. If the technosphere matrix was factorized by SuperLU
+    (`bw2calc` without `pypardiso`), the factorization is reused for the transposed system.
+    Otherwise, $A^T$ is factorized once per `LCA` object and technosphere matrix.
+    """
+    if isinstance(lca, DenseInverseLCA) and lca.dense:
+        return lca.total_requirements.T @ rhs
+    factorization = getattr(getattr(lca, 'solver', None), '__self__', None)
+    if isinstance(factorization, SuperLU):
+        return factorization.solve(rhs, trans='T')
+    with _TRANSPOSED_SOLVERS_LOCK:
+        matrix, factorization = _TRANSPOSED_SOLVERS.get(lca, (None, None))
+        if matrix is not lca.technosphere_matrix:
+            factorization = splu(lca.technosphere_matrix.T.tocsc())
+            _TRANSPOSED_SOLVERS[lca] = (lca.technosphere_matrix, factorization)
+    return factorization.solve(rhs)
+
+
+def _characterize_traversal_result(
+    lca: bc.LCA,
+    traversal_result: TraversalResult,
+    methods: list,
+) -> dict:
+    """
+    Characterizes the nodes of a graph traversal with several impact assessment methods.
+
+    The supply chain (nodes, edges and supply amounts) of `traversal_result` is kept,
+    only the burden arrays are computed for every method. No new inventory calculation is needed:
+    for every method $m$ with characterized direct burdens per unit of activity $c_m = \\mathbf{1}^T C_m B$,
+    a single adjoint system $A^T \\lambda_m = c_m$ gives the cumulative burden per unit of every product.
+    All methods share one factorization of $A^T$, which is reused from the `LCA` object where possible
+    (see [`brightwebapp.traversal._solve_transposed`][]). For every node
+
+    - `burden_intensity` $= c_m[\\text{activity}]$
+    - `burden_direct` $=$ `supply_amount` $\\cdot c_m[\\text{activity}]$
+    - `burden_cumulative` $=$ `supply_amount` $\\cdot$ `reference_product_production_amount` $\\cdot \\lambda_m[\\text{product}]$
+
+    Warnings
+    --------
+    `lca` must be characterized with `methods[0]`.
+    The characterization matrix of `lca` is switched to the other methods and back to `methods[0]`.
+
+    Notes
+    -----
+    `burden_direct` is computed from the characterized biosphere flows of the node only.
+    It does not add `direct_emissions_score_outside_specific_flows`,
+    as `Burden(Direct)` of a single-method traversal does.
+
+    See Also
+    --------
+    [`brightwebapp.traversal.perform_graph_traversal`][]
+
+    Parameters
+    ----------
+    lca : bc.LCA
+        The `LCA` object used for the graph traversal.
+    traversal_result : TraversalResult
+        The graph traversal.
+    methods : list
+        A list of impact assessment methods (tuples).
+
+    Returns
+    -------
+    dict
+        A dictionary mapping every method to a [`brightwebapp.traversal.TraversalResult`][]
+        with the same supply chain and the burdens of that method.
+    """
+    intensities: list = []
+    for index, method in enumerate(methods):
+        if index > 0:
+            lca.switch_method(tuple(method))
+        intensities.append(_direct_intensity(lca))
+    if len(methods) > 1:
+        lca.switch_method(tuple(methods[0]))
+
+    characterized_intensities: np.ndarray = np.column_stack(intensities)
+    cumulative_intensities: np.ndarray = _solve_transposed(lca, characterized_intensities)
+    if cumulative_intensities.ndim == 1:
+        cumulative_intensities = cumulative_intensities[:, np.newaxis]
+
+    results: dict = {}
+    for index, method in enumerate(methods):
+        burden_intensity = characterized_intensities[traversal_result.activity_index, index]
+        results[tuple(method)] = dataclasses.replace(
+            traversal_result,
+            burden_intensity=burden_intensity,
+            burden_direct=traversal_result.supply_amount * burden_intensity,
+            total_score=float(characterized_intensities[:, index] @ lca.supply_array),
+            burden_cumulative=(
+                traversal_result.supply_amount
+                * traversal_result.reference_product_production_amount
+                * cumulative_intensities[traversal_result.reference_product_index, index]
+            ),
+        )
+    return results
+
+
+def _traversal_results_to_wide_dataframe(results: dict) -> pd.DataFrame:
+    """
+    Returns a single DataFrame with the columns of [`brightwebapp.traversal.TraversalResult.to_dataframe`][]
+    and one `BurdenIntensity`, `Burden(Cumulative)` and `Burden(Direct)` column per method.
+
+    The burden columns are named after the method (see [`brightwebapp.traversal._method_label`][]).
+    For example:
+
+    | `UID` | `Scope` | `Name` | `SupplyAmount` | `BurdenIntensity[Impact Potential\\|GCC]` | (...) | `Burden(Direct)[Impact Potential\\|HC]` | `Depth` | `Branch` |
+    |-------|---------|--------|----------------|----------------------------------------------|-------|--------------------------------------------|---------|----------|
+    | (...) | (...)   | (...)  | (...)          | (...)                                        | (...) | (...)                                      | (...)   | (...)    |
+
+    Parameters
+    ----------
+    results : dict
+        A dictionary mapping methods to [`brightwebapp.traversal.TraversalResult`][] objects
+        with the same supply chain, as returned by [`brightwebapp.traversal._characterize_traversal_result`][].
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame with one row per node.
+    """
+    first_result: TraversalResult = next(iter(results.values()))
+    df: pd.DataFrame = first_result.to_dataframe()
+    columns: dict = {
+        'UID': df['UID'],
+        'Scope': df['Scope'],
+        'Name': df['Name'],
+        'SupplyAmount': df['SupplyAmount'],
+    }
+    for method, result in results.items():
+        label: str = _method_label(method)
+        columns[f'BurdenIntensity[{label}]'] = result.burden_intensity
+        columns[f'Burden(Cumulative)[{label}]'] = result.burden_cumulative
+        columns[f'Burden(Direct)[{label}]'] = result.burden_direct
+    columns['Depth'] = df['Depth']
+    columns['Branch'] = df['Branch']
+    return pd.DataFrame(columns)
+
+
+def _traversal_results_to_wide_arrow(results: dict):
+    """
+    Returns the table of [`brightwebapp.traversal._traversal_results_to_wide_dataframe`][] as a PyArrow Table,
+    with the `Branch` column as a native `list<int32>` column.
+
+    Raises
+    ------
+    ImportError
+        If `pyarrow` is not installed.
+    """
+    pa = _import_pyarrow()
+    first_table = next(iter(results.values())).to_arrow()
+    columns: dict = {
+        name: first_table.column(name) for name in ['UID', 'Scope', 'Name', 'SupplyAmount']
+    }
+    for method, result in results.items():
+        label: str = _method_label(method)
+        columns[f'BurdenIntensity[{label}]'] = pa.array(result.burden_intensity)
+        columns[f'Burden(Cumulative)[{label}]'] = pa.array(result.burden_cumulative)
+        columns[f'Burden(Direct)[{label}]'] = pa.array(result.burden_direct)
+    columns['Depth'] = first_table.column('Depth')
+    columns['Branch'] = first_table.column('Branch')
+    return pa.table(columns)
+
+
+def _traversal_cache_key(
+    demand: dict,
+    method: tuple,
+    cutoff: Optional[float],
+    biosphere_cutoff: float,
+    max_calc: Optional[int],
+) -> str:
+    """
+    Returns a cache key for a graph traversal.
+
+    The key is a SHA-256 hex digest of the current project and the modification stamps of its databases
+    (see [`brightwebapp.caching._project_revision`][]),
+    the demand (database, code and amount of every node), the method and its modification stamp
+    (see [`brightwebapp.caching._method_revision`][]) and the traversal settings.
+    It is safe to use as a filename.
+
+    With `cutoff` and `max_calc` set to `None`, the key identifies all traversals
+    which can be continued from one another (see [`brightwebapp.traversal.ResumableGraphTraversal`][]).
+
+    Parameters
+    ----------
+    demand : dict
+        Demand dictionary of `bw2data` nodes and amounts.
+    method : tuple
+        Impact assessment method.
+    cutoff : float | None
+        Cutoff threshold of the graph traversal.
+    biosphere_cutoff : float
+        Biosphere cutoff threshold of the graph traversal.
+    max_calc : int | None
+        Maximum number of calculations of the graph traversal.
+
+    Returns
+    -------
+    str
+        The cache key.
+    """
+    key = (
+        _project_revision(),
+        tuple(sorted((node['database'], node['code'], float(amount)) for node, amount in demand.items())),
+        _method_revision(method),
+        None if cutoff is None else float(cutoff),
+        float(biosphere_cutoff),
+        None if max_calc is None else int(max_calc),
+    )
+    return hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+
+
+class TraversalCache:
+    """
+    Two-tier cache of graph traversal results.
+
+    The first tier is an in-memory [`brightwebapp.caching.LRUCache`][],
+    bounded by the number of entries and by the total size of the cached arrays.
+    The optional second tier stores every result as a `.npz` file in `cache_dir`
+    (see [`brightwebapp.traversal.TraversalResult.save`][]), so that results survive restarts.
+    Results found on disk are promoted to the memory tier.
+
+    Cache keys are created by [`brightwebapp.traversal._traversal_cache_key`][].
+    Since the keys include the modification stamps of the project databases,
+    results are never served for a database which has been modified in the meantime.
+
+    In addition, the cache keeps the most recent [`brightwebapp.traversal.ResumableGraphTraversal`][] objects in memory,
+    keyed independently of the cutoff and the maximum number of calculations.
+    A request with a lower cutoff (or a higher maximum number of calculations) continues such a traversal
+    instead of starting over,
+    with an `LCA` object checked out from the `lca_pool` of [`brightwebapp.traversal.perform_graph_traversal`][].
+    Cached traversals are detached from their `LCA` object (see [`brightwebapp.traversal.ResumableGraphTraversal.detach`][]),
+    so that they do not keep factorized technosphere matrices alive.
+
+    The cache can be shared between threads (e.g. the worker threads of a [`brightwebapp.jobs.TraversalJobQueue`][]):
+    lookups and updates of the memory tier, the disk tier and the counters hold the lock of the memory tier.
+
+    Example
+    -------
+    ```python
+    >>> cache = TraversalCache(cache_dir='/tmp/brightwebapp_cache')
+    >>> perform_graph_traversal(cutoff=0.01, biosphere_cutoff=0.01, max_calc=100, return_format='csv', demand=demand, method=method, cache=cache)
+    >>> cache.stats()
+    {'hits': 0, 'disk_hits': 0, 'misses': 1, 'evictions': 0, 'size': 1, 'nbytes': 5312, ...}
+    ```
+
+    See Also
+    --------
+    [`brightwebapp.traversal.perform_graph_traversal`][]
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of results held in memory.
+    maxbytes : int
+        Maximum total size of the results held in memory in bytes.
+    cache_dir : str | Path | None, optional
+        Directory for the on-disk tier. Created if it does not exist.
+        If `None`, results are only cached in memory.
+    max_frontiers : int
+        Maximum number of resumable graph traversals held in memory.
+    max_frontier_bytes : int
+        Maximum total size of the resumable graph traversals held in memory in bytes
+        (see [`brightwebapp.traversal.ResumableGraphTraversal.nbytes`][]).
+    """
+    def __init__(
+        self,
+        maxsize: int = 128,
+        maxbytes: int = 512 * 2**20,
+        cache_dir: Optional[str | Path] = None,
+        max_frontiers: int = 16,
+        max_frontier_bytes: int = 512 * 2**20,
+    ):
+        self.memory = LRUCache(
+            maxsize=maxsize,
+            maxbytes=maxbytes,
+            sizeof=lambda traversal_result: traversal_result.nbytes,
+        )
+        self.cache_dir: Optional[Path] = None if cache_dir is None else Path(cache_dir)
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.frontiers = LRUCache(
+            maxsize=max_frontiers,
+            maxbytes=max_frontier_bytes,
+            sizeof=lambda traversal: traversal.nbytes,
+        )
+        self.hits: int = 0
+        self.disk_hits: int = 0
+        self.misses: int = 0
+        self.refinements: int = 0
+
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}.npz'
+
+
+    def get(self, key: str) -> Optional[TraversalResult]:
+        """
+        Returns the result stored under `key` from memory or disk, or `None` if there is none.
+        """
+        with self.memory.lock:
+            traversal_result: Optional[TraversalResult] = self.memory.get(key)
+            if traversal_result is not None:
+                self.hits += 1
+                return traversal_result
+            if self.cache_dir is not None and self._path(key).exists():
+                try:
+                    traversal_result = TraversalResult.load(self._path(key))
+                except (OSError, ValueError, KeyError):
+                    traversal_result = None
+                if traversal_result is not None:
+                    self.disk_hits += 1
+                    self.memory.put(key, traversal_result)
+                    return traversal_result
+            self.misses += 1
+            return None
+
+
+    def put(self, key: str, traversal_result: TraversalResult) -> None:
+        """
+        Stores `traversal_result` under `key` in memory and, if `cache_dir` is set, on disk.
+        """
+        with self.memory.lock:
+            self.memory.put(key, traversal_result)
+            if self.cache_dir is not None:
+                traversal_result.save(self._path(key))
+
+
+    def get_frontier(self, key: str) -> Optional[ResumableGraphTraversal]:
+        """
+        Returns the resumable graph traversal stored under `key`, or `None` if there is none.
+        """
+        return self.frontiers.get(key)
+
+
+    def put_frontier(self, key: str, traversal: ResumableGraphTraversal, refined: bool = False) -> None:
+        """
+        Stores the resumable graph traversal `traversal` under `key` in memory.
+        If `refined` is `True`, the traversal has been continued from a cached traversal and is counted as a refinement.
+
+        The traversal should be detached from its `LCA` object
+        (see [`brightwebapp.traversal.ResumableGraphTraversal.detach`][]),
+        since its size in `max_frontier_bytes` does not include the `LCA` object.
+        """
+        with self.memory.lock:
+            self.frontiers.put(key, traversal)
+            self.refinements += int(refined)
+
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        Removes all results and resumable graph traversals from memory and resets the counters.
+        If `disk` is `True`, also deletes all cached files from `cache_dir`.
+        """
+        with self.memory.lock:
+            self.memory.clear()
+            self.frontiers.clear()
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+            self.refinements = 0
+            if disk and self.cache_dir is not None:
+                for path in self.cache_dir.glob('*.npz'):
+                    path.unlink(missing_ok=True)
+
+
+    def stats(self) -> dict:
+        """
+        Returns a dictionary with the hit (memory and disk), miss and eviction counters,
+        the current and maximum size of the memory tier,
+        the number of results computed by continuing a resumable graph traversal
+        and the number of resumable graph traversals held in memory.
+        """
+        with self.memory.lock:
+            memory_stats: dict = self.memory.stats()
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': memory_stats['evictions'],
+                'size': memory_stats['size'],
+                'maxsize': memory_stats['maxsize'],
+                'nbytes': memory_stats['nbytes'],
+                'maxbytes': memory_stats['maxbytes'],
+                'cache_dir': None if self.cache_dir is None else str(self.cache_dir),
+                'refinements': self.refinements,
+                'frontiers': len(self.frontiers),
+            }
 
 
 def perform_graph_traversal(
@@ -472,9 +2329,14 @@ def perform_graph_traversal(
     max_calc: int,
     return_format: str,
     lca: bc.LCA = None,
-    method: tuple = None,
+    method: tuple | list = None,
     demand: dict = None,
-) -> pd.DataFrame | str:
+    cache: Optional[TraversalCache] = None,
+    lca_pool: Optional[LCAPool] = None,
+    time_budget_ms: Optional[float] = None,
+    progress_callback: Optional[Callable[[dict], None]] = None,
+    timer: Optional[StageTimer] = None,
+) -> pd.DataFrame | str | Iterator[str] | bytes | TraversalResult | dict:
     """
     Performs a graph traversal of a life-cycle assessment calculation
     and returns a DataFrame with the nodes and edges of the graph traversal.
@@ -484,6 +2346,11 @@ def perform_graph_traversal(
     Accepts either an `lca` object returned by the [`brightwebapp.traversal.perform_lca`][] function
     or the `method` and `demand` variables.
 
+    If `method` is a list of methods, the inventory is solved and the supply chain is traversed only once,
+    using the first method for the cutoff decisions.
+    The nodes of the traversal are then characterized with every method
+    (see [`brightwebapp.traversal._characterize_traversal_result`][]).
+
     See Also
     --------
     [`brightwebapp.traversal.perform_lca`][]  
@@ -502,17 +2369,24 @@ def perform_graph_traversal(
         This is used to limit the amount of data processed and the depth of the traversal.
     return_format : str
         A string indicating the format of the return value.
-        Can be either `'dataframe'` or `'csv'`.
+        Can be `'dataframe'`, `'csv'`, `'csv_stream'`, `'arrow'`, `'parquet'` or `'traversal_result'`.
     lca : bc.LCA | None, optional
         An instance of the `bw2calc.LCA` class representing the life-cycle assessment calculation
-    method : tuple 
-        A tuple representing the method to be used for the life-cycle assessment.
+    method : tuple | list
+        A tuple representing the method to be used for the life-cycle assessment,
+        or a list of such tuples.
 
         For example:  
 
         ```python
         ('Impact Potential', 'GCC')
         ```
+
+        or
+
+        ```python
+        [('Impact Potential', 'GCC'), ('Impact Potential', 'HC')]
+        ```
     demand : dict
         A dictionary representing the reference product demand for the life-cycle assessment calculation.  
 
@@ -524,6 +2398,50 @@ def perform_graph_traversal(
         ```python
         {bd.get_node(code='bike'): 1}
         ``` 
+    cache : TraversalCache | None, optional
+        A [`brightwebapp.traversal.TraversalCache`][].
+        If provided together with `method` and `demand` (and without `lca`),
+        the result is looked up in the cache first and the life-cycle assessment and graph traversal
+        are only computed on a cache miss.
+        On a cache miss, a graph traversal of the same demand and method with a higher cutoff
+        (or a lower `max_calc`) is continued if the cache holds one
+        (see [`brightwebapp.traversal.ResumableGraphTraversal`][]).
+        Graph traversals truncated by `max_calc` are not continued, since the nodes they found
+        depend on the order of the calculations; a new graph traversal is computed instead.
+        Not used if `method` is a list of methods.
+    lca_pool : LCAPool | None, optional
+        A [`brightwebapp.traversal.LCAPool`][].
+        If provided together with `method` and `demand` (and without `lca`),
+        the life-cycle assessment reuses the factorized technosphere matrix held by the pool.
+    time_budget_ms : float | None, optional
+        Wall-clock time budget of the graph traversal in milliseconds (not including the life-cycle assessment).
+        If the budget is exceeded, the graph traversal stops early and the result is truncated:
+        `TraversalResult.truncated` is `'time_budget'` and `TraversalResult.coverage`
+        is the share of the total score covered by the nodes found.
+        Truncated results are not stored in the `cache`, but the truncated graph traversal is
+        and is continued by the next call with the same demand and method.
+    progress_callback : Callable[[dict], None] | None, optional
+        Function called with the progress of the graph traversal after every expanded node
+        (see [`brightwebapp.traversal.ResumableGraphTraversal.progress`][]), for instance to report the
+        progress of a long-running traversal. Not called for results served from the `cache`.
+    timer : StageTimer | None, optional
+        A [`brightwebapp.timing.StageTimer`][] which records the wall time and counts of the stages of the calculation:
+
+        | Stage | Description | Counts |
+        |-------|-------------|--------|
+        | `cache` | lookup of the result in the `cache` | `hit` |
+        | `refine` | continuation of a cached graph traversal | `nodes`, `edges`, `calculations` |
+        | `lci` | life-cycle inventory (including the factorization of the technosphere matrix) | `factorized` (only with `lca_pool`) |
+        | `lcia` | life-cycle impact assessment | |
+        | `traversal` | graph traversal | `nodes`, `edges`, `calculations` |
+        | `characterization` | characterization with a list of methods | `methods` |
+        | `names` | resolution of the node names | `nodes` |
+        | `branches` | reconstruction of the branches | `nodes` |
+        | `serialization` | conversion to the `return_format` | |
+
+        Stages which are not needed (e.g. `lci` for a cached result) are not recorded.
+        With `return_format='csv_stream'`, names are resolved and rows are written while the generator is consumed,
+        after the function has returned.
         
     Returns
     -------
@@ -555,65 +2473,271 @@ def perform_graph_traversal(
         (...)
         ```
     
+    Iterator[str]
+        **If `return_format` is `'csv_stream'`**:  
+
+        A generator of CSV strings of up to 1000 rows each, which together are identical to the CSV string
+        (see [`brightwebapp.traversal.TraversalResult.iter_csv`][]).
+        The graph traversal is performed before the generator is returned.
+
+    pyarrow.Table
+        **If `return_format` is `'arrow'`**:  
+
+        A [PyArrow Table](https://arrow.apache.org/docs/python/generated/pyarrow.Table.html) with the columns of the DataFrame.
+        The `Branch` column is a native `list<int32>` column.
+        Requires the optional dependency `pyarrow`.
+
+    bytes
+        **If `return_format` is `'parquet'`**:  
+
+        A [Parquet](https://parquet.apache.org) file with the columns of the PyArrow Table.
+        Requires the optional dependency `pyarrow`.
+    
+    TraversalResult
+        **If `return_format` is `'traversal_result'`**:  
+
+        A [`brightwebapp.traversal.TraversalResult`][] holding the nodes and edges of the graph traversal as NumPy arrays.
+    dict
+        **If `return_format` is `'traversal_result'` and `method` is a list of methods**:
+
+        A dictionary mapping every method to a [`brightwebapp.traversal.TraversalResult`][].
+
+    If `method` is a list of methods, the tables contain one
+    `BurdenIntensity`, `Burden(Cumulative)` and `Burden(Direct)` column per method
+    (see [`brightwebapp.traversal._traversal_results_to_wide_dataframe`][]).
+
     Raises
     ------
     ValueError
-        If `return_format` is not `'dataframe'` or `'csv'`.  
+        If `return_format` is not `'dataframe'`, `'csv'`, `'csv_stream'`, `'arrow'`, `'parquet'` or `'traversal_result'`.  
+        If `method` is an empty list, or a list of methods is provided together with `lca`.  
         If no edges are found in the graph traversal.
+    ImportError
+        If `return_format` is `'arrow'` or `'parquet'` and `pyarrow` is not installed.
     """
-    if return_format not in ['dataframe', 'csv']:
+    if return_format not in ['dataframe', 'csv', 'csv_stream', 'arrow', 'parquet', 'traversal_result']:
         raise ValueError(
             f"Invalid return_format '{return_format}'. "
-            "Expected 'dataframe' or 'csv'."
+            "Expected 'dataframe', 'csv', 'csv_stream', 'arrow', 'parquet' or 'traversal_result'."
         )
     if lca is None:
         if method is None or demand is None:
             raise ValueError(
                 "If 'lca' is not provided, both 'method' and 'demand' must be provided."
             )
-        lca = perform_lca(
-            demand=demand,
-            method=method
-        )
-    if lca is not None and (method is not None or demand is not None):
+    elif method is not None or demand is not None:
         print(
             "Warning: Both 'lca' and 'method'/'demand' are provided. "
             "'lca' will be used and 'method'/'demand' will be ignored."
         )
-    if len(demand) != 1:
-        raise ValueError(
-            "Demand dictionary must contain exactly one activity."
+
+    methods: Optional[list] = None
+    if isinstance(method, list):
+        if lca is not None:
+            raise ValueError(
+                "A list of methods can only be used with 'demand', not with 'lca'."
+            )
+        if len(method) == 0:
+            raise ValueError(
+                "Expected at least one method, but got an empty list."
+            )
+        methods = [tuple(m) for m in method]
+        method = methods[0]
+
+    cache_key: Optional[str] = None
+    traversal_result: Optional[TraversalResult] = None
+    if cache is not None and lca is None and methods is None:
+        _validate_demand(demand)
+        cache_key = _traversal_cache_key(
+            demand=demand,
+            method=method,
+            cutoff=cutoff,
+            biosphere_cutoff=biosphere_cutoff,
+            max_calc=max_calc,
         )
-    if not isinstance(next(iter(demand)), Activity):
-        raise ValueError(
-            "The key in the demand dictionary must be a valid bw2data node dictionary."
+        frontier_key: str = _traversal_cache_key(
+            demand=demand,
+            method=method,
+            cutoff=None,
+            biosphere_cutoff=biosphere_cutoff,
+            max_calc=None,
         )
+        resumable_traversal: Optional[ResumableGraphTraversal] = None
+        with _span(timer, 'cache') as counts:
+            traversal_result = cache.get(cache_key)
+            counts['hit'] = int(traversal_result is not None)
+            if traversal_result is None:
+                resumable_traversal = cache.get_frontier(frontier_key)
+        if resumable_traversal is not None:
+            with resumable_traversal.lock:
+                if (
+                    cutoff <= resumable_traversal.cutoff
+                    and max_calc >= resumable_traversal.max_calc
+                    and resumable_traversal.truncated != 'max_calc'
+                ):
+                    # cached traversals are detached from their `LCA` object, see `TraversalCache.put_frontier`
+                    with _lca_context(demand=demand, method=method, lca_pool=lca_pool, timer=timer) as lca:
+                        resumable_traversal.attach(lca)
+                        try:
+                            with _span(timer, 'refine') as counts:
+                                resumable_traversal.refine(
+                                    cutoff=cutoff,
+                                    max_calc=max_calc,
+                                    time_budget_ms=time_budget_ms,
+                                    progress_callback=progress_callback,
+                                )
+                                traversal_result = TraversalResult.from_traversal(
+                                    nodes=resumable_traversal.nodes,
+                                    edges=resumable_traversal.edges,
+                                    total_score=resumable_traversal.total_score,
+                                    truncated=resumable_traversal.truncated,
+                                )
+                                counts.update(
+                                    nodes=len(traversal_result),
+                                    edges=len(traversal_result.producer_unique_id),
+                                    calculations=resumable_traversal.calculation_count,
+                                )
+                        finally:
+                            resumable_traversal.detach()
+                    if traversal_result.truncated == 'max_calc':
+                        # the refined traversal may differ from a new traversal with the same `max_calc`
+                        traversal_result = None
+            if traversal_result is not None:
+                cache.put_frontier(frontier_key, resumable_traversal, refined=True)
+                if traversal_result.truncated != 'time_budget':
+                    cache.put(cache_key, traversal_result)
+
+    if traversal_result is None:
+        if lca is not None:
+            lca_context = nullcontext(lca)
+        else:
+            lca_context = _lca_context(demand=demand, method=method, lca_pool=lca_pool, timer=timer)
+        with lca_context as lca:
+            with _span(timer, 'traversal') as counts:
+                traversal: dict = _traverse_graph(
+                    lca=lca,
+                    cutoff=cutoff,
+                    biosphere_cutoff=biosphere_cutoff,
+                    max_calc=max_calc,
+                    time_budget_ms=time_budget_ms,
+                    progress_callback=progress_callback,
+                )
+                traversal_result = TraversalResult.from_traversal(
+                    nodes=traversal['nodes'],
+                    edges=traversal['edges'],
+                    total_score=traversal['traversal'].total_score,
+                    truncated=traversal['traversal'].truncated,
+                )
+                counts.update(
+                    nodes=len(traversal_result),
+                    edges=len(traversal_result.producer_unique_id),
+                    calculations=traversal['traversal'].calculation_count,
+                )
+            if len(traversal_result.producer_unique_id) == 0:
+                raise ValueError(
+                    "No edges found in the graph traversal. "
+                    "This may be due to a cutoff value that is too high, "
+                    "or a demand that does not lead to any edges."
+                )
+            if methods is not None:
+                with _span(timer, 'characterization', methods=len(methods)):
+                    traversal_results: dict = _characterize_traversal_result(
+                        lca=lca,
+                        traversal_result=traversal_result,
+                        methods=methods,
+                    )
+        if cache_key is not None:
+            if traversal_result.truncated != 'time_budget':
+                cache.put(cache_key, traversal_result)
+            traversal['traversal'].detach()
+            cache.put_frontier(frontier_key, traversal['traversal'])
+
+    if methods is not None:
+        return format_traversal_result(traversal_results, return_format, timer=timer)
+    return format_traversal_result(traversal_result, return_format, timer=timer)
+
+
+def format_traversal_result(
+    traversal_result: TraversalResult | dict,
+    return_format: str,
+    timer: Optional[StageTimer] = None,
+) -> pd.DataFrame | str | Iterator[str] | bytes | TraversalResult | dict:
+    """
+    Converts the result of a graph traversal to one of the return formats
+    of [`brightwebapp.traversal.perform_graph_traversal`][].
 
-    traversal: dict = _traverse_graph(
-        lca=lca,
-        cutoff=cutoff,
-        biosphere_cutoff=biosphere_cutoff,
-        max_calc=max_calc,
-    )
-    df_graph_traversal_nodes: pd.DataFrame = _nodes_dict_to_dataframe(traversal['nodes'])
-    df_graph_traversal_edges: pd.DataFrame = _edges_dict_to_dataframe(traversal['edges'])
-    if df_graph_traversal_edges.empty:
+    This allows to inspect the [`brightwebapp.traversal.TraversalResult`][]
+    (e.g. whether it was truncated) before converting it.
+
+    Parameters
+    ----------
+    traversal_result : TraversalResult | dict
+        A [`brightwebapp.traversal.TraversalResult`][],
+        or a dictionary mapping several methods to a `TraversalResult` each.
+    return_format : str
+        `'dataframe'`, `'csv'`, `'csv_stream'`, `'arrow'`, `'parquet'` or `'traversal_result'`.
+    timer : StageTimer | None, optional
+        A [`brightwebapp.timing.StageTimer`][] which records the `names`, `branches` and `serialization` stages,
+        see [`brightwebapp.traversal.perform_graph_traversal`][].
+
+    Returns
+    -------
+    pd.DataFrame | str | Iterator[str] | bytes | TraversalResult | dict
+        See [`brightwebapp.traversal.perform_graph_traversal`][].
+
+    Raises
+    ------
+    ValueError
+        If `return_format` is not one of the return formats.
+    """
+    if return_format not in ['dataframe', 'csv', 'csv_stream', 'arrow', 'parquet', 'traversal_result']:
         raise ValueError(
-            "No edges found in the graph traversal. "
-            "This may be due to a cutoff value that is too high, "
-            "or a demand that does not lead to any edges."
+            f"Invalid return_format '{return_format}'. "
+            "Expected 'dataframe', 'csv', 'csv_stream', 'arrow', 'parquet' or 'traversal_result'."
         )
-    else:
-        df_graph_traversal_edges = _add_branch_information_to_edges_dataframe(df_graph_traversal_edges)
-        df_traversal = pd.merge(
-            df_graph_traversal_nodes,
-            df_graph_traversal_edges,
-            left_on='UID',
-            right_on='producer_unique_id',
-            how='left'
+    if return_format == 'traversal_result':
+        return traversal_result
+    if timer is not None and return_format != 'csv_stream':
+        # names and branches are otherwise computed on demand during the serialization
+        first_result: TraversalResult = (
+            next(iter(traversal_result.values())) if isinstance(traversal_result, dict) else traversal_result
         )
-    df_traversal = df_traversal.drop(columns=['producer_unique_id', 'activity_datapackage_id'])
-    if return_format == 'dataframe':
-        return df_traversal
+        with timer.span('names', nodes=len(first_result)):
+            first_result.names
+        with timer.span('branches', nodes=len(first_result)):
+            first_result.branches
+    with _span(timer, 'serialization'):
+        return _format_traversal_result(traversal_result, return_format)
+
+
+def _format_traversal_result(
+    traversal_result: TraversalResult | dict,
+    return_format: str,
+) -> pd.DataFrame | str | Iterator[str] | bytes:
+    """
+    Converts a graph traversal result to a return format other than `'traversal_result'`,
+    see [`brightwebapp.traversal.format_traversal_result`][].
+    """
+    if isinstance(traversal_result, dict):
+        traversal_results: dict = traversal_result
+        if return_format == 'dataframe':
+            return _traversal_results_to_wide_dataframe(traversal_results)
+        elif return_format == 'csv':
+            return _traversal_results_to_wide_dataframe(traversal_results).to_csv(index=False)
+        elif return_format == 'csv_stream':
+            df: pd.DataFrame = _traversal_results_to_wide_dataframe(traversal_results)
+            return _iter_csv(lambda rows: df.iloc[rows], len(df), 1000)
+        elif return_format == 'arrow':
+            return _traversal_results_to_wide_arrow(traversal_results)
+        elif return_format == 'parquet':
+            return _arrow_table_to_parquet(_traversal_results_to_wide_arrow(traversal_results))
+    elif return_format == 'dataframe':
+        return traversal_result.to_dataframe()
     elif return_format == 'csv':
-        return df_traversal.to_csv(index=False)
\ No newline at end of file
+        return traversal_result.to_csv()
+    elif return_format == 'csv_stream':
+        return traversal_result.iter_csv()
+    elif return_format == 'arrow':
+        return traversal_result.to_arrow()
+    elif return_format == 'parquet':
+        return traversal_result.to_parquet()
@@ -0,0 +1,178 @@
+# %%
+import bw2data as bd
+import numpy as np
+
+
+def _level_sizes(number_of_activities: int, depth: int) -> list[int]:
+    """
+    Returns the number of activities per level (the root activity being level 0),
+    growing geometrically so that the sizes add up to `number_of_activities`.
+    """
+    depth = max(1, min(depth, number_of_activities - 1))
+    low, high = 1.0, float(number_of_activities)
+    for _ in range(100):
+        ratio = (low + high) / 2
+        if sum(ratio**level for level in range(depth + 1)) > number_of_activities:
+            high = ratio
+        else:
+            low = ratio
+    sizes: list = [max(1, round(low**level)) for level in range(depth + 1)]
+    sizes[0] = 1
+    sizes[-1] = max(1, sizes[-1] + number_of_activities - sum(sizes))
+    return sizes
+
+
+def example_system_synthetic(
+    number_of_activities: int = 1000,
+    fan_out: int = 3,
+    depth: int = 6,
+    cycles: int = 10,
+    biosphere_flows: int = 5,
+    seed: int = 42,
+    project_name: str = "synthetic",
+) -> dict:
+    """
+    Sets up a random, reproducible supply chain graph of configurable size in a Brightway project
+    for benchmarks and tests at scale.
+
+    Activities are arranged in `depth + 1` levels, growing geometrically from the root activity `activity_0`.
+    Every activity is an input of at least one activity of the level below (so that all activities are part
+    of the supply chain of the root activity) and every activity except those of the last level
+    has at least `fan_out` inputs from the level above.
+    `cycles` additional edges point from an activity to an activity of the same or a lower level,
+    closing loops in the graph. Input amounts are chosen such that the technosphere matrix is invertible
+    (the inputs of every activity add up to less than 1).
+    Every activity emits one or two of the `biosphere_flows` biosphere flows,
+    which are all characterized by the `('synthetic',)` impact assessment method.
+
+    Nodes are [_chimera nodes_](https://docs.brightway.dev/en/latest/content/overview/inventory.html#processes-products-and-something-in-between),
+    as in [`tests.fixtures.supplychain.example_system_bike_production`][].
+    The database is written in a single bulk operation, so that even 100,000 activities are set up within minutes.
+
+    Example
+    -------
+    ```python
+    >>> system = example_system_synthetic(number_of_activities=10_000, fan_out=3, depth=8)
+    >>> system
+    {'project': 'synthetic', 'database': 'synthetic', 'demand_code': 'activity_0', 'method': ('synthetic',), 'levels': [1, 2, 6, ...], 'edges': 20314}
+    >>> perform_graph_traversal(..., demand={bd.get_node(code=system['demand_code']): 1}, method=system['method'])
+    ```
+
+    Warning
+    -------
+    Deletes and recreates the Brightway project `project_name`.
+
+    Parameters
+    ----------
+    number_of_activities : int
+        Number of activities (technosphere nodes).
+    fan_out : int
+        Minimum number of inputs of every activity (except those of the last level).
+    depth : int
+        Number of levels below the root activity.
+    cycles : int
+        Number of edges which close loops in the graph.
+    biosphere_flows : int
+        Number of biosphere flows.
+    seed : int
+        Seed of the random number generator.
+    project_name : str
+        Name of the Brightway project.
+
+    Returns
+    -------
+    dict
+        The project, database, code of the root activity, method, number of activities per level
+        and number of technosphere edges.
+
+    Raises
+    ------
+    ValueError
+        If `number_of_activities` is smaller than 2, or `fan_out` or `biosphere_flows` is smaller than 1.
+    """
+    if number_of_activities < 2:
+        raise ValueError(f"Expected at least 2 activities, but got {number_of_activities}.")
+    if fan_out < 1 or biosphere_flows < 1:
+        raise ValueError("Expected 'fan_out' and 'biosphere_flows' to be at least 1.")
+    rng = np.random.default_rng(seed)
+
+    if project_name in bd.projects:
+        bd.projects.delete_project(name=project_name, delete_dir=True)
+    bd.projects.set_current(project_name)
+    database_name: str = "synthetic"
+
+    sizes: list = _level_sizes(number_of_activities, depth)
+    offsets: np.ndarray = np.concatenate([[0], np.cumsum(sizes)])
+    inputs: list = [dict() for _ in range(number_of_activities)]
+    for level in range(1, len(sizes)):
+        consumers = np.arange(offsets[level - 1], offsets[level])
+        producers = np.arange(offsets[level], offsets[level + 1])
+        # every producer supplies at least one consumer of the level below
+        for producer, consumer in zip(producers, rng.choice(consumers, size=len(producers))):
+            inputs[consumer][int(producer)] = None
+        for consumer in consumers:
+            number_of_missing_inputs: int = min(fan_out, len(producers)) - len(inputs[consumer])
+            if number_of_missing_inputs > 0:
+                candidates = np.setdiff1d(producers, list(inputs[consumer]), assume_unique=True)
+                for producer in rng.choice(candidates, size=number_of_missing_inputs, replace=False):
+                    inputs[consumer][int(producer)] = None
+    number_of_edges: int = sum(len(activity_inputs) for activity_inputs in inputs)
+
+    # inputs of an activity add up to at most 0.9 (0.99 with a cycle), so that the technosphere matrix is invertible
+    for activity_inputs in inputs:
+        for producer, share in zip(list(activity_inputs), rng.dirichlet(np.ones(len(activity_inputs))) if activity_inputs else []):
+            activity_inputs[producer] = float(share * rng.uniform(0.1, 0.9))
+    for consumer in rng.choice(np.arange(1, number_of_activities), size=min(cycles, number_of_activities - 1), replace=False):
+        level: int = int(np.searchsorted(offsets, consumer, side='right')) - 1
+        producer = int(rng.integers(0, offsets[level + 1]))
+        if producer != consumer and producer not in inputs[consumer]:
+            inputs[consumer][producer] = float(rng.uniform(0.01, 0.09))
+            number_of_edges += 1
+
+    flows: list = [(database_name, f"flow_{index}") for index in range(biosphere_flows)]
+    data: dict = {
+        flow: {
+            'name': f"Flow {index}",
+            'categories': ('air',),
+            'unit': 'kg',
+            'type': bd.labels.biosphere_node_default,
+        }
+        for index, flow in enumerate(flows)
+    }
+    for activity in range(number_of_activities):
+        emitted_flows = rng.choice(biosphere_flows, size=min(int(rng.integers(1, 3)), biosphere_flows), replace=False)
+        data[(database_name, f"activity_{activity}")] = {
+            'name': f"Activity {activity}",
+            'location': 'GLO',
+            'unit': 'unit',
+            'reference product': f"product {activity}",
+            'type': bd.labels.chimaera_node_default,
+            'exchanges': [
+                {
+                    'input': (database_name, f"activity_{producer}"),
+                    'amount': amount,
+                    'type': bd.labels.consumption_edge_default,
+                }
+                for producer, amount in inputs[activity].items()
+            ] + [
+                {
+                    'input': flows[flow],
+                    'amount': float(rng.uniform(0.1, 1)),
+                    'type': bd.labels.biosphere_edge_default,
+                }
+                for flow in emitted_flows
+            ],
+        }
+    bd.Database(database_name).write(data)
+
+    method: tuple = ('synthetic',)
+    bd.Method(method).write([(flow, float(rng.uniform(0.5, 2))) for flow in flows])
+
+    return {
+        'project': project_name,
+        'database': database_name,
+        'demand_code': 'activity_0',
+        'method': method,
+        'levels': sizes,
+        'edges': number_of_edges,
+    }
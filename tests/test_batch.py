@@ -0,0 +1,40 @@
+import bw2data as bd
+
+from brightwebapp.batch import TraversalWorkerPool
+from brightwebapp.traversal import perform_graph_traversal
+from .fixtures.supplychain import example_system_bike_production
+
+
+class TestTraversalWorkerPool:
+    """
+    Test suite for the `TraversalWorkerPool` class.
+    """
+
+    def test_imap_unordered(self) -> None:
+        """
+        Tests that the worker processes return the same CSV as `perform_graph_traversal`
+        and that a failing task is returned as an error without aborting the other tasks.
+        """
+        example_system_bike_production()
+        tasks = [
+            {'demand': {'bike': 1}, 'method': ('IPCC', )},
+            {'demand': {'missing': 1}, 'method': ('IPCC', )},
+            {'demand': {'bike': 2}, 'method': ('IPCC', ), 'cutoff': 0.01},
+        ]
+        worker_pool = TraversalWorkerPool(max_workers=1)
+        try:
+            results = sorted(worker_pool.imap_unordered(tasks), key=lambda result: result['index'])
+        finally:
+            worker_pool.shutdown()
+
+        assert [result['status'] for result in results] == ['ok', 'error', 'ok']
+        assert results[1]['detail'] == "ValueError: Node not found for code 'missing'."
+        for result, task in zip([results[0], results[2]], [tasks[0], tasks[2]]):
+            assert result['csv'] == perform_graph_traversal(
+                cutoff=task.get('cutoff', 0.001),
+                biosphere_cutoff=0.001,
+                max_calc=100,
+                return_format='csv',
+                demand={bd.get_node(code=code): amount for code, amount in task['demand'].items()},
+                method=task['method'],
+            )
@@ -3,6 +3,8 @@ import bw2io as bi
 import bw2data as bd
 from brightwebapp import brightway
 
+from tests.fixtures.supplychain import example_system_bike_production
+
 def test_load_and_set_useeio_project():
     """
     Test the loading and setting of the USEEIO project.
@@ -16,4 +18,56 @@ def test_load_and_set_useeio_project():
     brightway.load_and_set_useeio_project()
 
     assert bd.projects.current == "USEEIO-1.1"
-    assert "USEEIO-1.1" in bd.projects
\ No newline at end of file
+    assert "USEEIO-1.1" in bd.projects
+
+class TestGetNodeMetadata:
+    """
+    Test suite for the `get_node_metadata` function.
+    """
+
+    def test_bulk_lookup_with_duplicates(self):
+        """
+        Tests that all distinct node ids are resolved and duplicates are collapsed.
+        """
+        example_system_bike_production()
+        bike = bd.get_node(code='bike')
+        steel = bd.get_node(code='steel')
+        metadata = brightway.get_node_metadata(
+            [bike.id, steel.id, bike.id],
+            fields=('name', 'location', 'unit', 'reference product'),
+        )
+        assert metadata == {
+            bike.id: {'name': 'bike production', 'location': 'DK', 'unit': 'bike', 'reference product': 'bike'},
+            steel.id: {'name': 'steel production', 'location': 'DE', 'unit': 'kg', 'reference product': 'steel'},
+        }
+
+    def test_repeated_lookup_is_served_from_cache(self):
+        """
+        Tests that a repeated lookup hits the cache,
+        and that modifying the database invalidates the cached entries.
+        """
+        example_system_bike_production()
+        bike = bd.get_node(code='bike')
+        brightway.get_node_metadata([bike.id])
+        hits_before = brightway._NODE_METADATA_CACHE.hits
+        assert brightway.get_node_metadata([bike.id]) == {bike.id: {'name': 'bike production'}}
+        assert brightway._NODE_METADATA_CACHE.hits == hits_before + 1
+
+        bike['name'] = 'bicycle production'
+        bike.save()
+        assert brightway.get_node_metadata([bike.id]) == {bike.id: {'name': 'bicycle production'}}
+
+    def test_raises_for_unknown_id(self):
+        """
+        Tests that an unknown node id raises `bw2data.errors.UnknownObject`.
+        """
+        example_system_bike_production()
+        with pytest.raises(bd.errors.UnknownObject):
+            brightway.get_node_metadata([-12345])
+
+    def test_raises_for_unsupported_field(self):
+        """
+        Tests that an unsupported metadata field raises a ValueError.
+        """
+        with pytest.raises(ValueError, match="Unsupported metadata fields"):
+            brightway.get_node_metadata([1], fields=('color',))
@@ -0,0 +1,125 @@
+import sys
+import threading
+
+import pytest
+
+from brightwebapp.caching import LRUCache
+
+
+class TestLRUCache:
+    """
+    Test suite for the `LRUCache` class.
+    """
+
+    def test_evicts_least_recently_used_entry(self):
+        """
+        Tests that the least recently used entry is evicted once `maxsize` is exceeded.
+        """
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1  # 'b' is now least recently used
+        cache.put('c', 3)
+        assert 'b' not in cache
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+        assert len(cache) == 2
+
+    def test_counters(self):
+        """
+        Tests the hit, miss and eviction counters.
+        """
+        cache = LRUCache(maxsize=1)
+        cache.put('a', 1)
+        cache.get('a')
+        cache.get('b')
+        cache.put('b', 2)
+        assert cache.stats() == {
+            'hits': 1, 'misses': 1, 'evictions': 1, 'size': 1, 'maxsize': 1, 'nbytes': 0, 'maxbytes': None
+        }
+        cache.clear()
+        assert cache.stats() == {
+            'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0, 'maxsize': 1, 'nbytes': 0, 'maxbytes': None
+        }
+
+    def test_evicts_entries_above_maxbytes(self):
+        """
+        Tests that entries are evicted once their total size exceeds `maxbytes`,
+        and that entries larger than `maxbytes` are not stored.
+        """
+        cache = LRUCache(maxsize=10, maxbytes=10, sizeof=len)
+        cache.put('a', 'xxxx')
+        cache.put('b', 'xxxx')
+        cache.put('c', 'xxxx')
+        assert 'a' not in cache
+        assert cache.nbytes == 8
+        cache.put('b', 'x')
+        assert cache.nbytes == 5
+        cache.put('d', 'x' * 11)
+        assert 'd' not in cache
+        assert cache.evictions == 1
+
+    def test_items_in_order_of_use(self):
+        """
+        Tests that `items` returns the entries from the least to the most recently used, without counting hits.
+        """
+        cache = LRUCache(maxsize=3)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        assert cache.items() == [('b', 2), ('a', 1)]
+        assert cache.hits == 1
+
+    def test_concurrent_access(self):
+        """
+        Tests that the cache stays consistent when used from several threads at once.
+        """
+        cache = LRUCache(maxsize=8, maxbytes=64, sizeof=lambda value: value)
+        errors: list = []
+        barrier = threading.Barrier(8)
+
+        def hammer(offset: int) -> None:
+            try:
+                barrier.wait()
+                for i in range(2000):
+                    key = (offset + i) % 32
+                    cache.put(key, key % 16)
+                    cache.get((key + 1) % 32)
+                    if i % 7 == 0:
+                        cache.pop((key + 2) % 32)
+                    if i % 97 == 0:
+                        cache.items()
+                        cache.stats()
+            except Exception as exception:
+                errors.append(exception)
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # switch threads as often as possible
+        try:
+            threads = [threading.Thread(target=hammer, args=(offset,)) for offset in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert errors == []
+        assert len(cache) <= 8
+        assert cache.nbytes == sum(value for _, value in cache.items())
+        assert cache.nbytes <= 64
+        assert cache.hits + cache.misses == 8 * 2000
+
+    def test_get_returns_default_on_miss(self):
+        """
+        Tests that `get` returns the provided default for missing keys.
+        """
+        cache = LRUCache(maxsize=1)
+        assert cache.get('missing', 'default') == 'default'
+
+    def test_raises_for_non_positive_maxsize(self):
+        """
+        Tests that a non-positive `maxsize` raises a ValueError.
+        """
+        with pytest.raises(ValueError, match="Expected 'maxsize' to be positive"):
+            LRUCache(maxsize=0)
@@ -0,0 +1,73 @@
+import bw2data as bd
+import numpy as np
+import pandas as pd
+
+from brightwebapp.dense import DenseInverseLCA
+from brightwebapp.traversal import LCAPool, perform_graph_traversal, perform_lca
+from .fixtures.synthetic import example_system_synthetic
+
+
+def _dense_lca(demand: dict, method: tuple, max_products: int = 2000) -> DenseInverseLCA:
+    _, data_objs, _ = bd.prepare_lca_inputs(demand=demand, method=method)
+    lca = DenseInverseLCA(
+        demand={node.id: amount for node, amount in demand.items()},
+        data_objs=data_objs,
+        max_products=max_products,
+    )
+    lca.lci(factorize=True)
+    lca.lcia()
+    return lca
+
+
+class TestDenseInverseLCA:
+    """
+    Test suite for the `DenseInverseLCA` class.
+    """
+
+    def test_scores_match_sparse_lca(self) -> None:
+        """
+        Tests that the scores, the cumulative intensities and the contributions
+        match a sparse life-cycle assessment for several demands.
+        """
+        system = example_system_synthetic(number_of_activities=300, cycles=5)
+        lca = _dense_lca({bd.get_node(code=system['demand_code']): 1}, system['method'])
+        assert lca.dense
+        for code, amount in [('activity_0', 1), ('activity_7', 2.5), ('activity_250', 1)]:
+            node = bd.get_node(code=code)
+            lca.lci(demand={node.id: amount})
+            lca.lcia_calculation()
+            reference = perform_lca(demand={node: amount}, method=system['method'])
+            assert np.isclose(lca.score, reference.score)
+            assert np.isclose(lca.total_intensity[lca.dicts.product[node.id]] * amount, reference.score)
+            contributions = lca.contributions()
+            assert np.isclose(contributions['Burden(Direct)'].sum(), reference.score)
+            assert contributions['Burden(Direct)'].abs().is_monotonic_decreasing
+
+    def test_falls_back_to_factorization(self) -> None:
+        """
+        Tests that technosphere matrices with more than `max_products` rows are factorized.
+        """
+        system = example_system_synthetic(number_of_activities=300, cycles=5)
+        lca = _dense_lca({bd.get_node(code=system['demand_code']): 1}, system['method'], max_products=100)
+        assert not lca.dense
+        assert np.isclose(lca.score, perform_lca(demand={bd.get_node(code=system['demand_code']): 1}, method=system['method']).score)
+
+
+def test_dense_graph_traversal_matches_sparse_graph_traversal() -> None:
+    """
+    Tests that a graph traversal with an `LCAPool` which inverts the technosphere matrix
+    returns the same result as a graph traversal with a factorized technosphere matrix.
+    """
+    system = example_system_synthetic(number_of_activities=500, cycles=10)
+    kwargs = dict(
+        cutoff=1e-4,
+        biosphere_cutoff=1e-4,
+        max_calc=200,
+        return_format='dataframe',
+        demand={bd.get_node(code=system['demand_code']): 1},
+        method=system['method'],
+    )
+    df_sparse = perform_graph_traversal(lca_pool=LCAPool(), **kwargs)
+    df_dense = perform_graph_traversal(lca_pool=LCAPool(dense_max_products=1000), **kwargs)
+    assert len(df_dense) > 100
+    pd.testing.assert_frame_equal(df_sparse, df_dense)
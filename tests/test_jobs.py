@@ -0,0 +1,60 @@
+import bw2data as bd
+
+from brightwebapp.jobs import TraversalJobQueue
+from brightwebapp.traversal import perform_graph_traversal
+from .fixtures.supplychain import example_system_bike_production
+
+
+class TestTraversalJobQueue:
+    """
+    Test suite for the `TraversalJobQueue` class.
+    """
+
+    def test_submit_and_wait(self) -> None:
+        """
+        Tests that a job returns the same result as `perform_graph_traversal`
+        and reports the progress of the graph traversal.
+        """
+        example_system_bike_production()
+        kwargs = dict(
+            cutoff=0.001,
+            biosphere_cutoff=0.001,
+            max_calc=100,
+            demand={bd.get_node(code='bike'): 1},
+            method=('IPCC', ),
+        )
+        job_queue = TraversalJobQueue(max_workers=1)
+        try:
+            job = job_queue.submit(**kwargs)
+            assert job.status in ('queued', 'running', 'done')
+            job = job_queue.wait(job.id, timeout=60)
+        finally:
+            job_queue.shutdown()
+
+        assert job.status == 'done'
+        assert job.result.to_csv() == perform_graph_traversal(return_format='csv', **kwargs)
+        assert job.progress['nodes'] == len(job.result)
+        assert job.to_dict()['progress']['coverage'] == job.progress['coverage']
+        assert job.started_at <= job.finished_at
+
+    def test_failed_job_and_expiry(self) -> None:
+        """
+        Tests that a failing job is reported as failed and that finished jobs expire after the TTL.
+        """
+        example_system_bike_production()
+        job_queue = TraversalJobQueue(max_workers=1, ttl=0)
+        try:
+            job = job_queue.submit(
+                cutoff=0.001,
+                biosphere_cutoff=0.001,
+                max_calc=100,
+                demand={},
+                method=('IPCC', ),
+            )
+            job = job_queue.wait(job.id, timeout=60)
+            assert job.status == 'failed'
+            assert job.error.startswith('ValueError')
+            assert job_queue.get(job.id) is None
+            assert job_queue.stats()['evictions'] == 1
+        finally:
+            job_queue.shutdown()
@@ -1,15 +1,28 @@
 import pytest
 from pandas.testing import assert_frame_equal
 
+import bw2data as bd
 import pandas as pd
 import numpy as np
+from scipy.sparse.linalg import spsolve
+
+from brightwebapp.dense import _direct_intensity
+from brightwebapp.traversal import LCAPool, perform_graph_traversal, perform_lca
+from tests.fixtures.supplychain import example_system_bike_production
+from tests.fixtures.synthetic import example_system_synthetic
 
 from brightwebapp.modifications import (
     _create_user_input_columns,
     _update_burden_intensity_based_on_user_data,
     _update_burden_based_on_user_data,
     _determine_edited_rows,
-    _update_production_based_on_user_data
+    _update_production_based_on_user_data,
+    IncrementalEditor,
+    apply_user_modifications,
+    compute_sensitivities,
+    evaluate_scenarios,
+    simulate_user_modifications,
+    solve_user_modifications,
 )
 
 @pytest.fixture
@@ -155,6 +168,42 @@ class TestUpdateProductionBasedOnUserData:
         assert_frame_equal(result_df, expected_df, atol=1e-9)
 
 
+    def test_branch_through_node_missing_from_table(self):
+        """
+        Tests that the nearest edited upstream node is found
+        even if the branch passes through a node which is not in the table.
+        """
+        data = {
+            'UID': [0, 1, 3],
+            'SupplyAmount': [10.0, 4.0, 1.0],
+            'SupplyAmount_USER': [np.nan, 2.0, np.nan],
+            'Branch': [np.nan, [0, 1], [0, 1, 2, 3]]
+        }
+        df = pd.DataFrame(data)
+
+        expected_data = {
+            'UID': [0, 1, 3],
+            'SupplyAmount': [10.0, 2.0, 0.5],
+            'Branch': [np.nan, [0, 1], [0, 1, 2, 3]],
+            'Updated?': [False, False, True]
+        }
+        expected_df = pd.DataFrame(expected_data)
+
+        result_df = _update_production_based_on_user_data(df)
+
+        assert_frame_equal(result_df, expected_df)
+
+
+    def test_empty_dataframe(self):
+        """
+        Tests that an empty DataFrame is returned unchanged (with an empty 'Updated?' column).
+        """
+        df = pd.DataFrame({'UID': [], 'SupplyAmount': [], 'SupplyAmount_USER': [], 'Branch': []})
+        result_df = _update_production_based_on_user_data(df)
+        assert list(result_df.columns) == ['UID', 'SupplyAmount', 'Branch', 'Updated?']
+        assert result_df.empty
+
+
 class TestDetermineEditedRows:
     """
     Test suite for the _determine_edited_rows function.
@@ -557,4 +606,662 @@ class TestCreateUserInputColumns:
         expected_df = pd.DataFrame(expected_data)
 
         result_df = _create_user_input_columns(df_original, df_user_input)
-        assert_frame_equal(result_df, expected_df[result_df.columns])
\ No newline at end of file
+        assert_frame_equal(result_df, expected_df[result_df.columns])
+
+def _apply_user_edits(df_original: pd.DataFrame, df_user_input: pd.DataFrame) -> pd.DataFrame:
+    """Applies the full user-edit pipeline, in the same order as the web application."""
+    df = _create_user_input_columns(df_original=df_original, df_user_input=df_user_input)
+    df = _determine_edited_rows(df=df)
+    df = _update_burden_intensity_based_on_user_data(df=df)
+    df = _update_production_based_on_user_data(df=df)
+    return _update_burden_based_on_user_data(df=df)
+
+
+@pytest.fixture
+def traversal_df(base_df) -> pd.DataFrame:
+    """Provides a graph traversal table with the tree of `base_df` and a node whose parent is missing from the table."""
+    df = base_df.drop(columns=['SupplyAmount_USER'])
+    df = pd.concat([df, pd.DataFrame({'UID': [8], 'SupplyAmount': [0.02], 'Branch': [[0, 3, 7, 8]]})], ignore_index=True)
+    df['BurdenIntensity'] = [0.5, 1.0, 2.0, 0.3, 0.0, 1.5, 4.0, 2.5]
+    df['Burden(Direct)'] = df['SupplyAmount'] * df['BurdenIntensity']
+    return df
+
+
+@pytest.fixture
+def traversal_df_outside_flows(traversal_df) -> pd.DataFrame:
+    """Provides `traversal_df` with direct burdens which include burdens of biosphere flows outside the specific flows."""
+    df = traversal_df.copy()
+    df['Burden(Direct)'] += [0.0, 0.01, 0.0, 0.02, 0.005, 0.0, 0.0, 0.03]
+    return df
+
+
+class TestApplyUserModifications:
+    """
+    Test suite for the `apply_user_modifications` function.
+    """
+
+    def test_matches_pipeline(self, traversal_df):
+        """
+        Tests that the fused function returns the same table as the five pipeline steps,
+        for edits of both columns, an edit equal to the original value and a node whose parent is missing from the table.
+        """
+        df_user_input = traversal_df.copy()
+        df_user_input.loc[1, 'SupplyAmount'] = 0.25
+        df_user_input.loc[4, 'SupplyAmount'] = 0.18
+        df_user_input.loc[3, 'SupplyAmount'] = 0.05
+        df_user_input.loc[2, 'BurdenIntensity'] = 2.0
+        df_user_input.loc[6, 'BurdenIntensity'] = 1.0
+
+        assert_frame_equal(
+            apply_user_modifications(df_original=traversal_df, df_user_input=df_user_input),
+            _apply_user_edits(df_original=traversal_df, df_user_input=df_user_input),
+        )
+
+
+    def test_user_input_in_other_row_order(self, traversal_df):
+        """
+        Tests that the rows of the user input are matched to the original rows by UID.
+        """
+        df_user_input = traversal_df.copy()
+        df_user_input.loc[1, 'SupplyAmount'] = 0.25
+        df_user_input = df_user_input.iloc[::-1]
+
+        assert_frame_equal(
+            apply_user_modifications(df_original=traversal_df, df_user_input=df_user_input),
+            _apply_user_edits(df_original=traversal_df, df_user_input=df_user_input),
+        )
+
+
+    def test_does_not_modify_original(self, traversal_df):
+        """
+        Tests that the original table (with a non-default index) is not modified,
+        and that the result has a default index.
+        """
+        df_original = traversal_df.set_index(traversal_df.index + 10)
+        df_original_copy = df_original.copy()
+        df_user_input = df_original.copy()
+        df_user_input['SupplyAmount'] = 2 * df_user_input['SupplyAmount']
+
+        result_df = apply_user_modifications(df_original=df_original, df_user_input=df_user_input)
+
+        assert_frame_equal(df_original, df_original_copy)
+        assert list(result_df.index) == list(range(len(df_original)))
+        assert result_df['Edited?'].all()
+
+
+    def test_raises_error_if_uids_do_not_match(self, traversal_df):
+        """
+        Tests that a ValueError is raised if the user input misses UIDs.
+        """
+        with pytest.raises(ValueError, match="UIDs in original and user input dataframes do not match."):
+            apply_user_modifications(df_original=traversal_df, df_user_input=traversal_df.iloc[1:])
+
+
+class TestIncrementalEditor:
+    """
+    Test suite for the `IncrementalEditor` class.
+    """
+
+    def test_successive_edits_match_full_pipeline(self, traversal_df):
+        """
+        Tests that after every edit of a random sequence of edits (including reverted edits),
+        the table and the score are the same as when applying the full pipeline to all edits so far.
+        """
+        rng = np.random.default_rng(42)
+        editor = IncrementalEditor(df=traversal_df, score=5.0)
+        df_user_input = traversal_df.copy()
+        for _ in range(100):
+            row = int(rng.integers(0, len(traversal_df)))
+            field = ['SupplyAmount', 'BurdenIntensity'][int(rng.integers(0, 2))]
+            value = None if rng.random() < 0.2 else float(rng.uniform(0, 2))
+            editor.edit(uid=traversal_df.loc[row, 'UID'], field=field, value=value)
+            df_user_input.loc[row, field] = traversal_df.loc[row, field] if value is None else value
+
+            expected_df = _apply_user_edits(df_original=traversal_df, df_user_input=df_user_input)
+            assert_frame_equal(editor.to_dataframe(), expected_df)
+            assert editor.score == pytest.approx(
+                expected_df['Burden(Direct)'].sum() - traversal_df['Burden(Direct)'].sum() + 5.0
+            )
+
+
+    def test_edit_returns_changed_rows(self, traversal_df):
+        """
+        Tests that an edit of the supply amount returns the node and its descendants without other edited nodes upstream.
+        """
+        editor = IncrementalEditor(df=traversal_df)
+        editor.edit(uid=4, field='SupplyAmount', value=0.2)
+        df_changed = editor.edit(uid=1, field='SupplyAmount', value=0.25)
+        assert list(df_changed['UID']) == [1, 2]
+        assert list(df_changed['Updated?']) == [False, True]
+        assert list(editor.edit(uid=6, field='BurdenIntensity', value=1.0)['UID']) == [6]
+
+
+    def test_reverting_all_edits_restores_baseline(self, traversal_df):
+        """
+        Tests that setting the original values again reverts all edits.
+        """
+        editor = IncrementalEditor(df=traversal_df, score=5.0)
+        editor.edit(uid=1, field='SupplyAmount', value=0.25)
+        editor.edit(uid=2, field='SupplyAmount', value=0.0)
+        editor.edit(uid=5, field='BurdenIntensity', value=3.0)
+        editor.edit(uid=1, field='SupplyAmount', value=None)
+        editor.edit(uid=2, field='SupplyAmount', value=0.2)
+        editor.edit(uid=5, field='BurdenIntensity', value=1.5)
+
+        expected_df = traversal_df.copy()
+        expected_df['Edited?'] = False
+        expected_df['Updated?'] = False
+        assert_frame_equal(editor.to_dataframe(), expected_df)
+        assert editor.score == pytest.approx(5.0)
+
+
+    def test_baseline_reproduces_score_and_table(self, traversal_df_outside_flows):
+        """
+        Tests that without edits, and after undoing all edits, the score is the baseline score and the table
+        is the baseline table, also if the direct burden differs from the supply amount times the burden intensity.
+        """
+        editor = IncrementalEditor(df=traversal_df_outside_flows, score=5.0)
+        assert editor.score == 5.0
+        editor.edit(uid=1, field='SupplyAmount', value=0.25)
+        editor.edit(uid=6, field='BurdenIntensity', value=1.0)
+        editor.goto(0)
+
+        expected_df = traversal_df_outside_flows.copy()
+        expected_df['Edited?'] = False
+        expected_df['Updated?'] = False
+        assert_frame_equal(editor.to_dataframe(), expected_df)
+        assert editor.score == pytest.approx(5.0)
+        assert IncrementalEditor(df=traversal_df_outside_flows).score == pytest.approx(
+            traversal_df_outside_flows['Burden(Direct)'].sum()
+        )
+
+
+    def test_apply_dataframe_applies_changed_cells(self, traversal_df):
+        """
+        Tests that cells of an edited table which differ from the current state are applied as edits,
+        also in successive rounds.
+        """
+        editor = IncrementalEditor(df=traversal_df)
+        df_user_input = editor.to_dataframe()
+        df_user_input.loc[1, 'SupplyAmount'] = 0.25
+        df_user_input.loc[5, 'SupplyAmount'] = 0.1
+        editor.apply_dataframe(df_user_input)
+
+        df_user_input = editor.to_dataframe()
+        df_user_input.loc[6, 'BurdenIntensity'] = 1.0
+        df_changed = editor.apply_dataframe(df_user_input)
+        assert list(df_changed['UID']) == [6]
+
+        df_expected_input = traversal_df.copy()
+        df_expected_input.loc[1, 'SupplyAmount'] = 0.25
+        df_expected_input.loc[5, 'SupplyAmount'] = 0.1
+        df_expected_input.loc[6, 'BurdenIntensity'] = 1.0
+        assert_frame_equal(
+            editor.to_dataframe(),
+            _apply_user_edits(df_original=traversal_df, df_user_input=df_expected_input)
+        )
+
+
+    def test_raises_error_for_unknown_uid_or_field(self, traversal_df):
+        """
+        Tests that edits of nodes which are not in the table, or of columns which cannot be edited, raise a ValueError.
+        """
+        editor = IncrementalEditor(df=traversal_df)
+        with pytest.raises(ValueError):
+            editor.edit(uid=99, field='SupplyAmount', value=1.0)
+        with pytest.raises(ValueError):
+            editor.edit(uid=1, field='Burden(Direct)', value=1.0)
+
+
+class TestIncrementalEditorHistory:
+    """
+    Test suite for the revisions (undo, redo and goto) of the `IncrementalEditor` class.
+    """
+
+    def test_goto_restores_every_revision(self, traversal_df):
+        """
+        Tests that jumping between all revisions of a random sequence of edits in random order
+        restores exactly the table and score of every revision, and returns only the changed rows.
+        """
+        rng = np.random.default_rng(42)
+        editor = IncrementalEditor(df=traversal_df, score=5.0)
+        tables, scores = [editor.to_dataframe()], [editor.score]
+        for _ in range(30):
+            row = int(rng.integers(0, len(traversal_df)))
+            field = ['SupplyAmount', 'BurdenIntensity'][int(rng.integers(0, 2))]
+            value = None if rng.random() < 0.2 else float(rng.uniform(0, 2))
+            editor.edit(uid=traversal_df.loc[row, 'UID'], field=field, value=value)
+            tables.append(editor.to_dataframe())
+            scores.append(editor.score)
+        assert editor.revision == editor.latest_revision == 30
+
+        for revision in rng.permutation(31):
+            df_before = editor.to_dataframe()
+            df_changed = editor.goto(int(revision))
+            assert editor.revision == revision
+            assert_frame_equal(editor.to_dataframe(), tables[revision])
+            assert editor.score == scores[revision]
+            unchanged = ~df_before.index.isin(df_changed.index)
+            assert_frame_equal(df_before[unchanged], tables[revision][unchanged])
+
+
+    def test_undo_redo_and_edit_after_undo(self, traversal_df):
+        """
+        Tests undo and redo of single edits and of tables applied as one revision,
+        and that an edit after an undo discards the undone revisions.
+        """
+        editor = IncrementalEditor(df=traversal_df)
+        baseline_df = editor.to_dataframe()
+        df_user_input = traversal_df.copy()
+        df_user_input.loc[1, 'SupplyAmount'] = 0.25
+        df_user_input.loc[4, 'BurdenIntensity'] = 1.0
+        editor.apply_dataframe(df_user_input)
+        edited_df = editor.to_dataframe()
+        editor.edit(uid=3, field='SupplyAmount', value=0.2)
+        assert editor.revision == 2
+
+        editor.undo()
+        assert_frame_equal(editor.to_dataframe(), edited_df)
+        assert list(editor.undo()['UID']) == [1, 2, 4, 5, 6]
+        assert_frame_equal(editor.to_dataframe(), baseline_df)
+        with pytest.raises(ValueError):
+            editor.undo()
+        editor.redo()
+        assert_frame_equal(editor.to_dataframe(), edited_df)
+
+        editor.apply_edits([(5, 'BurdenIntensity', 2.0), (6, 'BurdenIntensity', 3.0)])
+        assert editor.revision == editor.latest_revision == 2
+        with pytest.raises(ValueError):
+            editor.redo()
+        with pytest.raises(ValueError):
+            editor.apply_edits([(5, 'BurdenIntensity', 1.0), (99, 'SupplyAmount', 1.0)])
+        assert editor.to_dataframe().loc[5, 'BurdenIntensity'] == 2.0
+        assert editor.revision == 2
+
+
+    def test_history_stores_changed_rows_only(self, traversal_df):
+        """
+        Tests that revisions grow the memory of the editor with the number of changed rows,
+        and that at most `max_revisions` revisions are kept.
+        """
+        editor = IncrementalEditor(df=traversal_df, max_revisions=2)
+        nbytes = editor.nbytes
+        editor.edit(uid=6, field='BurdenIntensity', value=1.0)
+        nbytes_single_row = editor.nbytes - nbytes
+        editor.edit(uid=8, field='BurdenIntensity', value=1.0)
+        assert editor.nbytes - nbytes == 2 * nbytes_single_row
+        editor.edit(uid=5, field='BurdenIntensity', value=1.0)
+        assert editor.nbytes - nbytes == 2 * nbytes_single_row
+        assert (editor.oldest_revision, editor.revision) == (1, 3)
+        editor.goto(1)
+        assert editor.to_dataframe().loc[0:6, 'Edited?'].tolist() == [False] * 6 + [True]
+        with pytest.raises(ValueError):
+            editor.goto(0)
+
+
+class TestEvaluateScenarios:
+    """
+    Test suite for the `evaluate_scenarios` function.
+    """
+
+    def test_scenarios_match_full_pipeline(self, traversal_df):
+        """
+        Tests that the supply amounts, direct burdens and scores of every scenario are the same
+        as when applying the full pipeline to the edits of the scenario, also across chunks.
+        """
+        scenarios = {
+            'baseline': {},
+            'supplier switch': {1: {'SupplyAmount': 0.0}, 3: {'SupplyAmount': 0.3}},
+            'nested edits': {1: {'SupplyAmount': 0.25}, 4: {'SupplyAmount': 0.18, 'BurdenIntensity': 1.0}},
+            'missing parent': {3: {'SupplyAmount': 0.05}, 8: {'BurdenIntensity': 5.0}},
+            'edit equal to baseline': {2: {'SupplyAmount': 0.2}},
+        }
+        results = evaluate_scenarios(df=traversal_df, scenarios=scenarios, score=5.0, chunk_size=2)
+        assert list(results.scores.index) == list(scenarios)
+        for name, edits in scenarios.items():
+            df_user_input = traversal_df.copy()
+            for uid, cells in edits.items():
+                for field, value in cells.items():
+                    df_user_input.loc[df_user_input['UID'] == uid, field] = value
+            expected_df = _apply_user_edits(df_original=traversal_df, df_user_input=df_user_input)
+            np.testing.assert_array_equal(results.supply.loc[name].to_numpy(), expected_df['SupplyAmount'].to_numpy())
+            np.testing.assert_array_equal(results.burdens.loc[name].to_numpy(), expected_df['Burden(Direct)'].to_numpy())
+            assert results.scores[name] == pytest.approx(
+                expected_df['Burden(Direct)'].sum() - traversal_df['Burden(Direct)'].sum() + 5.0
+            )
+
+
+    def test_list_of_scenarios_is_named_by_position(self, traversal_df):
+        """
+        Tests that scenarios passed as a list are named by their position,
+        and that the baseline score defaults to the sum of the direct burden.
+        """
+        results = evaluate_scenarios(df=traversal_df, scenarios=[{}, {6: {'BurdenIntensity': 0.0}}])
+        assert list(results.burdens.index) == [0, 1]
+        assert list(results.burdens.columns) == list(traversal_df['UID'])
+        assert results.scores[0] == pytest.approx(traversal_df['Burden(Direct)'].sum())
+        assert results.scores[1] == pytest.approx(traversal_df['Burden(Direct)'].sum() - 0.01 * 4.0)
+
+
+    def test_empty_scenario_returns_score(self, traversal_df_outside_flows):
+        """
+        Tests that a scenario without edits has the baseline score and table, and that scenarios
+        have the same scores and burdens as the incremental editor, also if the direct burden
+        differs from the supply amount times the burden intensity.
+        """
+        edits = {1: {'SupplyAmount': 0.25}, 6: {'BurdenIntensity': 1.0}}
+        results = evaluate_scenarios(df=traversal_df_outside_flows, scenarios=[{}, edits], score=5.0)
+        assert results.scores[0] == 5.0
+        np.testing.assert_array_equal(results.burdens.loc[0].to_numpy(), traversal_df_outside_flows['Burden(Direct)'].to_numpy())
+
+        editor = IncrementalEditor(df=traversal_df_outside_flows, score=5.0)
+        editor.apply_edits([(uid, field, value) for uid, cells in edits.items() for field, value in cells.items()])
+        assert results.scores[1] == pytest.approx(editor.score)
+        np.testing.assert_allclose(results.burdens.loc[1].to_numpy(), editor.to_dataframe()['Burden(Direct)'].to_numpy())
+
+
+    def test_raises_error_for_unknown_uid_or_field(self, traversal_df):
+        """
+        Tests that edits of nodes which are not in the table, or of columns which cannot be edited, raise a ValueError.
+        """
+        with pytest.raises(ValueError):
+            evaluate_scenarios(df=traversal_df, scenarios=[{99: {'SupplyAmount': 1.0}}])
+        with pytest.raises(ValueError):
+            evaluate_scenarios(df=traversal_df, scenarios=[{1: {'Burden(Direct)': 1.0}}])
+
+
+class TestComputeSensitivities:
+    """
+    Test suite for the `compute_sensitivities` function.
+    """
+
+    @staticmethod
+    def _finite_differences(df: pd.DataFrame, field: str, step: float = 1e-6) -> pd.Series:
+        total = (df['SupplyAmount'] * df['BurdenIntensity']).sum()
+        derivatives = {}
+        for uid in df['UID']:
+            df_user_input = df.copy()
+            df_user_input.loc[df_user_input['UID'] == uid, field] += step
+            df_edited = apply_user_modifications(df_original=df, df_user_input=df_user_input)
+            derivatives[uid] = (df_edited['Burden(Direct)'].sum() - total) / step
+        return pd.Series(derivatives)
+
+
+    def test_sensitivities_match_finite_differences(self, traversal_df):
+        """
+        Tests that the derivatives match the change of the total score when editing every node in turn,
+        including the node whose parent is missing from the table.
+        """
+        df = compute_sensitivities(df=traversal_df).set_index('UID')
+        for field in ['SupplyAmount', 'BurdenIntensity']:
+            expected = self._finite_differences(traversal_df, field)
+            np.testing.assert_allclose(df.loc[expected.index, f'Sensitivity({field})'], expected, rtol=1e-5)
+
+
+    def test_ranked_by_elasticity_of_supply_amount(self, traversal_df):
+        """
+        Tests that the nodes are ranked by decreasing elasticity and that the elasticities are relative to the score.
+        """
+        df = compute_sensitivities(df=traversal_df, score=2.0)
+        assert list(df['UID']) == [0, 1, 2, 4, 5, 3, 8, 6]
+        assert df['Elasticity(SupplyAmount)'].iloc[0] == pytest.approx(traversal_df['Burden(Direct)'].sum() / 2.0)
+        np.testing.assert_allclose(df['Elasticity(BurdenIntensity)'], df['Burden(Direct)'] / 2.0)
+
+
+    def test_zero_supply_amount(self, traversal_df):
+        """
+        Tests that the derivative with respect to a supply amount of zero is the burden intensity of the node.
+        """
+        df_zero = traversal_df.copy()
+        df_zero.loc[df_zero['UID'].isin([4, 5, 6]), 'SupplyAmount'] = 0.0
+        df = compute_sensitivities(df=df_zero).set_index('UID')
+        assert df.loc[4, 'Sensitivity(SupplyAmount)'] == 0.0
+        assert df.loc[5, 'Sensitivity(SupplyAmount)'] == 1.5
+        expected = self._finite_differences(df_zero, 'SupplyAmount')
+        np.testing.assert_allclose(df.loc[expected.index, 'Sensitivity(SupplyAmount)'], expected, rtol=1e-5)
+
+
+class TestSimulateUserModifications:
+    """
+    Test suite for the `simulate_user_modifications` function.
+    """
+
+    def test_iterations_match_full_pipeline(self, traversal_df):
+        """
+        Tests that a single iteration (whose percentiles are the sampled values) is the same as
+        applying the full pipeline to the sampled edits, with nested edits, a node whose parent is missing
+        from the table, and both distributions and a relative uncertainty.
+        """
+        df_user_input = traversal_df.copy()
+        df_user_input.loc[df_user_input['UID'] == 1, 'SupplyAmount'] = 0.25
+        df_user_input.loc[df_user_input['UID'] == 3, 'SupplyAmount'] = 0.05
+        df_user_input.loc[df_user_input['UID'] == 4, ['SupplyAmount', 'BurdenIntensity']] = [0.18, 1.0]
+        df_user_input.loc[df_user_input['UID'] == 5, 'BurdenIntensity'] = 2.0
+        distributions = {
+            6: {'SupplyAmount': {'distribution': 'lognormal', 'mean': -4.0, 'sigma': 0.3}},
+            8: {'BurdenIntensity': {'distribution': 'uniform', 'low': 2.0, 'high': 3.0}},
+        }
+        for seed in range(5):
+            results = simulate_user_modifications(
+                df_original=traversal_df,
+                df_user_input=df_user_input,
+                distributions=distributions,
+                relative_uncertainty=0.2,
+                iterations=1,
+                score=5.0,
+                seed=seed,
+            )
+            supply, burdens = results.supply.iloc[0], results.burdens.iloc[0]
+            df_sampled = traversal_df.copy()
+            for uid in [1, 3, 4, 6]:
+                df_sampled.loc[df_sampled['UID'] == uid, 'SupplyAmount'] = supply[uid]
+            for uid in [4, 5, 8]:
+                df_sampled.loc[df_sampled['UID'] == uid, 'BurdenIntensity'] = burdens[uid] / supply[uid]
+            expected_df = apply_user_modifications(df_original=traversal_df, df_user_input=df_sampled)
+            np.testing.assert_allclose(supply.to_numpy(), expected_df['SupplyAmount'].to_numpy())
+            np.testing.assert_allclose(burdens.to_numpy(), expected_df['Burden(Direct)'].to_numpy())
+            assert results.scores[0] == pytest.approx(
+                expected_df['Burden(Direct)'].sum() - traversal_df['Burden(Direct)'].sum() + 5.0
+            )
+
+
+    def test_without_uncertainty_returns_edited_values(self, traversal_df):
+        """
+        Tests that without distributions and relative uncertainty, all percentiles are the deterministic result.
+        """
+        df_user_input = traversal_df.copy()
+        df_user_input.loc[df_user_input['UID'] == 1, 'SupplyAmount'] = 0.25
+        results = simulate_user_modifications(df_original=traversal_df, df_user_input=df_user_input, iterations=10)
+        expected_df = apply_user_modifications(df_original=traversal_df, df_user_input=df_user_input)
+        for percentile in results.burdens.index:
+            np.testing.assert_allclose(results.burdens.loc[percentile].to_numpy(), expected_df['Burden(Direct)'].to_numpy())
+        np.testing.assert_allclose(results.scores, expected_df['Burden(Direct)'].sum())
+
+
+    def test_without_edits_returns_score(self, traversal_df_outside_flows):
+        """
+        Tests that a simulation without edits returns the baseline score and table, and that edits
+        give the same scores and burdens as the incremental editor, also if the direct burden
+        differs from the supply amount times the burden intensity.
+        """
+        results = simulate_user_modifications(df_original=traversal_df_outside_flows, score=5.0, iterations=10)
+        np.testing.assert_array_equal(results.scores, 5.0)
+        for percentile in results.burdens.index:
+            np.testing.assert_array_equal(
+                results.burdens.loc[percentile].to_numpy(), traversal_df_outside_flows['Burden(Direct)'].to_numpy()
+            )
+
+        df_user_input = traversal_df_outside_flows.copy()
+        df_user_input.loc[df_user_input['UID'] == 1, 'SupplyAmount'] = 0.25
+        df_user_input.loc[df_user_input['UID'] == 6, 'BurdenIntensity'] = 1.0
+        results = simulate_user_modifications(
+            df_original=traversal_df_outside_flows, df_user_input=df_user_input, score=5.0, iterations=10
+        )
+        editor = IncrementalEditor(df=traversal_df_outside_flows, score=5.0)
+        editor.apply_dataframe(df_user_input)
+        np.testing.assert_allclose(results.scores, editor.score)
+        np.testing.assert_allclose(results.burdens.loc[50.0].to_numpy(), editor.to_dataframe()['Burden(Direct)'].to_numpy())
+
+
+    def test_percentiles_of_downstream_nodes(self, traversal_df):
+        """
+        Tests that the percentiles of the nodes downstream of an uncertain supply amount are scaled
+        from the percentiles of the supply amount, in increasing order also for negative burden intensities.
+        """
+        df = traversal_df.copy()
+        df.loc[df['UID'] == 5, 'BurdenIntensity'] = -1.5
+        df['Burden(Direct)'] = df['SupplyAmount'] * df['BurdenIntensity']
+        results = simulate_user_modifications(
+            df_original=df,
+            distributions={2: {'SupplyAmount': {'distribution': 'uniform', 'low': 0.1, 'high': 0.3}}},
+            iterations=1000,
+            percentiles=(5, 50, 95),
+            seed=42,
+        )
+        np.testing.assert_allclose(results.supply[5], 0.05 / 0.2 * results.supply[2])
+        assert (results.burdens.diff().iloc[1:] >= 0).all().all()
+        assert results.burdens[5].iloc[0] == pytest.approx(-1.5 * 0.05 / 0.2 * results.supply[2].iloc[-1])
+        np.testing.assert_allclose(results.supply[[0, 1, 3, 8]].to_numpy(), np.tile(df.set_index('UID').loc[[0, 1, 3, 8], 'SupplyAmount'], (3, 1)))
+        assert results.score_percentiles.iloc[0] < df['Burden(Direct)'].sum() < results.score_percentiles.iloc[-1]
+
+
+    def test_raises_error_for_invalid_distributions(self, traversal_df):
+        """
+        Tests that distributions of nodes which are not in the table, of columns which cannot be edited,
+        or of unknown type raise a ValueError.
+        """
+        for distributions in [
+            {99: {'SupplyAmount': {'distribution': 'normal'}}},
+            {1: {'Burden(Direct)': {'distribution': 'normal'}}},
+            {1: {'SupplyAmount': {'distribution': 'poisson', 'lam': 1.0}}},
+        ]:
+            with pytest.raises(ValueError):
+                simulate_user_modifications(df_original=traversal_df, distributions=distributions)
+        with pytest.raises(ValueError):
+            simulate_user_modifications(df_original=traversal_df, iterations=0)
+
+
+class TestSolveUserModifications:
+    """
+    Test suite for the `solve_user_modifications` function.
+    """
+
+    @staticmethod
+    def _traversal(demand: dict, method: tuple):
+        return perform_graph_traversal(
+            cutoff=0.001,
+            biosphere_cutoff=0.001,
+            max_calc=300,
+            return_format='traversal_result',
+            demand=demand,
+            method=method,
+        )
+
+
+    @pytest.mark.parametrize('dense_max_products', [0, 2000])
+    @pytest.mark.parametrize('max_rank', [50, 0])
+    def test_score_matches_solve_of_edited_matrices(self, dense_max_products, max_rank) -> None:
+        """
+        Tests that the score matches a solve of the edited technosphere matrix, demand and direct intensities,
+        with the Woodbury matrix identity (`max_rank=50`) and without (`max_rank=0`),
+        for a factorized and an inverted technosphere matrix.
+        """
+        system = example_system_synthetic(number_of_activities=300, cycles=5)
+        demand = {bd.get_node(code=system['demand_code']): 1}
+        traversal = self._traversal(demand, system['method'])
+        lca = perform_lca(demand=demand, method=system['method'], lca_pool=LCAPool(dense_max_products=dense_max_products))
+        df_user_input = traversal.to_dataframe()
+        df_user_input.loc[0, 'SupplyAmount'] = 2.0
+        df_user_input.loc[[3, 7], 'SupplyAmount'] *= [0.4, 1.5]
+        df_user_input.loc[[2, 9], 'BurdenIntensity'] = [0.0, 3.0]
+
+        results = solve_user_modifications(lca=lca, traversal=traversal, df_user_input=df_user_input, max_rank=max_rank)
+
+        technosphere_matrix = lca.technosphere_matrix.tolil(copy=True)
+        for row in [3, 7]:
+            product = traversal.reference_product_index[row]
+            consumer = traversal.activity_index[traversal.parent_index[row]]
+            technosphere_matrix[product, consumer] *= df_user_input.loc[row, 'SupplyAmount'] / traversal.supply_amount[row]
+        direct_intensity = _direct_intensity(lca)
+        for row in [2, 9]:
+            direct_intensity[traversal.activity_index[row]] = df_user_input.loc[row, 'BurdenIntensity']
+        supply = spsolve(technosphere_matrix.tocsc(), lca.demand_array * 2.0 / traversal.supply_amount[0])
+        assert results.score == pytest.approx(direct_intensity @ supply)
+        assert results.activities['Burden(Direct)'].sum() == pytest.approx(results.score)
+        assert list(results.nodes['Edited?'].to_numpy().nonzero()[0]) == [0, 2, 3, 7, 9]
+        assert results.nodes['Updated?'].sum() == len(traversal.uid) - 5
+
+
+    def test_no_edits_return_baseline(self) -> None:
+        """
+        Tests that a table without edits returns the score and supply amounts of the graph traversal.
+        """
+        example_system_bike_production()
+        demand = {bd.get_node(code='bike'): 1}
+        traversal = self._traversal(demand, ('IPCC', ))
+        lca = perform_lca(demand=demand, method=('IPCC', ))
+        results = solve_user_modifications(lca=lca, traversal=traversal, df_user_input=traversal.to_dataframe())
+        assert results.score == pytest.approx(lca.score)
+        np.testing.assert_array_equal(results.nodes['SupplyAmount'].to_numpy(), traversal.supply_amount)
+        assert not results.nodes['Updated?'].any()
+
+
+    def test_burden_intensity_of_non_unit_production_amount(self) -> None:
+        """
+        Tests that burden intensities, which are per unit of activity, are not scaled by the production amount:
+        an edit to the same value keeps the score, and a doubled intensity doubles the burden of the node.
+        """
+        bd.projects.set_current('production_amount')
+        db = bd.Database('production_amount')
+        db.write({
+            ('production_amount', 'co2'): {'name': 'Carbon Dioxide', 'type': 'emission', 'unit': 'kg'},
+            ('production_amount', 'a'): {
+                'name': 'a',
+                'unit': 'unit',
+                'exchanges': [
+                    {'input': ('production_amount', 'a'), 'amount': 1, 'type': 'production'},
+                    {'input': ('production_amount', 'b'), 'amount': 3, 'type': 'technosphere'},
+                    {'input': ('production_amount', 'co2'), 'amount': 1, 'type': 'biosphere'},
+                ],
+            },
+            ('production_amount', 'b'): {
+                'name': 'b',
+                'unit': 'unit',
+                'exchanges': [
+                    {'input': ('production_amount', 'b'), 'amount': 2, 'type': 'production'},
+                    {'input': ('production_amount', 'co2'), 'amount': 4, 'type': 'biosphere'},
+                ],
+            },
+        })
+        bd.Method(('production_amount', )).write([(('production_amount', 'co2'), 1)])
+        demand = {bd.get_node(code='a'): 1}
+        traversal = self._traversal(demand, ('production_amount', ))
+        lca = perform_lca(demand=demand, method=('production_amount', ))
+        assert lca.score == pytest.approx(7.0)
+        row = int(np.flatnonzero(traversal.reference_product_production_amount == 2)[0])
+
+        df_user_input = traversal.to_dataframe()
+        df_user_input.loc[row, 'BurdenIntensity'] = np.nextafter(df_user_input.loc[row, 'BurdenIntensity'], np.inf)
+        results = solve_user_modifications(lca=lca, traversal=traversal, df_user_input=df_user_input)
+        assert results.score == pytest.approx(lca.score)
+
+        df_user_input.loc[row, 'BurdenIntensity'] = 8.0
+        results = solve_user_modifications(lca=lca, traversal=traversal, df_user_input=df_user_input)
+        assert results.score == pytest.approx(13.0)
+        assert results.nodes.loc[row, 'Burden(Direct)'] == pytest.approx(12.0)
+        assert results.nodes['Burden(Direct)'].sum() == pytest.approx(results.score)
+
+
+    def test_raises_error_for_conflicting_edits(self) -> None:
+        """
+        Tests that different burden intensities of two nodes of the same activity raise a ValueError.
+        """
+        example_system_bike_production()
+        demand = {bd.get_node(code='bike'): 1}
+        traversal = self._traversal(demand, ('IPCC', ))
+        lca = perform_lca(demand=demand, method=('IPCC', ))
+        df_user_input = traversal.to_dataframe()
+        steel = df_user_input.index[df_user_input['Name'] == 'steel production']
+        df_user_input.loc[steel, 'BurdenIntensity'] = np.arange(1, len(steel) + 1)
+        with pytest.raises(ValueError, match="same burden intensity"):
+            solve_user_modifications(lca=lca, traversal=traversal, df_user_input=df_user_input)
@@ -0,0 +1,110 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from brightwebapp.modifications import apply_user_modifications
+from brightwebapp.sessions import EditSessionStore
+
+
+@pytest.fixture
+def traversal_df() -> pd.DataFrame:
+    df = pd.DataFrame({
+        'UID': [0, 1, 2, 3],
+        'SupplyAmount': [1.0, 0.5, 0.2, 0.1],
+        'BurdenIntensity': [0.5, 1.0, 2.0, 0.3],
+        'Branch': [np.nan, [0, 1], [0, 1, 2], [0, 3]],
+    })
+    df['Burden(Direct)'] = df['SupplyAmount'] * df['BurdenIntensity']
+    return df
+
+
+class TestEditSessionStore:
+    """
+    Test suite for the `EditSessionStore` class.
+    """
+
+    def test_edits_of_session_match_full_pipeline(self, traversal_df) -> None:
+        """
+        Tests that a session looked up by its ID holds the edits applied to it,
+        and that deleted sessions can no longer be looked up.
+        """
+        store = EditSessionStore()
+        session = store.create(df=traversal_df, score=2.0, metadata={'method': ['IPCC']})
+        store.get(session.id).editor.edit(uid=1, field='SupplyAmount', value=0.25)
+        store.get(session.id).editor.edit(uid=3, field='BurdenIntensity', value=1.0)
+
+        df_user_input = traversal_df.copy()
+        df_user_input.loc[1, 'SupplyAmount'] = 0.25
+        df_user_input.loc[3, 'BurdenIntensity'] = 1.0
+        expected_df = apply_user_modifications(df_original=traversal_df, df_user_input=df_user_input)
+        pd.testing.assert_frame_equal(store.get(session.id).editor.to_dataframe(), expected_df)
+        assert session.to_dict()['score'] == pytest.approx(
+            2.0 + expected_df['Burden(Direct)'].sum() - traversal_df['Burden(Direct)'].sum()
+        )
+        assert session.to_dict()['metadata'] == {'method': ['IPCC']}
+
+        assert store.delete(session.id)
+        assert store.get(session.id) is None
+        assert not store.delete(session.id)
+
+    def test_sessions_expire_after_ttl(self, traversal_df) -> None:
+        """
+        Tests that sessions which have not been looked up for `ttl` seconds expire,
+        and that looking up a session extends its lifetime.
+        """
+        store = EditSessionStore(ttl=0.5)
+        session = store.create(df=traversal_df)
+        other_session = store.create(df=traversal_df)
+        time.sleep(0.3)
+        assert store.get(session.id) is session
+        time.sleep(0.3)
+        assert store.get(other_session.id) is None
+        assert store.get(session.id) is session
+        assert store.stats()['expirations'] == 1
+
+    def test_evicts_least_recently_used_sessions_above_maxbytes(self, traversal_df) -> None:
+        """
+        Tests that the memory of the sessions is accounted for, and that the least recently used session is evicted
+        when the sessions exceed `maxbytes`.
+        """
+        nbytes = EditSessionStore().create(df=traversal_df).editor.nbytes
+        store = EditSessionStore(maxbytes=int(2.5 * nbytes))
+        sessions = [store.create(df=traversal_df) for _ in range(2)]
+        store.get(sessions[0].id)
+        sessions.append(store.create(df=traversal_df))
+        assert store.get(sessions[1].id) is None
+        assert store.get(sessions[0].id) is sessions[0]
+        assert store.stats()['sessions'] == 2
+        assert store.stats()['nbytes'] == 2 * nbytes
+        assert store.stats()['evictions'] == 1
+        with pytest.raises(ValueError):
+            EditSessionStore(maxbytes=nbytes - 1).create(df=traversal_df)
+
+    def test_update_size_accounts_for_revisions(self, traversal_df) -> None:
+        """
+        Tests that the memory of the revisions of a session is accounted for after an edit,
+        and that at most `max_revisions` revisions are kept.
+        """
+        store = EditSessionStore(max_revisions=1)
+        session = store.create(df=traversal_df)
+        nbytes = store.stats()['nbytes']
+        session.editor.edit(uid=1, field='SupplyAmount', value=0.25)
+        assert store.update_size(session.id)
+        assert store.stats()['nbytes'] == session.editor.nbytes > nbytes
+        session.editor.edit(uid=3, field='BurdenIntensity', value=1.0)
+        assert session.editor.oldest_revision == 1
+        assert session.to_dict()['revision'] == 2
+
+    def test_update_size_reports_discarded_session(self, traversal_df) -> None:
+        """
+        Tests that `update_size` reports a session which has grown larger than `maxbytes` and has been discarded.
+        """
+        nbytes = EditSessionStore().create(df=traversal_df).editor.nbytes
+        store = EditSessionStore(maxbytes=nbytes)
+        session = store.create(df=traversal_df)
+        session.editor.edit(uid=1, field='SupplyAmount', value=0.25)
+        assert not store.update_size(session.id)
+        assert store.get(session.id) is None
+        assert not store.update_size(session.id)
@@ -0,0 +1,52 @@
+import bw2data as bd
+import pytest
+
+from brightwebapp.streaming import iter_graph_traversal_events
+from brightwebapp.traversal import perform_graph_traversal
+from .fixtures.supplychain import example_system_bike_production
+
+
+class TestIterGraphTraversalEvents:
+    """
+    Test suite for the `iter_graph_traversal_events` function.
+    """
+
+    def test_events_contain_all_nodes(self) -> None:
+        """
+        Tests that the `nodes` events contain the nodes of the graph traversal
+        and that the last event is a `summary` event.
+        """
+        example_system_bike_production()
+        kwargs = dict(
+            demand={bd.get_node(code='bike'): 1},
+            method=('IPCC', ),
+            cutoff=1e-6,
+            biosphere_cutoff=0.01,
+            max_calc=1000,
+        )
+        events = list(iter_graph_traversal_events(interval_ms=0, **kwargs))
+        result = perform_graph_traversal(return_format='traversal_result', **kwargs)
+
+        assert events[-1]['event'] == 'summary'
+        assert events[-1]['nodes'] == len(result)
+        assert events[-1]['truncated'] == ''
+        assert events[-1]['coverage'] == pytest.approx(result.coverage)
+        assert {event['event'] for event in events[:-1]} == {'progress', 'nodes'}
+        nodes = [node for event in events if event['event'] == 'nodes' for node in event['nodes']]
+        assert sorted(node['uid'] for node in nodes) == sorted(result.uid.tolist())
+        assert sorted(node['name'] for node in nodes) == sorted(result.names)
+        assert all(node['parent_uid'] is not None for node in nodes if node['uid'] != 0)
+
+    def test_error_event(self) -> None:
+        """
+        Tests that an exception of the life-cycle assessment is returned as an `error` event.
+        """
+        example_system_bike_production()
+        events = list(iter_graph_traversal_events(
+            demand={bd.get_node(code='bike'): 1},
+            method=('missing method', ),
+            cutoff=0.001,
+            biosphere_cutoff=0.001,
+            max_calc=100,
+        ))
+        assert [event['event'] for event in events] == ['error']
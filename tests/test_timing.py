@@ -0,0 +1,56 @@
+import bw2data as bd
+import numpy as np
+
+from brightwebapp.timing import StageTimer
+from brightwebapp.traversal import perform_graph_traversal, LCAPool
+from .fixtures.supplychain import example_system_bike_production
+
+
+class TestStageTimer:
+    """
+    Test suite for the `StageTimer` class.
+    """
+
+    def test_span(self) -> None:
+        """
+        Tests that spans record their counts and peak memory and are passed to the callback.
+        """
+        completed_spans = []
+        timer = StageTimer(callback=completed_spans.append, trace_memory=True)
+        with timer.span('allocate', rows=1000) as counts:
+            array = np.ones(1_000_000)
+            counts['columns'] = 1
+        del array
+        with timer.span('idle'):
+            pass
+
+        assert [span.name for span in completed_spans] == ['allocate', 'idle']
+        assert timer.spans[0].counts == {'rows': 1000, 'columns': 1}
+        assert timer.spans[0].peak_memory_bytes >= 8_000_000
+        assert timer.spans[1].peak_memory_bytes < 8_000_000
+        assert timer.server_timing().startswith('allocate;dur=')
+        assert timer.total_ms >= timer.spans[0].duration_ms
+
+    def test_perform_graph_traversal_stages(self) -> None:
+        """
+        Tests that `perform_graph_traversal` records the stages of the calculation.
+        """
+        example_system_bike_production()
+        timer = StageTimer()
+        result = perform_graph_traversal(
+            cutoff=0.001,
+            biosphere_cutoff=0.001,
+            max_calc=100,
+            return_format='csv',
+            demand={bd.get_node(code='bike'): 1},
+            method=('IPCC', ),
+            lca_pool=LCAPool(),
+            timer=timer,
+        )
+        assert isinstance(result, str)
+        assert [span.name for span in timer.spans] == [
+            'lci', 'lcia', 'traversal', 'names', 'branches', 'serialization',
+        ]
+        stages = {span['name']: span for span in timer.to_dict()}
+        assert stages['lci']['counts'] == {'factorized': 1}
+        assert stages['traversal']['counts']['nodes'] == result.count('\n') - 1
@@ -1,5 +1,10 @@
+import sys
+import threading
+
 import pytest
 import bw2data as bd
+import bw_graph_tools as bgt
+import numpy as np
 import pandas as pd
 from pandas.testing import assert_frame_equal
 from bw_graph_tools.graph_traversal.graph_objects import Node
@@ -7,6 +12,7 @@ from bw_graph_tools.graph_traversal.graph_objects import Node
 from tests.fixtures.supplychain import (
     example_system_bike_production
 )
+from tests.fixtures.synthetic import example_system_synthetic
 
 
 from brightwebapp.traversal import (
@@ -17,6 +23,13 @@ from brightwebapp.traversal import (
     _edges_dict_to_dataframe,
     _trace_branch_from_last_node,
     _add_branch_information_to_edges_dataframe,
+    _build_branches_from_parent_pointers,
+    TraversalResult,
+    TraversalCache,
+    LCAPool,
+    ResumableGraphTraversal,
+    _solve_transposed,
+    _TRANSPOSED_SOLVERS,
 )
 
 
@@ -119,6 +132,24 @@ def test_traverse_graph() -> dict:
     return traversal
 
 
+def test_traverse_graph_synthetic_supply_chain() -> None:
+    """
+    Tests that a graph traversal without cutoff reaches every activity of a synthetic supply chain
+    and that its score matches the life-cycle assessment.
+    """
+    system = example_system_synthetic(number_of_activities=200, fan_out=2, depth=4, cycles=0)
+    assert sum(system['levels']) == 200
+    lca = perform_lca(
+        demand={bd.get_node(code=system['demand_code']): 1},
+        method=system['method'],
+    )
+    traversal = _traverse_graph(lca=lca, cutoff=1e-12, biosphere_cutoff=1e-12, max_calc=10_000)
+    activities = {node.activity_index for node in traversal['nodes'].values() if node.unique_id != -1}
+    assert len(activities) == 200
+    assert traversal['traversal'].truncated is None
+    assert np.isclose(traversal['nodes'][0].cumulative_score, lca.score)
+
+
 def test_nodes_dict_to_dataframe() -> None:
     """
     Test the `_nodes_dict_to_dataframe` function to ensure it correctly converts
@@ -163,4 +194,614 @@ def test_trace_branch_from_last_node():
         {'consumer_unique_id': 2, 'producer_unique_id': 3},
     ])
     branch = _trace_branch_from_last_node(df_edges, 3)
-    assert branch == [0, 1, 2, 3]
\ No newline at end of file
+    assert branch == [0, 1, 2, 3]
+
+
+def test_build_branches_from_parent_pointers_matches_trace_branch():
+    """
+    Test that `_build_branches_from_parent_pointers` returns the same branches
+    as repeated calls of `_trace_branch_from_last_node` on a random tree.
+    """
+    rng = np.random.default_rng(42)
+    producers = np.arange(1, 300)
+    consumers = np.array([rng.integers(0, producer) for producer in producers])
+    df_edges = pd.DataFrame({
+        'consumer_unique_id': consumers,
+        'producer_unique_id': producers,
+    })
+    branches = _build_branches_from_parent_pointers(consumers, producers)
+    assert branches == [
+        _trace_branch_from_last_node(df_edges, int(producer)) for producer in producers
+    ]
+    assert all(type(uid) is int for branch in branches for uid in branch)
+
+
+def test_build_branches_from_parent_pointers_raises_on_cycle():
+    """
+    Test that `_build_branches_from_parent_pointers` raises a ValueError
+    if the edges contain a cycle.
+    """
+    with pytest.raises(ValueError, match="Cycle detected"):
+        _build_branches_from_parent_pointers(
+            consumer_unique_ids=np.array([0, 3, 2]),
+            producer_unique_ids=np.array([1, 2, 3]),
+        )
+
+
+
+class TestTraversalResult:
+    """
+    Test suite for the `TraversalResult` class.
+    """
+
+    def test_to_dataframe_matches_nodes_and_edges_dataframes(self) -> None:
+        """
+        Tests that `TraversalResult.to_dataframe` returns the same table as merging
+        the outputs of `_nodes_dict_to_dataframe` and `_add_branch_information_to_edges_dataframe`.
+        """
+        traversal = test_traverse_graph()
+        df_nodes = _nodes_dict_to_dataframe(traversal['nodes'])
+        df_edges = _add_branch_information_to_edges_dataframe(
+            _edges_dict_to_dataframe(traversal['edges'])
+        )
+        df_expected = pd.merge(
+            df_nodes,
+            df_edges,
+            left_on='UID',
+            right_on='producer_unique_id',
+            how='left'
+        ).drop(columns=['producer_unique_id', 'activity_datapackage_id'])
+
+        result = TraversalResult.from_traversal(nodes=traversal['nodes'], edges=traversal['edges'])
+        assert len(result) == 3
+        assert_frame_equal(result.to_dataframe(), df_expected)
+        assert result.to_csv() == df_expected.to_csv(index=False)
+
+    def test_arrays(self) -> None:
+        """
+        Tests the dtypes and the parent pointers of the node arrays.
+        """
+        traversal = test_traverse_graph()
+        result = TraversalResult.from_traversal(nodes=traversal['nodes'], edges=traversal['edges'])
+        assert result.uid.dtype == np.int64
+        assert result.supply_amount.dtype == np.float64
+        assert result.parent_index.tolist() == [-1, 0, 1]
+        assert result.scope.tolist() == [1, 3, 3]
+        assert result.branches == [None, [0, 1], [0, 1, 2]]
+
+    def test_iter_csv(self) -> None:
+        """
+        Tests that the chunks of `TraversalResult.iter_csv` and of the `'csv_stream'` return format
+        are identical to the CSV string when concatenated.
+        """
+        traversal = test_traverse_graph()
+        result = TraversalResult.from_traversal(nodes=traversal['nodes'], edges=traversal['edges'])
+        chunks = list(result.iter_csv(chunksize=2))
+        assert len(chunks) == 2
+        assert chunks[0].startswith('UID,Scope,Name')
+        assert ''.join(chunks) == result.to_csv()
+
+        kwargs = dict(
+            demand={bd.get_node(code='bike'): 1},
+            method=('IPCC', ),
+            cutoff=0.001,
+            biosphere_cutoff=0.001,
+            max_calc=100,
+        )
+        assert ''.join(perform_graph_traversal(return_format='csv_stream', **kwargs)) == perform_graph_traversal(return_format='csv', **kwargs)
+
+    def test_to_arrow(self) -> None:
+        """
+        Tests that `TraversalResult.to_arrow` returns the `Branch` column as a list<int32> column.
+        """
+        pa = pytest.importorskip('pyarrow')
+        traversal = test_traverse_graph()
+        result = TraversalResult.from_traversal(nodes=traversal['nodes'], edges=traversal['edges'])
+        table = result.to_arrow()
+        assert table.schema.field('Branch').type == pa.list_(pa.int32())
+        assert table.column('Branch').to_pylist() == [None, [0, 1], [0, 1, 2]]
+        assert table.column('Name').to_pylist()[0] == 'bike production'
+
+    def test_parquet_and_arrow_return_formats(self) -> None:
+        """
+        Tests that the `'parquet'` return format round-trips to the table of the `'arrow'` return format,
+        for a single method and a list of methods.
+        """
+        pa = pytest.importorskip('pyarrow')
+        pq = pytest.importorskip('pyarrow.parquet')
+        example_system_bike_production()
+        kwargs = dict(
+            demand={bd.get_node(code='bike'): 1},
+            cutoff=0.001,
+            biosphere_cutoff=0.001,
+            max_calc=100,
+        )
+        for method in [('IPCC', ), [('IPCC', )]]:
+            table = perform_graph_traversal(return_format='arrow', method=method, **kwargs)
+            parquet = perform_graph_traversal(return_format='parquet', method=method, **kwargs)
+            assert isinstance(parquet, bytes)
+            assert pq.read_table(pa.BufferReader(parquet)).equals(table)
+            assert table.schema.field('Branch').type == pa.list_(pa.int32())
+        assert 'Burden(Cumulative)[IPCC]' in table.column_names
+
+    def test_raises_for_invalid_types(self) -> None:
+        """
+        Tests that `TraversalResult.from_traversal` raises a TypeError for invalid input types.
+        """
+        with pytest.raises(TypeError, match="Expected 'nodes' to be a dict"):
+            TraversalResult.from_traversal(nodes=[], edges=[])
+        with pytest.raises(TypeError, match="Expected 'edges' to be a list"):
+            TraversalResult.from_traversal(nodes={}, edges={})
+
+
+
+class TestResumableGraphTraversal:
+    """
+    Test suite for the `ResumableGraphTraversal` class.
+    """
+
+    @staticmethod
+    def _signature(nodes: dict) -> list:
+        return sorted(
+            (node.depth, node.activity_index, round(node.cumulative_score, 8)) for node in nodes.values()
+        )
+
+    def test_refine_matches_new_traversal(self) -> None:
+        """
+        Tests that a traversal refined to a lower cutoff contains the same nodes as a new traversal.
+        """
+        example_system_bike_production()
+        lca = perform_lca(demand={bd.get_node(code='bike'): 1}, method=('IPCC', ))
+        traversal = _traverse_graph(lca=lca, cutoff=0.5, biosphere_cutoff=0.01, max_calc=1000)['traversal']
+        number_of_coarse_nodes = len(traversal.nodes)
+        traversal.refine(cutoff=1e-6)
+        traversal_new = _traverse_graph(lca=lca, cutoff=1e-6, biosphere_cutoff=0.01, max_calc=1000)
+        assert len(traversal.nodes) > number_of_coarse_nodes
+        assert self._signature(traversal.nodes) == self._signature(traversal_new['nodes'])
+
+    def test_refine_raises_for_larger_cutoff(self) -> None:
+        """
+        Tests that a traversal cannot be refined to a larger cutoff.
+        """
+        example_system_bike_production()
+        lca = perform_lca(demand={bd.get_node(code='bike'): 1}, method=('IPCC', ))
+        traversal = _traverse_graph(lca=lca, cutoff=0.01, biosphere_cutoff=0.01, max_calc=100)['traversal']
+        assert isinstance(traversal, ResumableGraphTraversal)
+        with pytest.raises(ValueError):
+            traversal.refine(cutoff=0.1)
+
+    def test_perform_graph_traversal_refines_cached_traversal(self) -> None:
+        """
+        Tests that `perform_graph_traversal` continues a cached traversal when the cutoff is lowered.
+        """
+        example_system_bike_production()
+        cache = TraversalCache()
+        kwargs = dict(
+            biosphere_cutoff=0.01,
+            max_calc=1000,
+            return_format='traversal_result',
+            demand={bd.get_node(code='bike'): 1},
+            method=('IPCC', ),
+        )
+        perform_graph_traversal(cutoff=0.5, cache=cache, **kwargs)
+        result_refined = perform_graph_traversal(cutoff=1e-6, cache=cache, **kwargs)
+        result_new = perform_graph_traversal(cutoff=1e-6, **kwargs)
+        assert cache.stats()['refinements'] == 1
+        assert sorted(result_refined.burden_cumulative.round(8)) == sorted(result_new.burden_cumulative.round(8))
+
+    @pytest.mark.parametrize('dense_max_products', [0, 1000])
+    def test_detached_traversal_is_refined_after_attach(self, dense_max_products: int) -> None:
+        """
+        Tests that a detached traversal releases its `LCA` object, cannot be refined,
+        and is refined to the same nodes as a new traversal once an `LCA` object from a pool is attached.
+        """
+        example_system_bike_production()
+        demand = {bd.get_node(code='bike'): 1}
+        lca_pool = LCAPool(dense_max_products=dense_max_products)
+        with lca_pool.checkout(demand=demand, method=('IPCC', )) as lca:
+            traversal = _traverse_graph(lca=lca, cutoff=0.5, biosphere_cutoff=0.01, max_calc=1000)['traversal']
+            traversal_new = _traverse_graph(lca=lca, cutoff=1e-6, biosphere_cutoff=0.01, max_calc=1000)
+        traversal.detach()
+        assert not traversal.attached
+        assert traversal.lca is None and traversal.characterized_biosphere is None
+        assert traversal.nbytes > 0
+        with pytest.raises(ValueError, match="detached"):
+            traversal.refine(cutoff=1e-6)
+
+        with lca_pool.checkout(demand=demand, method=('IPCC', )) as lca:
+            traversal.attach(lca)
+            traversal.refine(cutoff=1e-6)
+        assert self._signature(traversal.nodes) == self._signature(traversal_new['nodes'])
+        assert lca_pool.stats()['factorizations'] == 1
+
+    def test_cached_traversal_is_detached(self) -> None:
+        """
+        Tests that `perform_graph_traversal` caches traversals without their `LCA` object
+        and refines them with an `LCA` object from the pool.
+        """
+        example_system_bike_production()
+        cache = TraversalCache()
+        lca_pool = LCAPool()
+        kwargs = dict(
+            biosphere_cutoff=0.01,
+            max_calc=1000,
+            return_format='traversal_result',
+            demand={bd.get_node(code='bike'): 1},
+            method=('IPCC', ),
+            cache=cache,
+            lca_pool=lca_pool,
+        )
+        perform_graph_traversal(cutoff=0.5, **kwargs)
+        perform_graph_traversal(cutoff=1e-6, **kwargs)
+        assert cache.stats()['refinements'] == 1
+        assert lca_pool.stats()['factorizations'] == 1
+        assert all(not traversal.attached for _, traversal in cache.frontiers.items())
+
+    def test_time_budget_truncates_traversal(self) -> None:
+        """
+        Tests that a traversal stopped by its time budget is reported as truncated
+        and that refining it gives the complete traversal.
+        """
+        example_system_bike_production()
+        lca = perform_lca(demand={bd.get_node(code='bike'): 1}, method=('IPCC', ))
+        traversal = _traverse_graph(lca=lca, cutoff=1e-6, biosphere_cutoff=0.01, max_calc=1000, time_budget_ms=0)['traversal']
+        result_truncated = TraversalResult.from_traversal(
+            nodes=traversal.nodes,
+            edges=traversal.edges,
+            total_score=traversal.total_score,
+            truncated=traversal.truncated,
+        )
+        assert result_truncated.truncated == 'time_budget'
+        assert len(result_truncated) > 0
+        traversal.refine()
+        traversal_new = _traverse_graph(lca=lca, cutoff=1e-6, biosphere_cutoff=0.01, max_calc=1000)
+        result_new = TraversalResult.from_traversal(
+            nodes=traversal_new['nodes'],
+            edges=traversal_new['edges'],
+            total_score=lca.score,
+            truncated=traversal_new['traversal'].truncated,
+        )
+        assert traversal.truncated is None
+        assert result_new.truncated == ''
+        assert self._signature(traversal.nodes) == self._signature(traversal_new['nodes'])
+        assert result_truncated.coverage < result_new.coverage
+        assert result_new.coverage == pytest.approx(1, rel=1e-4)
+
+    def test_cancel(self) -> None:
+        """
+        Tests that a cancelled traversal stops after the first node and can be refined afterwards.
+        """
+        example_system_bike_production()
+        lca = perform_lca(demand={bd.get_node(code='bike'): 1}, method=('IPCC', ))
+        traversal = ResumableGraphTraversal(
+            lca=lca,
+            settings=bgt.GraphTraversalSettings(cutoff=1e-6, biosphere_cutoff=0.01, max_calc=1000),
+        )
+        traversal.cancel()
+        traversal.traverse()
+        assert traversal.truncated == 'cancelled'
+        assert traversal.progress['nodes'] == 0
+        traversal.refine()
+        traversal_new = _traverse_graph(lca=lca, cutoff=1e-6, biosphere_cutoff=0.01, max_calc=1000)
+        assert traversal.truncated is None
+        assert self._signature(traversal.nodes) == self._signature(traversal_new['nodes'])
+
+    def test_perform_graph_traversal_does_not_cache_truncated_result(self) -> None:
+        """
+        Tests that a result truncated by the time budget is not cached,
+        but continued by the next call with the same parameters.
+        """
+        example_system_bike_production()
+        cache = TraversalCache()
+        kwargs = dict(
+            cutoff=1e-6,
+            biosphere_cutoff=0.01,
+            max_calc=1000,
+            return_format='traversal_result',
+            demand={bd.get_node(code='bike'): 1},
+            method=('IPCC', ),
+        )
+        result_truncated = perform_graph_traversal(cache=cache, time_budget_ms=0, **kwargs)
+        assert result_truncated.truncated == 'time_budget'
+        assert cache.stats()['size'] == 0
+        result = perform_graph_traversal(cache=cache, **kwargs)
+        assert result.truncated == ''
+        assert cache.stats()['refinements'] == 1
+        assert cache.stats()['size'] == 1
+        assert len(result) == len(perform_graph_traversal(**kwargs))
+
+    def test_perform_graph_traversal_does_not_refine_traversal_truncated_by_max_calc(self) -> None:
+        """
+        Tests that lowering the cutoff of a traversal truncated by `max_calc`
+        gives the same result as a new traversal.
+        """
+        system = example_system_synthetic(number_of_activities=300, cycles=5)
+        cache = TraversalCache()
+        kwargs = dict(
+            biosphere_cutoff=0.01,
+            max_calc=10,
+            return_format='traversal_result',
+            demand={bd.get_node(code=system['demand_code']): 1},
+            method=system['method'],
+        )
+        result_coarse = perform_graph_traversal(cache=cache, cutoff=0.002, **kwargs)
+        assert result_coarse.truncated == 'max_calc'
+        result = perform_graph_traversal(cache=cache, cutoff=0.0002, **kwargs)
+        result_new = perform_graph_traversal(cutoff=0.0002, **kwargs)
+        assert cache.stats()['refinements'] == 0
+        assert len(result) == len(result_new)
+        assert sorted(result.activity_index) == sorted(result_new.activity_index)
+        assert perform_graph_traversal(cache=cache, cutoff=0.0002, **kwargs) is result
+
+
+class TestTraversalCache:
+    """
+    Test suite for the `TraversalCache` class and its use in `perform_graph_traversal`.
+    """
+
+    def test_repeated_traversal_is_served_from_memory(self) -> None:
+        """
+        Tests that a repeated graph traversal is served from the memory tier.
+        """
+        example_system_bike_production()
+        cache = TraversalCache()
+        kwargs = dict(
+            cutoff=0.01,
+            biosphere_cutoff=0.01,
+            max_calc=100,
+            return_format='dataframe',
+            demand={bd.get_node(code='bike'): 1},
+            method=('IPCC', ),
+            cache=cache,
+        )
+        df_first = perform_graph_traversal(**kwargs)
+        df_second = perform_graph_traversal(**kwargs)
+        assert_frame_equal(df_first, df_second)
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+        perform_graph_traversal(**{**kwargs, 'cutoff': 0.02})
+        assert cache.stats()['misses'] == 2
+
+    def test_counters_are_thread_safe(self) -> None:
+        """
+        Tests that the counters of a cache shared between threads do not lose updates.
+        """
+        cache = TraversalCache(maxsize=4)
+        barrier = threading.Barrier(8)
+
+        def hammer(offset: int) -> None:
+            barrier.wait()
+            for i in range(500):
+                key = str((offset + i) % 8)
+                if cache.get(key) is None:
+                    cache.put(key, np.zeros(8))
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # switch threads as often as possible
+        try:
+            threads = [threading.Thread(target=hammer, args=(offset,)) for offset in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        stats = cache.stats()
+        assert stats['hits'] + stats['misses'] == 8 * 500
+        assert stats['size'] <= 4
+
+    def test_results_survive_restart_on_disk(self, tmp_path) -> None:
+        """
+        Tests that results stored in the on-disk tier are found by a new cache instance.
+        """
+        example_system_bike_production()
+        kwargs = dict(
+            cutoff=0.01,
+            biosphere_cutoff=0.01,
+            max_calc=100,
+            return_format='csv',
+            demand={bd.get_node(code='bike'): 1},
+            method=('IPCC', ),
+        )
+        csv_first = perform_graph_traversal(**kwargs, cache=TraversalCache(cache_dir=tmp_path))
+        cache = TraversalCache(cache_dir=tmp_path)
+        csv_second = perform_graph_traversal(**kwargs, cache=cache)
+        assert csv_first == csv_second
+        assert cache.stats()['disk_hits'] == 1
+        assert cache.stats()['misses'] == 0
+
+    def test_database_modification_invalidates_cache(self) -> None:
+        """
+        Tests that modifying a database of the project leads to a cache miss.
+        """
+        example_system_bike_production()
+        cache = TraversalCache()
+        bike = bd.get_node(code='bike')
+        kwargs = dict(
+            cutoff=0.01,
+            biosphere_cutoff=0.01,
+            max_calc=100,
+            return_format='traversal_result',
+            method=('IPCC', ),
+            cache=cache,
+        )
+        perform_graph_traversal(demand={bike: 1}, **kwargs)
+        bike['location'] = 'SE'
+        bike.save()
+        perform_graph_traversal(demand={bike: 1}, **kwargs)
+        assert cache.stats()['hits'] == 0
+        assert cache.stats()['misses'] == 2
+
+    def test_memory_tier_evicts_by_size(self) -> None:
+        """
+        Tests that the memory tier evicts results once `maxbytes` is exceeded.
+        """
+        traversal = test_traverse_graph()
+        result = TraversalResult.from_traversal(nodes=traversal['nodes'], edges=traversal['edges'])
+        cache = TraversalCache(maxbytes=int(1.5 * result.nbytes))
+        cache.put('a', result)
+        cache.put('b', result)
+        assert cache.get('a') is None
+        assert cache.get('b') is result
+        assert cache.stats()['evictions'] == 1
+
+
+
+class TestLCAPool:
+    """
+    Test suite for the `LCAPool` class.
+    """
+
+    def test_new_demands_reuse_factorization(self) -> None:
+        """
+        Tests that new demands are served by the pooled `LCA` object
+        and give the same scores as a fresh calculation.
+        """
+        example_system_bike_production()
+        lca_pool = LCAPool()
+        for code, amount in [('bike', 1), ('steel', 2), ('bike', 3)]:
+            demand = {bd.get_node(code=code): amount}
+            with lca_pool.checkout(demand=demand, method=('IPCC', )) as lca:
+                score_pooled = lca.score
+            assert score_pooled == pytest.approx(perform_lca(demand=demand, method=('IPCC', )).score)
+        assert lca_pool.stats()['factorizations'] == 1
+        assert lca_pool.stats()['reuses'] == 2
+
+    def test_switch_method(self) -> None:
+        """
+        Tests that a different method is served by switching the characterization matrix.
+        """
+        example_system_bike_production()
+        bd.Method(('IPCC', 'doubled')).write([
+            (bd.get_node(code='co2').key, 2),
+        ])
+        lca_pool = LCAPool()
+        demand = {bd.get_node(code='bike'): 1}
+        with lca_pool.checkout(demand=demand, method=('IPCC', )) as lca:
+            score = lca.score
+        with lca_pool.checkout(demand=demand, method=('IPCC', 'doubled')) as lca:
+            score_doubled = lca.score
+        assert score_doubled == pytest.approx(2 * score)
+        assert lca_pool.stats()['method_switches'] == 1
+        assert lca_pool.stats()['factorizations'] == 1
+
+    def test_perform_graph_traversal_with_lca_pool(self) -> None:
+        """
+        Tests that `perform_graph_traversal` returns the same result with and without an `LCAPool`.
+        """
+        example_system_bike_production()
+        lca_pool = LCAPool()
+        kwargs = dict(
+            cutoff=0.01,
+            biosphere_cutoff=0.01,
+            max_calc=100,
+            return_format='dataframe',
+            method=('IPCC', ),
+        )
+        df_expected = perform_graph_traversal(demand={bd.get_node(code='bike'): 1}, **kwargs)
+        perform_graph_traversal(demand={bd.get_node(code='steel'): 1}, lca_pool=lca_pool, **kwargs)
+        df_pooled = perform_graph_traversal(demand={bd.get_node(code='bike'): 1}, lca_pool=lca_pool, **kwargs)
+        assert_frame_equal(df_pooled, df_expected)
+        assert lca_pool.stats()['factorizations'] == 1
+
+
+class TestMultiMethodTraversal:
+    """
+    Test suite for graph traversals with a list of methods.
+    """
+
+    def test_burdens_match_single_method_traversal(self) -> None:
+        """
+        Tests that every method of a multi-method traversal gives the cumulative burdens
+        of a single-method traversal, and that a doubled method gives doubled burdens.
+        """
+        example_system_bike_production()
+        bd.Method(('IPCC', 'doubled')).write([
+            (bd.get_node(code='co2').key, 2),
+        ])
+        kwargs = dict(
+            demand={bd.get_node(code='bike'): 1},
+            cutoff=0.001,
+            biosphere_cutoff=0.001,
+            max_calc=100,
+            return_format='traversal_result',
+        )
+        result_single = perform_graph_traversal(method=('IPCC', ), **kwargs)
+        results = perform_graph_traversal(method=[('IPCC', ), ('IPCC', 'doubled')], **kwargs)
+        assert list(results) == [('IPCC', ), ('IPCC', 'doubled')]
+        result_ipcc = results[('IPCC', )]
+        result_doubled = results[('IPCC', 'doubled')]
+        np.testing.assert_array_equal(result_ipcc.uid, result_single.uid)
+        np.testing.assert_allclose(result_ipcc.burden_cumulative, result_single.burden_cumulative)
+        np.testing.assert_allclose(result_doubled.burden_cumulative, 2 * result_ipcc.burden_cumulative)
+        np.testing.assert_allclose(result_doubled.burden_direct, 2 * result_ipcc.burden_direct)
+
+    def test_transposed_system_reuses_factorization(self) -> None:
+        """
+        Tests that the adjoint system of the technosphere matrix is solved from the dense inverse,
+        from the factorization of the `LCA` object, or from a cached factorization of the transposed matrix,
+        with the same solution.
+        """
+        example_system_bike_production()
+        demand = {bd.get_node(code='bike'): 1}
+        lca = perform_lca(demand=demand, method=('IPCC', ))
+        rhs = np.column_stack([np.arange(1.0, lca.technosphere_matrix.shape[0] + 1), np.ones(lca.technosphere_matrix.shape[0])])
+        expected = np.linalg.solve(lca.technosphere_matrix.toarray().T, rhs)
+
+        with LCAPool().checkout(demand=demand, method=('IPCC', )) as lca_factorized:
+            np.testing.assert_allclose(_solve_transposed(lca_factorized, rhs), expected)
+        assert lca_factorized not in _TRANSPOSED_SOLVERS
+
+        with LCAPool(dense_max_products=1000).checkout(demand=demand, method=('IPCC', )) as lca_dense:
+            assert lca_dense.dense
+            np.testing.assert_allclose(_solve_transposed(lca_dense, rhs), expected)
+        assert lca_dense not in _TRANSPOSED_SOLVERS
+
+        # not factorized (or factorized by `pypardiso`)
+        np.testing.assert_allclose(_solve_transposed(lca, rhs), expected)
+        factorization = _TRANSPOSED_SOLVERS[lca][1]
+        np.testing.assert_allclose(_solve_transposed(lca, rhs), expected)
+        assert _TRANSPOSED_SOLVERS[lca][1] is factorization
+
+    def test_wide_dataframe(self) -> None:
+        """
+        Tests that the DataFrame of a multi-method traversal has one set of burden columns per method.
+        """
+        example_system_bike_production()
+        df = perform_graph_traversal(
+            demand={bd.get_node(code='bike'): 1},
+            method=[('IPCC', )],
+            cutoff=0.001,
+            biosphere_cutoff=0.001,
+            max_calc=100,
+            return_format='dataframe',
+        )
+        assert list(df.columns) == [
+            'UID',
+            'Scope',
+            'Name',
+            'SupplyAmount',
+            'BurdenIntensity[IPCC]',
+            'Burden(Cumulative)[IPCC]',
+            'Burden(Direct)[IPCC]',
+            'Depth',
+            'Branch',
+        ]
+
+    def test_list_of_methods_with_lca(self) -> None:
+        """
+        Tests that a list of methods cannot be combined with an `lca` object.
+        """
+        example_system_bike_production()
+        lca = perform_lca(demand={bd.get_node(code='bike'): 1}, method=('IPCC', ))
+        with pytest.raises(ValueError):
+            perform_graph_traversal(
+                lca=lca,
+                method=[('IPCC', )],
+                cutoff=0.001,
+                biosphere_cutoff=0.001,
+                max_calc=100,
+                return_format='dataframe',
+            )